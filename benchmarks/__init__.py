@@ -0,0 +1,13 @@
+"""
+Benchmarks do Brawl Stars Clone.
+Cenários fixos (arena vazia, inimigos atirando, muitos projéteis, tempestade,
+explosões, seleção de personagem e cadeia de shaders) rodados sem janela,
+com tempos de update/render e alocações por quadro comparados com uma
+baseline salva, e rampas de estresse que aumentam a quantidade de cada tipo
+de entidade até o quadro passar do orçamento.
+
+Uso:
+    python -m benchmarks.executar --salvar-baseline   # gravar a baseline desta máquina
+    python -m benchmarks.executar                     # comparar (código de saída 1 em regressão)
+    python -m benchmarks.estresse --orcamento-ms 33   # curvas de escala por subsistema
+"""
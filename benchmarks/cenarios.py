@@ -0,0 +1,235 @@
+"""
+Cenários de benchmark do Brawl Stars Clone.
+Cada cenário prepara um estado fixo do jogo (mesma semente em toda execução)
+e expõe atualizar(dt) e renderizar(), medidos separadamente pelo executor.
+Os cenários de partida repõem a carga a cada quadro (inimigos, projéteis,
+explosões) para que todos os quadros medidos tenham o mesmo volume de trabalho.
+"""
+
+import math
+import pygame
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Semente usada por todos os cenários de partida
+SEMENTE_BENCHMARK = 1234
+
+
+class Cenario:
+    """
+    Cenário de benchmark.
+    Attributes:
+        nome (str): Identificador usado na baseline
+        descricao (str): Texto curto mostrado no relatório
+        quadros_maximos (int): Limite de quadros medidos (None: o pedido na linha de comando)
+        lento (bool): Fica fora da execução padrão (só roda quando pedido por nome)
+    """
+
+    nome = ''
+    descricao = ''
+    quadros_maximos = None
+    lento = False
+
+    def preparar(self, contexto):
+        """
+        Montar o estado do cenário.
+        Args:
+            contexto: ContextoBenchmark com a tela e o jogo compartilhado
+        """
+
+    def atualizar(self, dt):
+        """Avançar a simulação um passo"""
+
+    def renderizar(self):
+        """Desenhar um quadro"""
+
+
+class CenarioPartida(Cenario):
+    """Cenário sobre uma partida do Game (reaproveitado entre cenários)"""
+
+    personagem = "Shelly"
+    manter_inimigos = False
+
+    def __init__(self):
+        self.game = None
+
+    def preparar(self, contexto):
+        self.game = contexto.obter_jogo()
+        self.game.iniciar_partida(self.personagem, semente=SEMENTE_BENCHMARK)
+        if not self.manter_inimigos:
+            self._remover_inimigos()
+        self.configurar(self.game)
+
+    def _remover_inimigos(self):
+        """Tirar os inimigos iniciais da arena"""
+        game = self.game
+        for inimigo in list(game.inimigos):
+            inimigo.kill()
+        game.lote_inimigos.limpar()
+
+    def configurar(self, game):
+        """Ajustes específicos do cenário (depois de iniciar a partida)"""
+
+    def manter(self, game):
+        """Repor a carga do cenário antes de cada passo"""
+
+    def atualizar(self, dt):
+        game = self.game
+        # O jogador não pode morrer (respawn mudaria a carga do quadro)
+        if game.jogador:
+            game.jogador.vida = game.jogador.vida_maxima
+        self.manter(game)
+        game.update(dt)
+
+    def renderizar(self):
+        self.game.render()
+
+
+class CenarioArenaVazia(CenarioPartida):
+    """Arena sem inimigos: custo fixo do mapa, arbustos, gemas e UI"""
+
+    nome = 'arena_vazia'
+    descricao = "Arena sem inimigos"
+
+
+class CenarioInimigosAtirando(CenarioPartida):
+    """Dez inimigos perseguindo e atirando no jogador"""
+
+    nome = 'inimigos_10'
+    descricao = "10 inimigos atirando"
+    manter_inimigos = True
+    quantidade = 10
+
+    def manter(self, game):
+        tentativas = 0
+        while len(game.inimigos) < self.quantidade and tentativas < self.quantidade:
+            game.criar_novo_inimigo()
+            tentativas += 1
+
+
+class CenarioTiros(CenarioPartida):
+    """Duzentos projéteis em voo, repostos conforme saem da tela"""
+
+    nome = 'tiros_200'
+    descricao = "200 projéteis"
+    quantidade = 200
+
+    def __init__(self):
+        super().__init__()
+        self.disparados = 0
+
+    def manter(self, game):
+        centro_x, centro_y = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
+        while len(game.tiros) < self.quantidade:
+            # Direções espalhadas em leque (ângulo áureo) a partir do centro
+            angulo = self.disparados * 2.399963
+            self.disparados += 1
+            game.criar_projetil_otimizado(centro_x, centro_y, math.cos(angulo), math.sin(angulo),
+                                          de_inimigo=bool(self.disparados % 2))
+
+
+class CenarioTempestade(CenarioPartida):
+    """Clima de tempestade com partículas de chuva e relâmpagos"""
+
+    nome = 'tempestade'
+    descricao = "Clima de tempestade"
+
+    def configurar(self, game):
+        game.gerenciador_ambiente.forcar_clima('tempestade')
+
+    def manter(self, game):
+        # Impedir a troca de clima aleatória durante a medição
+        game.gerenciador_ambiente.tempo_mudanca_clima = 0.0
+
+
+class CenarioExplosoes(CenarioPartida):
+    """Cinquenta explosões ativas ao mesmo tempo"""
+
+    nome = 'explosoes_50'
+    descricao = "50 explosões"
+    quantidade = 50
+
+    def __init__(self):
+        super().__init__()
+        self.criadas = 0
+
+    def manter(self, game):
+        # pylint: disable=import-outside-toplevel
+        from src.efeitos_visuais import gerenciador_efeitos, EfeitoExplosao
+        grupo = gerenciador_efeitos.grupo_efeitos
+        while len(grupo) < self.quantidade:
+            x = 100 + (self.criadas * 137) % (SCREEN_WIDTH - 200)
+            y = 100 + (self.criadas * 89) % (SCREEN_HEIGHT - 200)
+            self.criadas += 1
+            grupo.add(EfeitoExplosao(x, y))
+
+
+class CenarioSelecaoPersonagem(Cenario):
+    """Tela de seleção de personagem"""
+
+    nome = 'selecao_personagem'
+    descricao = "Seleção de personagem"
+
+    def __init__(self):
+        self.seletor = None
+
+    def preparar(self, contexto):
+        from src.characters.seletor_personagem import SeletorPersonagem  # pylint: disable=import-outside-toplevel
+        self.seletor = SeletorPersonagem(contexto.screen)
+
+    def atualizar(self, dt):
+        self.seletor.update(dt)
+
+    def renderizar(self):
+        self.seletor.render()
+
+
+class CenarioCadeiaShaders(Cenario):
+    """
+    Todos os shaders aplicados a um quadro 720p.
+    Os shaders processam pixel a pixel em Python e levam minutos por quadro
+    nessa resolução, então o cenário mede um único quadro e só roda quando
+    pedido (--cenarios shaders_720p).
+    """
+
+    nome = 'shaders_720p'
+    descricao = "Cadeia de shaders em 1280x720"
+    quadros_maximos = 1
+    lento = True
+
+    def __init__(self):
+        self.processador = None
+        self.quadro = None
+        self.tempo = 0.0
+
+    def preparar(self, contexto):
+        # pylint: disable=import-outside-toplevel
+        from src.shader_system import processador_shaders, TipoShader
+        self.processador = processador_shaders
+        for tipo in TipoShader:
+            self.processador.ativar_shader(tipo)
+
+        # Quadro com conteúdo variado (gradiente e formas) para os shaders terem o que realçar
+        self.quadro = pygame.Surface((1280, 720))
+        for y in range(0, 720, 8):
+            self.quadro.fill((40 + y // 6, 90, 160 - y // 8), (0, y, 1280, 8))
+        for indice in range(40):
+            pygame.draw.circle(self.quadro, (255, 220 - indice * 4, 60),
+                               (60 + indice * 30, 200 + (indice * 53) % 400), 12 + indice % 9)
+
+    def atualizar(self, dt):
+        self.tempo += dt
+
+    def renderizar(self):
+        self.processador.processar_frame(self.quadro, tempo=self.tempo)
+
+
+# Cenários na ordem do relatório
+CENARIOS = (
+    CenarioArenaVazia,
+    CenarioInimigosAtirando,
+    CenarioTiros,
+    CenarioTempestade,
+    CenarioExplosoes,
+    CenarioSelecaoPersonagem,
+    CenarioCadeiaShaders,
+)
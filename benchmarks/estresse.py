@@ -0,0 +1,369 @@
+"""
+Gerador de cenários de estresse do Brawl Stars Clone.
+Aumenta em degraus a quantidade de um tipo de entidade (inimigos, projéteis,
+gemas, arbustos ou partículas) numa partida sem janela e mede update e
+render em cada degrau, até o tempo do quadro passar do orçamento. O
+resultado é uma curva de escala por subsistema, com a etapa do perfilador
+que mais cresceu e o expoente de crescimento (1 = linear, 2 = quadrático).
+
+Com --expoente-maximo todos os degraus são medidos (o estouro do orçamento
+só é anotado) e o processo termina com código 1 se alguma curva crescer mais
+rápido que o permitido, o que pega regressões O(n²), ou se não houver
+degraus suficientes acima do ruído para estimar o expoente.
+
+Uso:
+    python -m benchmarks.estresse [--cargas inimigos tiros] [--degraus 0 10 50 100 500]
+                                  [--orcamento-ms 16.7] [--expoente-maximo 1.5] [--saida curvas.json]
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+
+import numpy as np
+import pygame
+from benchmarks.executar import ContextoBenchmark
+from benchmarks.cenarios import SEMENTE_BENCHMARK
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TAXA_SIMULACAO
+from src.perfilador import perfilador_quadro, ETAPAS_PERFIL
+
+# Degraus padrão de quantidade de entidades
+DEGRAUS_PADRAO = (0, 10, 25, 50, 100, 200, 500)
+
+# Piso absoluto (ms) do ruído no ajuste do expoente
+AUMENTO_MINIMO_EXPOENTE_MS = 0.05
+
+# Fração do quadro do degrau 0 tratada como ruído (jitter de render, agendador)
+FRACAO_RUIDO_EXPOENTE = 0.05
+
+# Degraus acima do ruído necessários para ajustar o expoente
+MINIMO_DEGRAUS_EXPOENTE = 3
+
+
+def _posicoes_grade(quantidade, raio_livre=150):
+    """
+    Posições determinísticas espalhadas pelo mapa, longe do centro (jogador).
+    Args:
+        quantidade: Número de posições
+        raio_livre: Raio ao redor do centro que fica vazio
+    Returns:
+        Lista de tuplas (x, y)
+    """
+    centro_x, centro_y = SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2
+    posicoes = []
+    indice = 0
+    while len(posicoes) < quantidade:
+        # Sequência de Halton (bases 2 e 3): cobertura uniforme sem sorteio
+        x = 40 + _halton(indice + 1, 2) * (SCREEN_WIDTH - 80)
+        y = 40 + _halton(indice + 1, 3) * (SCREEN_HEIGHT - 80)
+        indice += 1
+        if math.hypot(x - centro_x, y - centro_y) > raio_livre:
+            posicoes.append((x, y))
+    return posicoes
+
+
+def _halton(indice, base):
+    """Elemento da sequência de Halton"""
+    resultado, fracao = 0.0, 1.0
+    while indice > 0:
+        fracao /= base
+        resultado += fracao * (indice % base)
+        indice //= base
+    return resultado
+
+
+class CargaEstresse:
+    """
+    Tipo de entidade cuja quantidade é aumentada em degraus.
+    Attributes:
+        nome (str): Identificador da carga
+    """
+
+    nome = ''
+
+    def aplicar(self, game, quantidade):
+        """Colocar a quantidade inicial de entidades na partida"""
+        self.manter(game, quantidade)
+
+    def manter(self, game, quantidade):
+        """Repor as entidades que saíram antes de cada passo"""
+
+
+class CargaInimigos(CargaEstresse):
+    """Inimigos de todos os Brawlers, parados em posições fixas até se moverem"""
+
+    nome = 'inimigos'
+
+    def manter(self, game, quantidade):
+        if len(game.inimigos) >= quantidade:
+            return
+        # pylint: disable=import-outside-toplevel
+        from src.enemy import Enemy
+        from src.characters.personagens import listar_personagens
+        personagens = listar_personagens()
+        for indice, (x, y) in enumerate(_posicoes_grade(quantidade)[len(game.inimigos):]):
+            inimigo = Enemy(x, y, game.jogador, game.velocidade_inimigos_atual,
+                            game.multiplicador_tiro_atual,
+                            personagem_forcado=personagens[indice % len(personagens)])
+            game.adicionar_inimigo(inimigo)
+
+
+class CargaTiros(CargaEstresse):
+    """Projéteis saindo do centro em todas as direções"""
+
+    nome = 'tiros'
+
+    def __init__(self):
+        self.disparados = 0
+
+    def manter(self, game, quantidade):
+        while len(game.tiros) < quantidade:
+            angulo = self.disparados * 2.399963
+            self.disparados += 1
+            game.criar_projetil_otimizado(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                                          math.cos(angulo), math.sin(angulo),
+                                          de_inimigo=bool(self.disparados % 2))
+
+
+class CargaGemas(CargaEstresse):
+    """Gemas espalhadas pelo mapa (longe do jogador, que fica parado)"""
+
+    nome = 'gemas'
+
+    def aplicar(self, game, quantidade):
+        from src.gem_system import Gema  # pylint: disable=import-outside-toplevel
+        game.gerenciador_gemas.gemas.extend(Gema(x, y) for x, y in _posicoes_grade(quantidade))
+
+
+class CargaArbustos(CargaEstresse):
+    """Arbustos adicionais (a grade de cobertura é reconstruída uma vez)"""
+
+    nome = 'arbustos'
+
+    def aplicar(self, game, quantidade):
+        from src.bushes import Arbusto  # pylint: disable=import-outside-toplevel
+        game.gerenciador_arbustos.adicionar_arbustos(
+            Arbusto(int(x), int(y), 70, 70) for x, y in _posicoes_grade(quantidade, raio_livre=0))
+
+
+class CargaParticulas(CargaEstresse):
+    """Partículas 3D de vida longa, repostas conforme expiram"""
+
+    nome = 'particulas'
+
+    def manter(self, game, quantidade):
+        # pylint: disable=import-outside-toplevel
+        from src.particulas_3d import sistema_particulas_3d, Particula3D
+        particulas = sistema_particulas_3d.particulas
+        tipos = ("sparkle", "debris", "energy", "normal")
+        while len(particulas) < quantidade:
+            indice = len(particulas)
+            angulo = indice * 2.399963
+            particulas.append(Particula3D(
+                SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, math.cos(angulo) * 80, math.sin(angulo) * 80,
+                (255, 200, 80), 5, 3.0, tipos[indice % len(tipos)]
+            ))
+
+
+# Cargas disponíveis na ordem do relatório
+CARGAS = (CargaInimigos, CargaTiros, CargaGemas, CargaArbustos, CargaParticulas)
+
+
+def medir_degrau(game, carga, quantidade, quadros, aquecimento, passo=1.0 / TAXA_SIMULACAO):
+    """
+    Medir uma partida com a quantidade pedida de entidades da carga.
+    Returns:
+        Dicionário com update/render/total em ms (medianas), o ruído do total
+        (p95 - p50 entre os quadros) e ms por etapa do perfilador
+    """
+    # pylint: disable=import-outside-toplevel
+    from src.particulas_3d import sistema_particulas_3d
+    from src.efeitos_visuais import gerenciador_efeitos
+
+    game.iniciar_partida("Shelly", semente=SEMENTE_BENCHMARK)
+    for inimigo in list(game.inimigos):
+        inimigo.kill()
+    game.lote_inimigos.limpar()
+    # Efeitos que sobraram da rampa anterior não entram na medição
+    sistema_particulas_3d.limpar()
+    gerenciador_efeitos.grupo_efeitos.empty()
+    game.feedback_combate.limpar_efeitos()
+    carga.aplicar(game, quantidade)
+
+    tempos = np.zeros((quadros, 2), dtype=np.float64)
+    for quadro in range(-aquecimento, quadros):
+        if quadro == 0:
+            perfilador_quadro.ativar(False)
+            perfilador_quadro.ativar(True)
+        perfilador_quadro.iniciar_quadro()
+        # O jogador não pode morrer (respawn mudaria a carga)
+        game.jogador.vida = game.jogador.vida_maxima
+        carga.manter(game, quantidade)
+        inicio = time.perf_counter()
+        game.update(passo)
+        meio = time.perf_counter()
+        game.render()
+        if quadro >= 0:
+            tempos[quadro] = (meio - inicio, time.perf_counter() - meio)
+        perfilador_quadro.fechar_quadro()
+
+    tempos *= 1000.0
+    update_ms = float(np.median(tempos[:, 0]))
+    render_ms = float(np.median(tempos[:, 1]))
+    p50_total, p95_total = np.percentile(tempos.sum(axis=1), (50, 95))
+    etapas = np.median(perfilador_quadro.quadros_recentes(quadros)[:, :-1], axis=0) * 1000.0
+    return {
+        'quantidade': quantidade,
+        'update_ms': round(update_ms, 3),
+        'render_ms': round(render_ms, 3),
+        'total_ms': round(update_ms + render_ms, 3),
+        'ruido_ms': round(float(p95_total - p50_total), 3),
+        'etapas_ms': {nome: round(float(valor), 3) for nome, valor in zip(ETAPAS_PERFIL, etapas)},
+    }
+
+
+def limiar_ruido(curva):
+    """
+    Aumento de custo abaixo do qual um degrau é tratado como ruído.
+    O limiar vem do degrau de referência: a dispersão dos seus quadros
+    (p95 - p50) ou uma fração do seu tempo de quadro, o que for maior.
+    Args:
+        curva: Lista de degraus medidos
+    Returns:
+        Limiar em ms
+    """
+    if not curva or curva[0]['quantidade'] != 0:
+        return AUMENTO_MINIMO_EXPOENTE_MS
+    referencia = curva[0]
+    return max(AUMENTO_MINIMO_EXPOENTE_MS, referencia.get('ruido_ms', 0.0),
+               FRACAO_RUIDO_EXPOENTE * referencia['total_ms'])
+
+
+def estimar_expoente(curva):
+    """
+    Estimar o expoente de crescimento do custo adicional (custo ~ n^k).
+    Args:
+        curva: Lista de degraus medidos (o primeiro com quantidade 0 é a referência)
+    Returns:
+        Expoente k, ou None se menos de MINIMO_DEGRAUS_EXPOENTE degraus ficam acima do ruído
+    """
+    referencia = curva[0]['total_ms'] if curva and curva[0]['quantidade'] == 0 else 0.0
+    limiar = limiar_ruido(curva)
+    pontos = [(degrau['quantidade'], degrau['total_ms'] - referencia) for degrau in curva
+              if degrau['quantidade'] > 0 and degrau['total_ms'] - referencia > limiar]
+    if len(pontos) < MINIMO_DEGRAUS_EXPOENTE:
+        return None
+    quantidades, custos = zip(*pontos)
+    return float(np.polyfit(np.log(quantidades), np.log(custos), 1)[0])
+
+
+def etapa_que_mais_cresceu(curva):
+    """Etapa do perfilador com maior aumento entre o primeiro e o último degrau"""
+    if len(curva) < 2:
+        return None
+    inicio, fim = curva[0]['etapas_ms'], curva[-1]['etapas_ms']
+    return max(ETAPAS_PERFIL, key=lambda nome: fim[nome] - inicio[nome])
+
+
+def rampa(game, carga, degraus, orcamento_ms, quadros, aquecimento, todos_degraus=False):
+    """
+    Subir os degraus de uma carga até passar do orçamento.
+    Args:
+        todos_degraus: Continuar depois do estouro (só o primeiro é registrado),
+            para que a curva do expoente exista mesmo se o degrau 0 já estoura
+    Returns:
+        Dicionário com a curva, o degrau que estourou o orçamento, o limiar de ruído,
+        o expoente e a etapa que mais cresceu
+    """
+    curva = []
+    estouro = None
+    for quantidade in degraus:
+        degrau = medir_degrau(game, carga, quantidade, quadros, aquecimento)
+        curva.append(degrau)
+        print(f"  {carga.nome:<11} {quantidade:>5}: update {degrau['update_ms']:8.2f} ms  "
+              f"render {degrau['render_ms']:8.2f} ms")
+        if degrau['total_ms'] > orcamento_ms and estouro is None:
+            estouro = quantidade
+            if not todos_degraus:
+                break
+    return {
+        'curva': curva,
+        'estouro_orcamento': estouro,
+        'ruido_ms': round(limiar_ruido(curva), 3),
+        'expoente': estimar_expoente(curva),
+        'etapa_que_mais_cresceu': etapa_que_mais_cresceu(curva),
+    }
+
+
+def formatar_resumo(resultados, orcamento_ms):
+    """Tabela com o limite de cada carga e a forma da curva"""
+    cabecalho = f"{'Carga':<11} {'Máx. no orçamento':>18} {'Estouro em':>11} {'Expoente':>9}  Etapa que mais cresceu"
+    linhas = [f"Orçamento por quadro: {orcamento_ms:.1f} ms", cabecalho, '-' * len(cabecalho)]
+    for nome, resultado in resultados.items():
+        dentro = [d['quantidade'] for d in resultado['curva'] if d['total_ms'] <= orcamento_ms]
+        maximo = str(max(dentro)) if dentro else '-'
+        estouro = resultado['estouro_orcamento']
+        expoente = resultado['expoente']
+        linhas.append(f"{nome:<11} {maximo:>18} {'-' if estouro is None else estouro:>11} "
+                      f"{'-' if expoente is None else f'{expoente:.2f}':>9}  "
+                      f"{resultado['etapa_que_mais_cresceu'] or '-'}")
+    return '\n'.join(linhas)
+
+
+def main(argumentos=None):
+    """Rodar as rampas e devolver o código de saída (1 se algum expoente passar do máximo ou faltar)"""
+    nomes_cargas = [carga.nome for carga in CARGAS]
+    parser = argparse.ArgumentParser(description="Rampas de estresse por subsistema")
+    parser.add_argument('--cargas', nargs='+', choices=nomes_cargas, default=None,
+                        help="Cargas a testar (padrão: todas)")
+    parser.add_argument('--degraus', nargs='+', type=int, default=list(DEGRAUS_PADRAO),
+                        help="Quantidades de entidades em ordem crescente")
+    parser.add_argument('--orcamento-ms', type=float, default=1000.0 / FPS,
+                        help="Tempo por quadro (update + render) que encerra a rampa")
+    parser.add_argument('--quadros', type=int, default=30, help="Quadros medidos por degrau")
+    parser.add_argument('--aquecimento', type=int, default=5, help="Quadros descartados por degrau")
+    parser.add_argument('--expoente-maximo', type=float, default=None,
+                        help="Falhar se alguma curva crescer mais rápido que n^k (ou não tiver expoente)")
+    parser.add_argument('--saida', default=None, help="Gravar as curvas em JSON")
+    args = parser.parse_args(argumentos)
+
+    pygame.init()  # pylint: disable=no-member
+    contexto = ContextoBenchmark(pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT)))
+    game = contexto.obter_jogo()
+
+    degraus = sorted(set(args.degraus))
+    resultados = {}
+    for classe in CARGAS:
+        if args.cargas and classe.nome not in args.cargas:
+            continue
+        resultados[classe.nome] = rampa(game, classe(), degraus, args.orcamento_ms,
+                                        args.quadros, args.aquecimento,
+                                        todos_degraus=args.expoente_maximo is not None)
+    perfilador_quadro.ativar(False)
+
+    print()
+    print(formatar_resumo(resultados, args.orcamento_ms))
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump({'orcamento_ms': args.orcamento_ms, 'cargas': resultados}, f, indent=2, ensure_ascii=False)
+
+    if args.expoente_maximo is None:
+        return 0
+    falhas = 0
+    for nome, resultado in resultados.items():
+        expoente = resultado['expoente']
+        if expoente is None:
+            # Sem curva não há o que verificar: o portão não pode passar em silêncio
+            print(f"{nome}: sem expoente (menos de {MINIMO_DEGRAUS_EXPOENTE} degraus acima do "
+                  f"ruído de {resultado['ruido_ms']:.2f} ms); use degraus maiores")
+            falhas += 1
+        elif expoente > args.expoente_maximo:
+            print(f"{nome}: expoente {expoente:.2f} acima de {args.expoente_maximo:.2f}")
+            falhas += 1
+    return 1 if falhas else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
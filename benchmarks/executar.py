@@ -0,0 +1,250 @@
+"""
+Executor dos benchmarks do Brawl Stars Clone.
+Roda cada cenário sem janela (drivers dummy do SDL, com renderização
+ligada), mede update e render de cada quadro e conta as construções de
+Surface/Font (src.alocacoes). O resultado é comparado com a baseline:
+qualquer métrica acima da baseline mais a tolerância é uma regressão e o
+processo termina com código 1.
+
+A baseline depende da máquina; grave uma com --salvar-baseline antes da
+mudança e compare depois dela.
+
+Uso:
+    python -m benchmarks.executar [--cenarios tiros_200 explosoes_50] [--quadros 120]
+                                  [--baseline benchmarks/baseline.json] [--salvar-baseline]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+# Sem janela, mas com renderização (o modo headless do jogo desligaria o render)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# pylint: disable=wrong-import-position
+import numpy as np
+import pygame
+from src.alocacoes import rastreador_alocacoes
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, TAXA_SIMULACAO
+from benchmarks.cenarios import CENARIOS
+
+# Baseline padrão (gerada na própria máquina com --salvar-baseline)
+ARQUIVO_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Tolerâncias padrão: fração relativa e folga absoluta por tipo de métrica
+TOLERANCIAS_PADRAO = {
+    'tempo': {'relativa': 0.25, 'absoluta': 0.2},  # ms
+    'alocacoes': {'relativa': 0.10, 'absoluta': 0.5},  # alocações por quadro
+}
+
+# Métricas comparadas com a baseline e o tipo de tolerância de cada uma
+METRICAS_COMPARADAS = {
+    'update_ms': 'tempo',
+    'render_ms': 'tempo',
+    'alocacoes_por_quadro': 'alocacoes',
+}
+
+
+class ContextoBenchmark:
+    """
+    Recursos compartilhados entre os cenários.
+    Attributes:
+        screen (pygame.Surface): Tela (driver dummy)
+    """
+
+    def __init__(self, screen):
+        self.screen = screen
+        self._jogo = None
+
+    def obter_jogo(self):
+        """Criar (uma vez) o Game usado pelos cenários de partida"""
+        if self._jogo is None:
+            from src.game import Game  # pylint: disable=import-outside-toplevel
+            self._jogo = Game(self.screen)
+            # Orçamento da IA por relógio real deixaria o trabalho por quadro variável
+            self._jogo.escalonador_ia.orcamento_ms = None
+        return self._jogo
+
+
+def executar_cenario(cenario, contexto, quadros, aquecimento, passo=1.0 / TAXA_SIMULACAO):
+    """
+    Medir um cenário.
+    Args:
+        cenario: Instância de Cenario
+        contexto: ContextoBenchmark
+        quadros: Quadros medidos
+        aquecimento: Quadros descartados antes da medição (caches, primeiro desenho)
+        passo: dt de cada atualização
+    Returns:
+        Dicionário de métricas (tempos em ms por quadro)
+    """
+    if cenario.quadros_maximos is not None:
+        quadros = min(quadros, cenario.quadros_maximos)
+        aquecimento = 0
+    cenario.preparar(contexto)
+    for _ in range(aquecimento):
+        cenario.atualizar(passo)
+        cenario.renderizar()
+
+    tempos = np.zeros((quadros, 2), dtype=np.float64)
+    rastreador_alocacoes.reiniciar()
+    for quadro in range(quadros):
+        inicio = time.perf_counter()
+        cenario.atualizar(passo)
+        meio = time.perf_counter()
+        cenario.renderizar()
+        tempos[quadro] = (meio - inicio, time.perf_counter() - meio)
+        rastreador_alocacoes.fechar_quadro()
+
+    tempos *= 1000.0
+    alocacoes, kb = rastreador_alocacoes.alocacoes_por_quadro()
+    piores = rastreador_alocacoes.piores_locais(1)
+    return {
+        'update_ms': round(float(np.median(tempos[:, 0])), 3),
+        'update_ms_p95': round(float(np.percentile(tempos[:, 0], 95)), 3),
+        'render_ms': round(float(np.median(tempos[:, 1])), 3),
+        'render_ms_p95': round(float(np.percentile(tempos[:, 1], 95)), 3),
+        'alocacoes_por_quadro': round(alocacoes, 2),
+        'kb_por_quadro': round(kb, 1),
+        'maior_alocador': rastreador_alocacoes.descrever_local(piores[0][0]) if piores else None,
+    }
+
+
+def comparar_com_baseline(resultados, baseline, tolerancias):
+    """
+    Encontrar as métricas que pioraram além da tolerância.
+    Args:
+        resultados: Dicionário cenário -> métricas atuais
+        baseline: Dicionário cenário -> métricas da baseline
+        tolerancias: Dicionário tipo de métrica -> {'relativa', 'absoluta'}
+    Returns:
+        Lista de (cenário, métrica, valor da baseline, valor atual, limite)
+    """
+    regressoes = []
+    for nome, metricas in resultados.items():
+        referencia = baseline.get(nome)
+        if not referencia:
+            continue
+        for metrica, tipo in METRICAS_COMPARADAS.items():
+            if metrica not in referencia:
+                continue
+            tolerancia = tolerancias[tipo]
+            limite = referencia[metrica] * (1.0 + tolerancia['relativa']) + tolerancia['absoluta']
+            if metricas[metrica] > limite:
+                regressoes.append((nome, metrica, referencia[metrica], metricas[metrica], limite))
+    return regressoes
+
+
+def formatar_relatorio(resultados, baseline):
+    """Tabela com os valores atuais e a variação em relação à baseline"""
+    def variacao(nome, metrica):
+        referencia = baseline.get(nome, {}).get(metrica)
+        if not referencia:
+            return ''
+        return f"({(resultados[nome][metrica] / referencia - 1.0):+.0%})"
+
+    cabecalho = (f"{'Cenário':<20} {'Update ms':>10} {'':>7} {'p95':>7} {'Render ms':>10} {'':>7} "
+                 f"{'p95':>7} {'Aloc/q':>8} {'':>7} {'KB/q':>8}")
+    linhas = [cabecalho, '-' * len(cabecalho)]
+    for nome, m in resultados.items():
+        linhas.append(
+            f"{nome:<20} {m['update_ms']:>10.3f} {variacao(nome, 'update_ms'):>7} {m['update_ms_p95']:>7.2f} "
+            f"{m['render_ms']:>10.3f} {variacao(nome, 'render_ms'):>7} {m['render_ms_p95']:>7.2f} "
+            f"{m['alocacoes_por_quadro']:>8.1f} {variacao(nome, 'alocacoes_por_quadro'):>7} "
+            f"{m['kb_por_quadro']:>8.1f}"
+        )
+    return '\n'.join(linhas)
+
+
+def carregar_baseline(caminho):
+    """Ler a baseline (None se ainda não existe)"""
+    if not os.path.exists(caminho):
+        return None
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def salvar_baseline(caminho, resultados, tolerancias):
+    """Gravar os resultados atuais como baseline, com a identificação da máquina"""
+    dados = {
+        'maquina': {
+            'plataforma': platform.platform(),
+            'processador': platform.processor() or platform.machine(),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+        },
+        'tolerancias': tolerancias,
+        'cenarios': resultados,
+    }
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(dados, f, indent=2, ensure_ascii=False)
+
+
+def main(argumentos=None):
+    """Rodar os benchmarks e devolver o código de saída (1 em regressão)"""
+    nomes_cenarios = [cenario.nome for cenario in CENARIOS]
+    parser = argparse.ArgumentParser(description="Benchmarks sem janela com baseline e detecção de regressão")
+    parser.add_argument('--cenarios', nargs='+', choices=nomes_cenarios, default=None,
+                        help="Cenários a rodar (padrão: todos os que não são lentos)")
+    parser.add_argument('--quadros', type=int, default=120, help="Quadros medidos por cenário")
+    parser.add_argument('--aquecimento', type=int, default=20, help="Quadros descartados antes da medição")
+    parser.add_argument('--baseline', default=ARQUIVO_BASELINE, help="Arquivo JSON da baseline")
+    parser.add_argument('--salvar-baseline', action='store_true', help="Gravar os resultados como nova baseline")
+    parser.add_argument('--tolerancia', type=float, default=None,
+                        help="Tolerância relativa de tempo (substitui a da baseline)")
+    parser.add_argument('--saida', default=None, help="Gravar os resultados desta execução em JSON")
+    args = parser.parse_args(argumentos)
+
+    rastreador_alocacoes.instalar()
+    pygame.init()  # pylint: disable=no-member
+    contexto = ContextoBenchmark(pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT)))
+
+    resultados = {}
+    for classe in CENARIOS:
+        if args.cenarios is None and classe.lento:
+            continue
+        if args.cenarios and classe.nome not in args.cenarios:
+            continue
+        print(f"Rodando {classe.nome}: {classe.descricao}...")
+        resultados[classe.nome] = executar_cenario(classe(), contexto, args.quadros, args.aquecimento)
+    # Os números já estão nos resultados (sem o log de alocações ao sair)
+    rastreador_alocacoes.desinstalar()
+
+    dados_baseline = carregar_baseline(args.baseline)
+    baseline = dados_baseline['cenarios'] if dados_baseline else {}
+    tolerancias = json.loads(json.dumps(dados_baseline.get('tolerancias', TOLERANCIAS_PADRAO)
+                                        if dados_baseline else TOLERANCIAS_PADRAO))
+    if args.tolerancia is not None:
+        tolerancias['tempo']['relativa'] = args.tolerancia
+
+    print()
+    print(formatar_relatorio(resultados, baseline))
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump(resultados, f, indent=2, ensure_ascii=False)
+
+    if args.salvar_baseline:
+        # Uma execução parcial atualiza só os cenários rodados
+        salvar_baseline(args.baseline, {**baseline, **resultados}, tolerancias)
+        print(f"\nBaseline salva em {args.baseline}")
+        return 0
+    if dados_baseline is None:
+        print(f"\nSem baseline em {args.baseline}: rode com --salvar-baseline para criar uma")
+        return 0
+
+    regressoes = comparar_com_baseline(resultados, baseline, tolerancias)
+    if not regressoes:
+        print("\nSem regressões em relação à baseline")
+        return 0
+    print(f"\n{len(regressoes)} regressão(ões):")
+    for nome, metrica, referencia, atual, limite in regressoes:
+        print(f"  {nome} {metrica}: {atual:.3f} (baseline {referencia:.3f}, limite {limite:.3f})")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
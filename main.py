@@ -6,21 +6,84 @@ Responsável por gerenciar estados e controlar o fluxo geral da aplicação.
 """
 
 import sys
-import pygame
-from src.gerenciador_estados import GerenciadorEstados
-from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TITLE
+from src.inicializacao import relogio_importacao, relatorio_inicializacao
+
+# Medir as importações do jogo desde o início (relatório com F8 ou --importacoes)
+relogio_importacao.instalar()
+
+from src.headless import ativar_modo_headless, modo_headless_ativo  # pylint: disable=wrong-import-position
+from src.replay import ativar_gravacao  # pylint: disable=wrong-import-position
+from src.alocacoes import ativar_alocacoes, alocacoes_ativas, rastreador_alocacoes  # pylint: disable=wrong-import-position
+
+# O modo headless precisa ser ativado antes de importar os módulos do jogo
+if '--headless' in sys.argv:
+    ativar_modo_headless()
+# Gravar as partidas para reprodução determinística (python -m src.replay)
+if '--gravar' in sys.argv:
+    ativar_gravacao()
+# Contar construções de Surface/Font por local de chamada (overlay e log ao sair)
+if '--alocacoes' in sys.argv:
+    ativar_alocacoes()
+if alocacoes_ativas():
+    rastreador_alocacoes.instalar()
+
+import pygame  # pylint: disable=wrong-import-position,wrong-import-order
+from src.gerenciador_estados import GerenciadorEstados  # pylint: disable=wrong-import-position
+from src.passo_fixo import AcumuladorPassoFixo  # pylint: disable=wrong-import-position
+from src.perfilador import perfilador_quadro  # pylint: disable=wrong-import-position
+from src.rastreamento import rastreador_eventos  # pylint: disable=wrong-import-position
+from src.ritmo_quadros import monitor_ritmo  # pylint: disable=wrong-import-position
+from src.audio_manager import gerenciador_audio  # pylint: disable=wrong-import-position
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TITLE, DURACAO_RASTREAMENTO  # pylint: disable=wrong-import-position
 # Importar constantes do pygame
-from src.pygame_constants import QUIT, KEYDOWN, K_F12, SRCALPHA
+from src.pygame_constants import QUIT, KEYDOWN, K_F7, K_F8, K_F9, K_F12, SRCALPHA  # pylint: disable=wrong-import-position
+
+
+def duracao_rastreamento_argumento():
+    """
+    Ler a flag --rastrear[=segundos] da linha de comando.
+    Returns:
+        Duração da janela de rastreamento, ou None sem a flag
+    """
+    for arg in sys.argv[1:]:
+        if arg == '--rastrear':
+            return DURACAO_RASTREAMENTO
+        if arg.startswith('--rastrear='):
+            return float(arg.split('=', 1)[1])
+    return None
+
+
+def main_headless():
+    """Rodar uma partida sem tela controlada pelo bot e imprimir o resultado"""
+    from src.simulacao_headless import executar_partida_headless  # pylint: disable=import-outside-toplevel
+
+    # Brawler opcional: python main.py --headless Colt
+    argumentos = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    nome_personagem = argumentos[0] if argumentos else "Shelly"
+    resultado = executar_partida_headless(nome_personagem)
+    for chave, valor in resultado.items():
+        print(f"{chave}: {valor}")
 
 
 def main():
     """Função principal do jogo"""
+    # Janela de rastreamento desde o início (Chrome trace_event)
+    duracao_rastreamento = duracao_rastreamento_argumento()
+    if duracao_rastreamento is not None:
+        rastreador_eventos.iniciar(duracao_rastreamento)
+
+    if modo_headless_ativo():
+        main_headless()
+        return
+
     pygame.init()  # pylint: disable=no-member
 
     # Configurar tela
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption(TITLE)
+    relogio_importacao.marcar('janela')
     clock = pygame.time.Clock()
+    primeiro_quadro = True
 
     # Sistema de FPS simples e confiável
     font_fps = pygame.font.Font(None, 24)
@@ -31,11 +94,19 @@ def main():
     # Inicializar gerenciador de estados
     gerenciador = GerenciadorEstados(screen)
 
+    # Simulação em passo fixo, desacoplada da taxa de renderização
+    acumulador = AcumuladorPassoFixo()
+
+    # Percentis de tempo de quadro por estado (resumo impresso ao sair)
+    monitor_ritmo.iniciar()
+
     # Loop principal
     running = True
     while running:
         dt = clock.tick(FPS) / 1000.0  # Delta time em segundos
         fps_timer += dt
+        monitor_ritmo.registrar_quadro(dt, gerenciador.estado_atual)
+        perfilador_quadro.iniciar_quadro()
         
         # Eventos
         for event in pygame.event.get():
@@ -43,17 +114,31 @@ def main():
                 running = False
             elif event.type == KEYDOWN and event.key == K_F12:  # Usar constante centralizada
                 show_fps = not show_fps
+            elif event.type == KEYDOWN and event.key == K_F7:  # Overlay do perfilador
+                perfilador_quadro.alternar_overlay()
+            elif event.type == KEYDOWN and event.key == K_F8:  # Exportar perfil para CSV
+                caminho = perfilador_quadro.exportar_csv()
+                if caminho:
+                    print(f"Perfil de quadros exportado para {caminho}")
+                caminho = perfilador_quadro.salvar_relatorio_inicializacao()
+                if caminho:
+                    print(f"Relatório de inicialização salvo em {caminho}")
+            elif event.type == KEYDOWN and event.key == K_F9:  # Janela de rastreamento
+                rastreador_eventos.alternar()
             else:
                 # Passar evento para o gerenciador
                 continuar = gerenciador.handle_event(event)
                 if not continuar:
                     running = False
 
-        # Atualizar
-        gerenciador.update(dt)
+        # Atualizar em passos fixos (quantos couberem no tempo real do quadro)
+        for _ in range(acumulador.avancar(dt)):
+            gerenciador.update(acumulador.passo)
+        # Sons pedidos no quadro: juntados e tocados de uma vez
+        gerenciador_audio.despachar_sons()
 
-        # Renderizar
-        gerenciador.render()
+        # Renderizar interpolando entre os dois últimos passos
+        gerenciador.render(acumulador.alpha)
         
         # Mostrar FPS simples
         if show_fps and fps_timer >= fps_display_interval:
@@ -66,7 +151,16 @@ def main():
             screen.blit(fps_bg, (SCREEN_WIDTH - 110, 10))
             screen.blit(fps_text, (SCREEN_WIDTH - 100, 15))
             fps_timer = 0
+        perfilador_quadro.desenhar(screen)
+        rastreador_alocacoes.desenhar(screen)
         pygame.display.flip()
+        if primeiro_quadro:
+            primeiro_quadro = False
+            relogio_importacao.marcar('primeiro_quadro')
+            if '--importacoes' in sys.argv:
+                print('\n'.join(relatorio_inicializacao()))
+        perfilador_quadro.fechar_quadro()
+        rastreador_alocacoes.fechar_quadro()
     pygame.quit()  # Não há constante para pygame.quit()
     sys.exit()
 
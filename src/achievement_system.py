@@ -2,22 +2,33 @@
 Sistema de Conquistas do Brawl Stars Clone.
 Este módulo implementa objetivos e recompensas que os jogadores podem desbloquear
 com base em ações realizadas durante o jogo.
+
+Cada conquista declara as estatísticas de que depende. O sistema guarda um
+índice estatística -> conquistas ainda bloqueadas, então uma mudança de
+estatística avalia só as conquistas afetadas; ao ser desbloqueada a
+conquista sai do índice. Os desbloqueios são salvos pela progressão
+(src.sistema_progressao).
 """
 
+from src.inicializacao import SingletonPreguicoso
+from src.sistema_progressao import sistema_progressao
+
 class Conquista:
     """Representa uma conquista no jogo."""
 
-    def __init__(self, nome, descricao, criterio):
+    def __init__(self, nome, descricao, criterio, estatisticas=()):
         """
         Inicializa uma nova conquista.
         Args:
             nome (str): Nome da conquista
             descricao (str): Descrição da conquista
             criterio (callable): Função que verifica se a conquista foi alcançada
+            estatisticas (tuple): Chaves do contexto lidas pelo critério (vazio: avaliada em toda verificação)
         """
         self.nome = nome
         self.descricao = descricao
         self.criterio = criterio
+        self.estatisticas = tuple(estatisticas)
         self.alcancada = False
 
     def verificar(self, contexto):
@@ -32,19 +43,121 @@ class Conquista:
         return False
 
 class SistemaConquistas:
-    """Gerencia todas as conquistas do jogo."""
+    """
+    Gerencia todas as conquistas do jogo.
+    Attributes:
+        conquistas (list): Todas as conquistas, na ordem de cadastro
+        estatisticas (dict): Valor atual de cada estatística informada
+        indice (dict): Estatística -> conquistas bloqueadas que dependem dela
+        sem_indice (list): Conquistas bloqueadas sem estatísticas declaradas
+    """
 
     def __init__(self):
         self.conquistas = []
+        self.estatisticas = {}
+        self.indice = {}
+        self.sem_indice = []
 
     def adicionar_conquista(self, conquista):
         """Adiciona uma nova conquista ao sistema."""
         self.conquistas.append(conquista)
+        if conquista.alcancada:
+            return
+        if not conquista.estatisticas:
+            self.sem_indice.append(conquista)
+        for chave in conquista.estatisticas:
+            self.indice.setdefault(chave, []).append(conquista)
+
+    def atualizar_estatistica(self, chave, valor):
+        """
+        Registra o novo valor de uma estatística e avalia só as conquistas que dependem dela.
+        Args:
+            chave: Nome da estatística ('gemas_coletadas', 'inimigos_derrotados', ...)
+            valor: Valor atual
+        Returns:
+            Lista das conquistas desbloqueadas agora
+        """
+        self.estatisticas[chave] = valor
+        dependentes = self.indice.get(chave)
+        if not dependentes:
+            return []
+        desbloqueadas = [conquista for conquista in dependentes
+                         if all(c in self.estatisticas for c in conquista.estatisticas)
+                         and conquista.verificar(self.estatisticas)]
+        for conquista in desbloqueadas:
+            self._remover_do_indice(conquista)
+        return desbloqueadas
 
     def verificar_conquistas(self, contexto):
-        """Verifica todas as conquistas com base no contexto atual."""
+        """Verifica as conquistas afetadas pelas estatísticas do contexto (e as sem estatísticas declaradas)."""
         desbloqueadas = []
-        for conquista in self.conquistas:
+        for chave, valor in contexto.items():
+            desbloqueadas.extend(self.atualizar_estatistica(chave, valor))
+        for conquista in list(self.sem_indice):
             if conquista.verificar(contexto):
+                self.sem_indice.remove(conquista)
                 desbloqueadas.append(conquista)
         return desbloqueadas
+
+    def restaurar_desbloqueadas(self, nomes):
+        """
+        Marca como alcançadas as conquistas salvas (elas saem do índice).
+        Args:
+            nomes: Nomes das conquistas já desbloqueadas
+        """
+        nomes = set(nomes)
+        for conquista in self.conquistas:
+            if conquista.nome in nomes and not conquista.alcancada:
+                conquista.alcancada = True
+                self._remover_do_indice(conquista)
+                if conquista in self.sem_indice:
+                    self.sem_indice.remove(conquista)
+
+    def _remover_do_indice(self, conquista):
+        """Tira uma conquista desbloqueada de todas as listas do índice"""
+        for chave in conquista.estatisticas:
+            dependentes = self.indice.get(chave)
+            if dependentes and conquista in dependentes:
+                dependentes.remove(conquista)
+                if not dependentes:
+                    del self.indice[chave]
+
+
+def _registrar_conquistas_padrao(sistema):
+    """Define as conquistas disponíveis no jogo."""
+    sistema.adicionar_conquista(
+        Conquista(
+            nome="Primeira Gema",
+            descricao="Colete sua primeira gema.",
+            criterio=lambda contexto: contexto['gemas_coletadas'] >= 1,
+            estatisticas=('gemas_coletadas',)
+        )
+    )
+    sistema.adicionar_conquista(
+        Conquista(
+            nome="Caçador de Inimigos",
+            descricao="Derrote 10 inimigos.",
+            criterio=lambda contexto: contexto['inimigos_derrotados'] >= 10,
+            estatisticas=('inimigos_derrotados',)
+        )
+    )
+    sistema.adicionar_conquista(
+        Conquista(
+            nome="Super Usada",
+            descricao="Use sua habilidade especial pela primeira vez.",
+            criterio=lambda contexto: contexto['super_usada'] >= 1,
+            estatisticas=('super_usada',)
+        )
+    )
+
+
+def _criar_sistema_conquistas():
+    """Cadastra as conquistas padrão e restaura os desbloqueios salvos na progressão"""
+    sistema = SistemaConquistas()
+    _registrar_conquistas_padrao(sistema)
+    sistema.restaurar_desbloqueadas(sistema_progressao.conquistas_desbloqueadas)
+    return sistema
+
+
+# Instância global (compartilhada pelo jogo e pelos menus; o save é lido no primeiro uso)
+sistema_conquistas = SingletonPreguicoso('sistema_conquistas', _criar_sistema_conquistas)
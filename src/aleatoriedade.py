@@ -0,0 +1,68 @@
+"""
+Serviço de números aleatórios do Brawl Stars Clone.
+Este módulo concentra toda a aleatoriedade do jogo em geradores semeados por
+partida, no lugar do módulo global random e de np.random. Com a mesma semente
+e as mesmas entradas a partida se repete exatamente, o que permite gravar e
+reproduzir partidas e comparar benchmarks sem ruído.
+
+Há dois fluxos independentes:
+- aleatorio_jogo: decisões que alteram o gameplay (spawns, IA, tipos de power-up)
+- aleatorio_visual: efeitos puramente visuais (partículas, tremores, texturas)
+Efeitos visuais podem ser criados em quantidades diferentes conforme a taxa de
+quadros, então ficam em um fluxo separado para não desviar o gameplay.
+"""
+
+import os
+import random
+import numpy as np
+
+
+class ServicoAleatorio:
+    """
+    Geradores aleatórios semeados a partir de uma única semente por partida.
+    Os objetos geradores são sempre os mesmos; reiniciar apenas os ressemeia,
+    então módulos podem guardar referências a eles.
+    Attributes:
+        semente (int): Semente da partida atual (None antes da primeira partida)
+        jogo (random.Random): Fluxo das decisões de gameplay
+        visual (random.Random): Fluxo dos efeitos visuais
+        numpy (np.random.Generator): Fluxo vetorizado do gameplay (lote de inimigos)
+    """
+
+    def __init__(self):
+        self.semente = None
+        self.jogo = random.Random()
+        self.visual = random.Random()
+        self.numpy = np.random.default_rng()
+
+    @staticmethod
+    def gerar_semente():
+        """Sortear uma semente nova (fora dos fluxos do jogo)"""
+        return int.from_bytes(os.urandom(4), 'little')
+
+    def reiniciar(self, semente=None):
+        """
+        Ressemear todos os fluxos para uma nova partida.
+        Args:
+            semente: Semente a usar (padrão: sorteada)
+        Returns:
+            Semente efetivamente usada, para ser gravada junto da partida
+        """
+        if semente is None:
+            semente = self.gerar_semente()
+        self.semente = int(semente)
+
+        # Sementes independentes derivadas da semente da partida
+        semente_jogo, semente_visual, semente_numpy = (
+            int(valor) for valor in np.random.SeedSequence(self.semente).generate_state(3)
+        )
+        self.jogo.seed(semente_jogo)
+        self.visual.seed(semente_visual)
+        self.numpy.bit_generator.state = np.random.PCG64(semente_numpy).state
+        return self.semente
+
+
+# Instância global do serviço e atalhos para os fluxos
+servico_aleatorio = ServicoAleatorio()
+aleatorio_jogo = servico_aleatorio.jogo
+aleatorio_visual = servico_aleatorio.visual
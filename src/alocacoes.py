@@ -0,0 +1,228 @@
+"""
+Rastreador de alocações de superfícies do Brawl Stars Clone.
+Este módulo, quando ativado, troca pygame.Surface e pygame.font.Font por
+subclasses que registram cada construção com o local de chamada (arquivo,
+linha e função). As alocações e os bytes são contados por local e por
+quadro; os piores locais aparecem em um overlay e vão para um log ao sair.
+
+Serve de guarda para que os caminhos que não deveriam alocar (desenho de
+sombras, buffer de tremor, overlays) continuem sem alocar a cada quadro.
+
+A instrumentação é opcional: flag --alocacoes (ou a variável de ambiente
+BRAWL_ALOCACOES). Desligado, nada é trocado e o custo é zero.
+"""
+
+import atexit
+import os
+import sys
+import time
+import pygame
+from src.config import PASTA_PERFIS
+from src.pygame_constants import SRCALPHA
+
+# Variável de ambiente que ativa o rastreamento de alocações
+VARIAVEL_AMBIENTE_ALOCACOES = 'BRAWL_ALOCACOES'
+
+# Locais mostrados no overlay / no log e intervalo entre redesenhos do overlay
+LOCAIS_OVERLAY_ALOCACOES = 8
+LOCAIS_LOG_ALOCACOES = 40
+QUADROS_ATUALIZACAO_OVERLAY_ALOCACOES = 30
+
+_RAIZ_PROJETO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def alocacoes_ativas():
+    """Verificar se o rastreamento de alocações foi pedido (variável de ambiente)"""
+    return os.environ.get(VARIAVEL_AMBIENTE_ALOCACOES, '').strip().lower() in ('1', 'true', 'sim', 'yes')
+
+
+def ativar_alocacoes():
+    """Pedir o rastreamento de alocações para o processo atual"""
+    os.environ[VARIAVEL_AMBIENTE_ALOCACOES] = '1'
+
+
+class RastreadorAlocacoes:
+    """
+    Contagem de construções de Surface/Font por local de chamada.
+    Attributes:
+        ativo (bool): Se as classes do pygame estão instrumentadas
+        quadro_atual (dict): Local -> [alocações, bytes] no quadro em andamento
+        totais (dict): Local -> [alocações, bytes, quadros com alocação]
+        quadros (int): Quadros fechados desde a ativação
+    """
+
+    def __init__(self):
+        self.ativo = False
+        self.quadro_atual = {}
+        self.totais = {}
+        self.quadros = 0
+        self.surface_original = pygame.Surface
+        self.font_original = pygame.font.Font
+
+        # Overlay em cache (desenhado com as classes originais, fora da contagem)
+        self.fonte = None
+        self.superficie_overlay = None
+        self.quadros_desde_overlay = 0
+
+    def instalar(self):
+        """Trocar pygame.Surface e pygame.font.Font pelas versões instrumentadas"""
+        if self.ativo:
+            return
+        rastreador = self
+        surface_original = self.surface_original
+        font_original = self.font_original
+
+        class SurfaceRastreada(surface_original):
+            """pygame.Surface que registra onde foi construída"""
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                rastreador.registrar('Surface', self.get_width() * self.get_height() * self.get_bytesize())
+
+        class FontRastreada(font_original):
+            """pygame.font.Font que registra onde foi construída"""
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                rastreador.registrar('Font', 0)
+
+        pygame.Surface = SurfaceRastreada
+        pygame.font.Font = FontRastreada
+        self.ativo = True
+
+    def desinstalar(self):
+        """Restaurar as classes originais do pygame"""
+        pygame.Surface = self.surface_original
+        pygame.font.Font = self.font_original
+        self.ativo = False
+
+    def reiniciar(self):
+        """Zerar as contagens (início de uma nova medição)"""
+        self.quadro_atual = {}
+        self.totais = {}
+        self.quadros = 0
+        self.superficie_overlay = None
+
+    def alocacoes_por_quadro(self):
+        """
+        Calcular a média de alocações desde a última reinicialização.
+        Returns:
+            Tupla (alocações por quadro, KB por quadro)
+        """
+        quadros = max(1, self.quadros)
+        alocacoes = sum(total[0] for total in self.totais.values())
+        tamanho_bytes = sum(total[1] for total in self.totais.values())
+        return alocacoes / quadros, tamanho_bytes / quadros / 1024.0
+
+    def registrar(self, tipo, tamanho_bytes):
+        """
+        Contar uma construção no quadro atual.
+        Args:
+            tipo: 'Surface' ou 'Font'
+            tamanho_bytes: Bytes de pixels alocados (0 para fontes)
+        """
+        # Quadro 0: registrar; 1: __init__ instrumentado; 2: local que construiu
+        quadro = sys._getframe(2)  # pylint: disable=protected-access
+        local = (tipo, os.path.relpath(quadro.f_code.co_filename, _RAIZ_PROJETO),
+                 quadro.f_lineno, quadro.f_code.co_name)
+        contagem = self.quadro_atual.get(local)
+        if contagem is None:
+            self.quadro_atual[local] = [1, tamanho_bytes]
+        else:
+            contagem[0] += 1
+            contagem[1] += tamanho_bytes
+
+    def fechar_quadro(self):
+        """Somar as alocações do quadro aos totais por local"""
+        if not self.ativo:
+            return
+        for local, (alocacoes, tamanho_bytes) in self.quadro_atual.items():
+            total = self.totais.get(local)
+            if total is None:
+                self.totais[local] = [alocacoes, tamanho_bytes, 1]
+            else:
+                total[0] += alocacoes
+                total[1] += tamanho_bytes
+                total[2] += 1
+        self.quadro_atual = {}
+        self.quadros += 1
+        self.quadros_desde_overlay += 1
+
+    def piores_locais(self, quantidade=LOCAIS_OVERLAY_ALOCACOES):
+        """
+        Listar os locais que mais alocam.
+        Args:
+            quantidade: Máximo de locais
+        Returns:
+            Lista de (local, alocações por quadro, KB por quadro, fração de quadros com alocação)
+        """
+        quadros = max(1, self.quadros)
+        ordenados = sorted(self.totais.items(), key=lambda item: (item[1][2], item[1][1]), reverse=True)
+        return [(local, alocacoes / quadros, tamanho_bytes / quadros / 1024.0, com_alocacao / quadros)
+                for local, (alocacoes, tamanho_bytes, com_alocacao) in ordenados[:quantidade]]
+
+    @staticmethod
+    def descrever_local(local):
+        """Texto curto de um local (tipo arquivo:linha função)"""
+        tipo, arquivo, linha, funcao = local
+        return f"{tipo} {arquivo}:{linha} {funcao}"
+
+    def desenhar(self, screen):
+        """Desenhar o overlay com os locais que mais alocam por quadro"""
+        if not self.ativo:
+            return
+        if self.superficie_overlay is None or \
+                self.quadros_desde_overlay >= QUADROS_ATUALIZACAO_OVERLAY_ALOCACOES:
+            self.superficie_overlay = self._criar_overlay()
+            self.quadros_desde_overlay = 0
+        screen.blit(self.superficie_overlay, (10, screen.get_height() - self.superficie_overlay.get_height() - 10))
+
+    def _criar_overlay(self):
+        """Montar a superfície do overlay (com as classes originais do pygame)"""
+        if self.fonte is None:
+            self.fonte = self.font_original(None, 18)
+        locais = self.piores_locais()
+        superficie = self.surface_original((520, 26 + max(1, len(locais)) * 14), SRCALPHA)
+        superficie.fill((0, 0, 0, 170))
+        titulo = self.fonte.render(f"Alocações por quadro ({self.quadros} quadros)", True, (255, 255, 255))
+        superficie.blit(titulo, (10, 6))
+        for linha, (local, por_quadro, kb_por_quadro, fracao) in enumerate(locais):
+            cor = (255, 120, 120) if fracao >= 0.5 else (220, 220, 220)
+            texto = self.fonte.render(f"{por_quadro:6.2f}x {kb_por_quadro:8.1f} KB {fracao:4.0%}  "
+                                      f"{self.descrever_local(local)}", True, cor)
+            superficie.blit(texto, (10, 22 + linha * 14))
+        return superficie
+
+    def salvar_log(self, caminho=None):
+        """
+        Gravar e imprimir o relatório dos locais que mais alocam (chamado ao sair).
+        Args:
+            caminho: Arquivo de destino (padrão: PASTA_PERFIS/alocacoes_<data>.log)
+        Returns:
+            Caminho do arquivo gravado, ou None se nada foi medido
+        """
+        if not self.ativo or not self.quadros:
+            return None
+        linhas = [f"Alocações de Surface/Font em {self.quadros} quadros "
+                  f"(por quadro | KB por quadro | quadros com alocação | local)"]
+        for local, por_quadro, kb_por_quadro, fracao in self.piores_locais(LOCAIS_LOG_ALOCACOES):
+            linhas.append(f"{por_quadro:8.2f} {kb_por_quadro:10.1f} {fracao:6.0%}  {self.descrever_local(local)}")
+        relatorio = '\n'.join(linhas)
+        print('\n'.join(linhas[:11]))
+
+        if caminho is None:
+            os.makedirs(PASTA_PERFIS, exist_ok=True)
+            caminho = os.path.join(PASTA_PERFIS, f"alocacoes_{time.strftime('%Y%m%d_%H%M%S')}.log")
+        try:
+            with open(caminho, 'w', encoding='utf-8') as f:
+                f.write(relatorio + '\n')
+        except OSError as e:
+            print(f"Erro ao salvar relatório de alocações: {e}")
+            return None
+        print(f"Relatório de alocações salvo em {caminho}")
+        return caminho
+
+
+# Instância global do rastreador
+rastreador_alocacoes = RastreadorAlocacoes()
+atexit.register(rastreador_alocacoes.salvar_log)
@@ -6,7 +6,6 @@ Adiciona vida e imersão ao ambiente de jogo.
 """
 
 import math
-import random
 import pygame
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
 from src.pygame_constants import SRCALPHA, K_LEFT, K_RIGHT
@@ -15,6 +14,7 @@ from src.config_ambiente import (
     INTENSIDADE_VENTO_BASE, DEBUG_ATIVO_PADRAO, MOSTRAR_INFO_DEBUG_PADRAO,
     CONTROLE_MANUAL_TEMPO_PADRAO, CORES_AMBIENTE, EFEITOS_MAPA_CONFIG
 )
+from src.aleatoriedade import aleatorio_visual
 
 class GerenciadorAmbiente:
     """Gerenciador principal do sistema de ambiente dinâmico"""
@@ -102,7 +102,7 @@ class GerenciadorAmbiente:
         self.ultimo_spawn_particula += dt
 
         # Spawnar nova partícula ocasionalmente
-        if self.ultimo_spawn_particula > random.uniform(2.0, 5.0):
+        if self.ultimo_spawn_particula > aleatorio_visual.uniform(2.0, 5.0):
             self._criar_particula_folha()
             self.ultimo_spawn_particula = 0.0
 
@@ -114,11 +114,11 @@ class GerenciadorAmbiente:
 
     def _criar_particula_folha(self):
         """Criar partícula de folha voando"""
-        x = random.randint(-50, self.largura_mapa + 50)
-        y = random.randint(-50, self.altura_mapa + 50)
+        x = aleatorio_visual.randint(-50, self.largura_mapa + 50)
+        y = aleatorio_visual.randint(-50, self.altura_mapa + 50)
 
         # Escolher lado da tela para spawn
-        lado = random.choice(['esquerda', 'direita', 'cima', 'baixo'])
+        lado = aleatorio_visual.choice(['esquerda', 'direita', 'cima', 'baixo'])
         if lado == 'esquerda':
             x = -20
         elif lado == 'direita':
@@ -309,7 +309,7 @@ class GerenciadorAmbiente:
         self.tempo_mudanca_clima += dt
 
         # Mudança de clima ocasional
-        if self.tempo_mudanca_clima > random.uniform(30.0, 60.0):
+        if self.tempo_mudanca_clima > aleatorio_visual.uniform(30.0, 60.0):
             self._mudar_clima()
             self.tempo_mudanca_clima = 0.0
 
@@ -327,10 +327,10 @@ class GerenciadorAmbiente:
             climas_disponiveis = ["limpo", "neve"]
 
         # Chance maior de ficar limpo
-        if random.random() < 0.6:
+        if aleatorio_visual.random() < 0.6:
             novo_clima = "limpo"
         else:
-            novo_clima = random.choice([c for c in climas_disponiveis if c != "limpo"])
+            novo_clima = aleatorio_visual.choice([c for c in climas_disponiveis if c != "limpo"])
 
         if novo_clima != self.clima_atual:
             self.clima_atual = novo_clima
@@ -356,7 +356,7 @@ class GerenciadorAmbiente:
         """Criar partículas de chuva"""
         if len(self.particulas_clima) < 100:
             for _ in range(5):
-                x = random.randint(-20, self.largura_mapa + 20)
+                x = aleatorio_visual.randint(-20, self.largura_mapa + 20)
                 y = -10
                 particula = ParticulaChuva(x, y)
                 self.particulas_clima.append(particula)
@@ -365,7 +365,7 @@ class GerenciadorAmbiente:
         """Criar partículas de neve"""
         if len(self.particulas_clima) < 80:
             for _ in range(3):
-                x = random.randint(-20, self.largura_mapa + 20)
+                x = aleatorio_visual.randint(-20, self.largura_mapa + 20)
                 y = -10
                 particula = ParticulaNeve(x, y, self.intensidade_vento)
                 self.particulas_clima.append(particula)
@@ -374,7 +374,7 @@ class GerenciadorAmbiente:
         """Criar partículas de tempestade"""
         if len(self.particulas_clima) < 120:
             for _ in range(8):
-                x = random.randint(-50, self.largura_mapa + 50)
+                x = aleatorio_visual.randint(-50, self.largura_mapa + 50)
                 y = -10
                 particula = ParticulaTempestade(x, y, self.intensidade_vento)
                 self.particulas_clima.append(particula)
@@ -384,12 +384,12 @@ class ParticulaFolha:
     def __init__(self, x, y, direcao_vento, intensidade_vento):
         self.x = float(x)
         self.y = float(y)
-        self.vel_x = random.uniform(-30, 30) + math.cos(direcao_vento) * intensidade_vento * 20
-        self.vel_y = random.uniform(10, 40) + math.sin(direcao_vento) * intensidade_vento * 10
+        self.vel_x = aleatorio_visual.uniform(-30, 30) + math.cos(direcao_vento) * intensidade_vento * 20
+        self.vel_y = aleatorio_visual.uniform(10, 40) + math.sin(direcao_vento) * intensidade_vento * 10
 
         # Propriedades visuais
-        self.tamanho = random.randint(3, 7)
-        self.cor = random.choice([
+        self.tamanho = aleatorio_visual.randint(3, 7)
+        self.cor = aleatorio_visual.choice([
             (139, 69, 19),   # Marrom
             (160, 82, 45),   # Marrom claro
             (205, 133, 63),  # Peru
@@ -398,14 +398,14 @@ class ParticulaFolha:
         ])
 
         # Animação
-        self.rotacao = random.uniform(0, math.pi * 2)
-        self.vel_rotacao = random.uniform(-2, 2)
-        self.vida = random.uniform(8.0, 15.0)
+        self.rotacao = aleatorio_visual.uniform(0, math.pi * 2)
+        self.vel_rotacao = aleatorio_visual.uniform(-2, 2)
+        self.vida = aleatorio_visual.uniform(8.0, 15.0)
         self.vida_maxima = self.vida
 
         # Movimento oscilante
-        self.oscilacao_tempo = random.uniform(0, math.pi * 2)
-        self.oscilacao_amplitude = random.uniform(10, 20)
+        self.oscilacao_tempo = aleatorio_visual.uniform(0, math.pi * 2)
+        self.oscilacao_amplitude = aleatorio_visual.uniform(10, 20)
 
     def atualizar(self, dt):
         """Atualizar partícula"""
@@ -492,8 +492,8 @@ class ParticulaChuva:
     def __init__(self, x, y):
         self.x = float(x)
         self.y = float(y)
-        self.vel_x = random.uniform(-5, 5)
-        self.vel_y = random.uniform(200, 400)
+        self.vel_x = aleatorio_visual.uniform(-5, 5)
+        self.vel_y = aleatorio_visual.uniform(200, 400)
         self.vida = 3.0
 
     def atualizar(self, dt):
@@ -518,11 +518,11 @@ class ParticulaNeve:
     def __init__(self, x, y, intensidade_vento):
         self.x = float(x)
         self.y = float(y)
-        self.vel_x = random.uniform(-20, 20) + intensidade_vento * 10
-        self.vel_y = random.uniform(30, 80)
-        self.tamanho = random.randint(2, 5)
+        self.vel_x = aleatorio_visual.uniform(-20, 20) + intensidade_vento * 10
+        self.vel_y = aleatorio_visual.uniform(30, 80)
+        self.tamanho = aleatorio_visual.randint(2, 5)
         self.vida = 8.0
-        self.oscilacao = random.uniform(0, math.pi * 2)
+        self.oscilacao = aleatorio_visual.uniform(0, math.pi * 2)
 
     def atualizar(self, dt):
         """Atualizar partícula de neve"""
@@ -547,10 +547,10 @@ class ParticulaTempestade:
     def __init__(self, x, y, intensidade_vento):
         self.x = float(x)
         self.y = float(y)
-        self.vel_x = random.uniform(-50, 50) + intensidade_vento * 30
-        self.vel_y = random.uniform(300, 600)
+        self.vel_x = aleatorio_visual.uniform(-50, 50) + intensidade_vento * 30
+        self.vel_y = aleatorio_visual.uniform(300, 600)
         self.vida = 2.0
-        self.alpha = random.randint(150, 255)
+        self.alpha = aleatorio_visual.randint(150, 255)
 
     def atualizar(self, dt):
         """Atualizar partícula de tempestade"""
@@ -0,0 +1,87 @@
+"""
+Áudio posicional do Brawl Stars Clone.
+Sons com posição no mundo são panoramizados e atenuados em relação ao
+ouvinte (o jogador). As duas curvas são tabelas calculadas uma única vez:
+
+- atenuação indexada pela distância ao quadrado (sem raiz nem trigonometria
+  por som), 1.0 até DISTANCIA_REFERENCIA_AUDIO e zero em DISTANCIA_MAXIMA_AUDIO;
+- pan de potência constante indexado pelo deslocamento horizontal,
+  normalizado para que o centro toque cheio nos dois alto-falantes.
+
+Sons cujo volume final fica abaixo de LIMIAR_AUDIVEL são descartados antes
+de ocupar uma voz.
+"""
+
+import math
+import numpy as np
+from src.config import (
+    DISTANCIA_REFERENCIA_AUDIO, DISTANCIA_MAXIMA_AUDIO, LARGURA_PAN_AUDIO, RESOLUCAO_TABELAS_AUDIO,
+    SCREEN_WIDTH, SCREEN_HEIGHT
+)
+
+
+def criar_tabela_atenuacao(resolucao=RESOLUCAO_TABELAS_AUDIO, referencia=DISTANCIA_REFERENCIA_AUDIO,
+                           maxima=DISTANCIA_MAXIMA_AUDIO):
+    """
+    Tabela de atenuação por distância ao quadrado.
+    Returns:
+        Lista de ganhos; o índice i corresponde a distância² = i / (resolucao - 1) * maxima²
+    """
+    distancias = np.sqrt(np.linspace(0.0, 1.0, resolucao)) * maxima
+    t = np.clip((distancias - referencia) / (maxima - referencia), 0.0, 1.0)
+    return ((1.0 - t) ** 2).tolist()
+
+
+def criar_tabela_pan(resolucao=RESOLUCAO_TABELAS_AUDIO):
+    """
+    Tabela de ganhos (esquerda, direita) por posição de pan.
+    Returns:
+        Lista de tuplas; o índice 0 é todo à esquerda, o último todo à direita
+    """
+    tabela = []
+    for indice in range(resolucao):
+        pan = indice / (resolucao - 1)  # 0 (esquerda) a 1 (direita)
+        angulo = pan * math.pi / 2
+        # Potência constante, escalada para o centro valer 1.0 nos dois lados
+        tabela.append((min(1.0, math.cos(angulo) * math.sqrt(2)), min(1.0, math.sin(angulo) * math.sqrt(2))))
+    return tabela
+
+
+class AudioEspacial:
+    """
+    Ganhos de pan e distância de um som em relação ao ouvinte.
+    Attributes:
+        ouvinte (tuple): Posição (x, y) do ouvinte no mundo
+        atenuacao (list): Ganho por índice de distância²
+        pan (list): (esquerda, direita) por índice de deslocamento horizontal
+    """
+
+    def __init__(self):
+        self.ouvinte = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)
+        self.atenuacao = criar_tabela_atenuacao()
+        self.pan = criar_tabela_pan()
+        ultimo = RESOLUCAO_TABELAS_AUDIO - 1
+        self._escala_distancia = ultimo / (DISTANCIA_MAXIMA_AUDIO * DISTANCIA_MAXIMA_AUDIO)
+        self._escala_pan = ultimo / (2.0 * LARGURA_PAN_AUDIO)
+        self._ultimo = ultimo
+
+    def definir_ouvinte(self, x, y):
+        """Mover o ouvinte (normalmente para a posição do jogador)"""
+        self.ouvinte = (x, y)
+
+    def ganhos(self, x, y):
+        """
+        Calcular os ganhos de um som na posição dada.
+        Args:
+            x, y: Posição do som no mundo
+        Returns:
+            (atenuação, esquerda, direita), ou None se o som está além da distância máxima
+        """
+        dx = x - self.ouvinte[0]
+        dy = y - self.ouvinte[1]
+        indice_distancia = int((dx * dx + dy * dy) * self._escala_distancia)
+        if indice_distancia >= self._ultimo:
+            return None
+        indice_pan = int((dx + LARGURA_PAN_AUDIO) * self._escala_pan + 0.5)
+        esquerda, direita = self.pan[min(self._ultimo, max(0, indice_pan))]
+        return self.atenuacao[indice_distancia], esquerda, direita
@@ -2,14 +2,27 @@
 Sistema de gerenciamento de áudio do Brawl Stars Clone.
 Este módulo implementa um gerenciador completo de áudio utilizando pygame.mixer,
 incluindo reprodução de efeitos sonoros, música de fundo, controle de volume,
-geração procedural de sons e processamento de áudio em tempo real.
+geração procedural de sons (em cache no disco, com variantes sintetizadas
+por um pool de threads em segundo plano) e processamento de áudio em tempo real.
 """
 
 import os
-from typing import Dict, Optional, List
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Optional, List, Tuple
 import numpy as np
 import pygame
-from src.config import VOLUME_MASTER, VOLUME_SFX, VOLUME_MUSIC
+from src.config import (
+    VOLUME_MASTER, VOLUME_SFX, VOLUME_MUSIC, AUDIO_FREQUENCY, AUDIO_CHANNELS, TRABALHADORES_SINTESE_AUDIO,
+    CANAIS_MIXER, LIMIAR_AUDIVEL
+)
+from src.aleatoriedade import aleatorio_visual
+from src.cache_audio import CacheAudio
+from src.gerenciador_vozes import GerenciadorVozes
+from src.audio_espacial import AudioEspacial
+from src.sintese_audio import CATALOGO_SONS, chave_som, sintetizar
+from src.headless import modo_headless_ativo
+from src.inicializacao import SingletonPreguicoso
 
 class AudioManager:
     """Gerenciador de áudio do jogo"""
@@ -19,6 +32,7 @@ class AudioManager:
         # Inicializar mixer do pygame
         pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=512)
         pygame.mixer.init()
+        pygame.mixer.set_num_channels(CANAIS_MIXER)
 
         # Dicionários para armazenar sons
         self.sound_effects: Dict[str, pygame.mixer.Sound] = {}
@@ -33,19 +47,24 @@ class AudioManager:
         self.current_music = None
         self.music_paused = False
 
-        # Canais reservados para diferentes tipos de som
-        self.channels = {
-            'tiros': pygame.mixer.Channel(0),
-            'impactos': pygame.mixer.Channel(1),
-            'power_ups': pygame.mixer.Channel(2),
-            'habilidades': pygame.mixer.Channel(3),
-            'ui': pygame.mixer.Channel(4),
-            'ambiente': pygame.mixer.Channel(5)
-        }
-
-        # Carregar sons
-        self.carregar_sons()
-        self.gerar_sons_procedurais()
+        # Os pedidos de som passam pelo gerenciador de vozes (um despacho por quadro),
+        # dono de todos os CANAIS_MIXER; a categoria do som só define a prioridade
+        self.vozes = GerenciadorVozes(CANAIS_MIXER)
+        # Pan e atenuação por distância dos sons com posição
+        self.espacial = AudioEspacial()
+
+        # Sons procedurais: cache em disco e síntese de fundo
+        self.cache = CacheAudio()
+        self.sons_prontos = deque()
+        self.tarefas_sintese = []
+        # Variantes de cada som (sorteadas em tocar_som)
+        self.variantes_sons: Dict[str, List[pygame.mixer.Sound]] = {}
+        self._silencio = None
+
+        # Carregar sons (no modo headless nada é tocado, então nada é sintetizado)
+        if not modo_headless_ativo():
+            self.carregar_sons()
+            self.gerar_sons_procedurais()
 
     def carregar_sons(self):
         """Carregar arquivos de som se existirem"""
@@ -87,191 +106,138 @@ class AudioManager:
                             print(f"Erro ao carregar {arquivo}: {e}")
 
     def gerar_sons_procedurais(self):
-        """Gerar sons proceduralmente usando pygame"""
-        # Focar em sons de batalha ao invés de música
-        self._gerar_sons_batalha()
-        self._gerar_sons_ui()
-        self._gerar_sons_ambiente()
-
-    def _gerar_sons_batalha(self):
-        """Gerar sons de batalha proceduralmente"""
+        """
+        Preparar o banco de sons procedurais (src.sintese_audio) e suas variantes.
+        As variantes já presentes no cache em disco são abertas com mmap; as
+        que faltam são sintetizadas por um pool de threads, sem atrasar o
+        primeiro quadro. Até a primeira variante de um som ficar pronta, ele
+        toca silêncio.
+        """
+        taxa, canais = self._formato_mixer()
+        self._silencio = pygame.sndarray.make_sound(self._buffer_silencio(canais))
+        pendentes = []
+        for definicao in CATALOGO_SONS:
+            for nome in definicao.nomes:
+                self.sound_effects[nome] = self._silencio
+                self.variantes_sons[nome] = []
+            for variante in definicao.gerar_variantes():
+                chave = chave_som(variante, taxa, canais)
+                buffer = self.cache.carregar(chave)
+                if buffer is None:
+                    pendentes.append((variante, chave))
+                else:
+                    self._instalar_som(variante.nomes, buffer)
+
+        if pendentes:
+            trabalhadores = max(1, min(TRABALHADORES_SINTESE_AUDIO, os.cpu_count() or 1, len(pendentes)))
+            executor = ThreadPoolExecutor(max_workers=trabalhadores, thread_name_prefix='sintese_audio')
+            self.tarefas_sintese = [executor.submit(self._sintetizar, variante, chave, taxa, canais)
+                                    for variante, chave in pendentes]
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def _formato_mixer():
+        """Taxa de amostragem e canais com que o mixer foi aberto"""
+        formato = pygame.mixer.get_init()
+        if formato is None:
+            return AUDIO_FREQUENCY, AUDIO_CHANNELS
+        taxa, _tamanho, canais = formato
+        return taxa, canais
+
+    @staticmethod
+    def _buffer_silencio(canais):
+        """Buffer curto de silêncio (lugar dos sons ainda não sintetizados)"""
+        return np.zeros(1 if canais == 1 else (1, canais), dtype=np.int16)
+
+    def _instalar_som(self, nomes, buffer):
+        """Criar o Sound de uma variante e acrescentá-lo a todos os nomes dela"""
         try:
-            sample_rate = 22050
-
-            # Som de tiro básico
-            self._criar_som_tiro_basico(sample_rate)
-
-            # Som de impacto
-            self._criar_som_impacto(sample_rate)
-
-            # Som de explosão
-            self._criar_som_explosao(sample_rate)
-
-            # Sons de power-ups
-            self._criar_sons_powerups(sample_rate)            # Sons de habilidades especiais
-            self._criar_sons_habilidades(sample_rate)
-
-        except (ValueError, TypeError, AttributeError, OSError) as e:
-            print(f"Erro ao gerar sons de batalha: {e}")
-
-    def _criar_som_tiro_basico(self, sample_rate):
-        """Criar som de tiro básico"""
-        duracao = 0.08
-        t = np.linspace(0, duracao, int(sample_rate * duracao), False)
-
-        # Ruído branco filtrado para simular tiro
-        ruido = np.random.normal(0, 0.3, len(t))
-        # Envelope exponencial decrescente
-        envelope = np.exp(-t * 30)
-        # Filtro passa-alta simulado
-        freq_corte = 2000
-        som_tiro = ruido * envelope * (1 + np.sin(2 * np.pi * freq_corte * t) * 0.2)
-        som_tiro = np.clip(som_tiro * 0.6, -1, 1)
-        som_tiro_stereo = np.array([som_tiro, som_tiro]).T
-        som_tiro_int = (som_tiro_stereo * 32767).astype(np.int16)
-        self.sound_effects['tiro_shelly'] = pygame.sndarray.make_sound(som_tiro_int)
-        self.sound_effects['tiro_colt'] = pygame.sndarray.make_sound(som_tiro_int)
-        self.sound_effects['tiro_bull'] = pygame.sndarray.make_sound(som_tiro_int)
-
-    def _criar_som_impacto(self, sample_rate):
-        """Criar som de impacto"""
-        duracao = 0.15
-        t = np.linspace(0, duracao, int(sample_rate * duracao), False)
-
-        # Combinação de ruído e tom baixo
-        ruido = np.random.normal(0, 0.4, len(t))
-        tom_baixo = np.sin(2 * np.pi * 120 * t) * 0.5
-        envelope = np.exp(-t * 15)
-        som_impacto = (ruido + tom_baixo) * envelope
-        som_impacto = np.clip(som_impacto * 0.7, -1, 1)
-        som_impacto_stereo = np.array([som_impacto, som_impacto]).T
-        som_impacto_int = (som_impacto_stereo * 32767).astype(np.int16)
-        self.sound_effects['impacto_inimigo'] = pygame.sndarray.make_sound(som_impacto_int)
-        self.sound_effects['impacto_jogador'] = pygame.sndarray.make_sound(som_impacto_int)
-
-    def _criar_som_explosao(self, sample_rate):
-        """Criar som de explosão"""
-        duracao = 0.3
-        t = np.linspace(0, duracao, int(sample_rate * duracao), False)
-
-        # Explosão = ruído + tons baixos
-        ruido = np.random.normal(0, 0.5, len(t))
-        tom1 = np.sin(2 * np.pi * 80 * t) * 0.6
-        tom2 = np.sin(2 * np.pi * 150 * t) * 0.4
-        envelope = np.exp(-t * 8)
-        som_explosao = (ruido + tom1 + tom2) * envelope
-        som_explosao = np.clip(som_explosao * 0.8, -1, 1)
-        som_explosao_stereo = np.array([som_explosao, som_explosao]).T
-        som_explosao_int = (som_explosao_stereo * 32767).astype(np.int16)
-        self.sound_effects['explosao'] = pygame.sndarray.make_sound(som_explosao_int)
-
-    def _criar_sons_powerups(self, sample_rate):
-        """Criar sons de power-ups"""
-        # Power-up de velocidade
-        duracao = 0.2
-        t = np.linspace(0, duracao, int(sample_rate * duracao), False)
-        freq = 800
-        som_velocidade = 0.4 * np.sin(2 * np.pi * freq * t) * (1 + 0.5 * np.sin(2 * np.pi * 15 * t))
-        som_velocidade = np.clip(som_velocidade, -1, 1)
-        som_velocidade_stereo = np.array([som_velocidade, som_velocidade]).T
-        som_velocidade_int = (som_velocidade_stereo * 32767).astype(np.int16)
-
-        self.sound_effects['powerup_velocidade'] = pygame.sndarray.make_sound(som_velocidade_int)
-
-        # Power-up de vida
-        duracao = 0.25
-        t = np.linspace(0, duracao, int(sample_rate * duracao), False)
-        freq1, freq2 = 600, 900
-        som_vida = 0.3 * (np.sin(2 * np.pi * freq1 * t) + np.sin(2 * np.pi * freq2 * t))
-
-        som_vida = np.clip(som_vida, -1, 1)
-        som_vida_stereo = np.array([som_vida, som_vida]).T
-        som_vida_int = (som_vida_stereo * 32767).astype(np.int16)
-
-        self.sound_effects['powerup_vida'] = pygame.sndarray.make_sound(som_vida_int)
-
-    def _criar_sons_habilidades(self, sample_rate):
-        """Criar sons de habilidades especiais"""
-        # Super Shot
-        duracao = 0.12
-        t = np.linspace(0, duracao, int(sample_rate * duracao), False)
-
-        # Som mais poderoso que o tiro normal
-        ruido = np.random.normal(0, 0.4, len(t))
-        tom_grave = np.sin(2 * np.pi * 150 * t) * 0.6
-        envelope = np.exp(-t * 20)
-
-        som_super = (ruido + tom_grave) * envelope
-        som_super = np.clip(som_super * 0.8, -1, 1)
-        som_super_stereo = np.array([som_super, som_super]).T
-        som_super_int = (som_super_stereo * 32767).astype(np.int16)
-
-        self.sound_effects['super_shelly'] = pygame.sndarray.make_sound(som_super_int)
-        self.sound_effects['habilidade_shelly'] = pygame.sndarray.make_sound(som_super_int)
-
-    def _gerar_sons_ambiente(self):
-        """Gerar sons ambientes sutis ao invés de música"""
+            som = pygame.sndarray.make_sound(buffer)
+        except (ValueError, pygame.error) as e:
+            print(f"Erro ao criar som '{nomes[0]}': {e}")
+            return
+        for nome in nomes:
+            self.variantes_sons.setdefault(nome, []).append(som)
+            if self.sound_effects.get(nome) is self._silencio:
+                self.sound_effects[nome] = som
+
+    def _sintetizar(self, definicao, chave, taxa, canais):
+        """
+        Sintetizar uma variante que falta no cache (thread do pool).
+        O buffer pronto vai para a fila sons_prontos; a criação do Sound
+        fica na thread principal (_instalar_prontos), junto do mixer.
+        """
         try:
-            sample_rate = 22050
-
-            # Som ambiente sutil para menu
-            self._criar_ambiente_menu(sample_rate)
-              # Som ambiente para jogo
-            self._criar_ambiente_jogo(sample_rate)
-
-        except (ValueError, TypeError, AttributeError, OSError) as e:
-            print(f"Erro ao gerar sons ambiente: {e}")
-
-    def _criar_ambiente_menu(self, sample_rate):
-        """Criar som ambiente sutil para menu"""
-        duracao = 0.5
-        t = np.linspace(0, duracao, int(sample_rate * duracao), False)
-
-        # Tom muito suave e baixo
-        freq = 200
-        som_ambiente = 0.05 * np.sin(2 * np.pi * freq * t)
-
-        som_ambiente = np.clip(som_ambiente, -1, 1)
-        som_ambiente_stereo = np.array([som_ambiente, som_ambiente]).T
-        som_ambiente_int = (som_ambiente_stereo * 32767).astype(np.int16)
-
-        self.sound_effects['ambiente_menu'] = pygame.sndarray.make_sound(som_ambiente_int)
-
-    def _criar_ambiente_jogo(self, sample_rate):
-        """Criar som ambiente sutil para jogo"""
-        duracao = 1.0
-        t = np.linspace(0, duracao, int(sample_rate * duracao), False)
-
-        # Som de vento suave
-        ruido_suave = np.random.normal(0, 0.02, len(t))
-        filtro = np.sin(2 * np.pi * 0.5 * t) * 0.01
-
-        som_ambiente = ruido_suave + filtro
-        som_ambiente = np.clip(som_ambiente, -1, 1)
-        som_ambiente_stereo = np.array([som_ambiente, som_ambiente]).T
-        som_ambiente_int = (som_ambiente_stereo * 32767).astype(np.int16)
-
-        self.sound_effects['ambiente_jogo'] = pygame.sndarray.make_sound(som_ambiente_int)
-
-    def tocar_som(self, nome_som: str, volume: float = 1.0, canal: Optional[str] = None):
-        """Tocar um efeito sonoro"""
+            buffer = sintetizar(definicao, taxa, canais)
+        except (ValueError, TypeError, FloatingPointError) as e:
+            print(f"Erro ao sintetizar som '{definicao.nomes[0]}': {e}")
+            return
+        self.cache.salvar(chave, buffer)
+        self.sons_prontos.append((definicao.nomes, buffer))
+
+    def _instalar_prontos(self):
+        """Instalar as variantes que o pool de síntese terminou"""
+        while self.sons_prontos:
+            nomes, buffer = self.sons_prontos.popleft()
+            self._instalar_som(nomes, buffer)
+
+    def aguardar_sintese(self, tempo_limite=None):
+        """
+        Esperar a síntese de fundo terminar e instalar os sons.
+        Args:
+            tempo_limite: Segundos máximos de espera (None: sem limite)
+        Returns:
+            True se não há mais síntese em andamento
+        """
+        if self.tarefas_sintese:
+            _prontas, pendentes = wait(self.tarefas_sintese, timeout=tempo_limite)
+            self.tarefas_sintese = list(pendentes)
+        self._instalar_prontos()
+        return not self.tarefas_sintese
+
+    def tocar_som(self, nome_som: str, volume: float = 1.0, canal: Optional[str] = None,
+                  posicao: Optional[Tuple[float, float]] = None):
+        """
+        Pedir um efeito sonoro (tocado no próximo despachar_sons).
+        Args:
+            nome_som: Nome do som
+            volume: Volume relativo (0.0 a 1.0)
+            canal: Categoria do som ('ui', 'tiros', 'impactos'...); define a prioridade da voz
+            posicao: Posição (x, y) no mundo; com ela o som é panoramizado e
+                atenuado pela distância ao ouvinte (None: centralizado)
+        """
+        if self.sons_prontos:
+            self._instalar_prontos()
         if nome_som in self.sound_effects:
-            try:
-                som = self.sound_effects[nome_som]
-                volume_final = volume * self.volume_sfx * self.volume_master
-                volume_final = max(0.0, min(1.0, volume_final))  # Garantir range válido
-                som.set_volume(volume_final)
-                if canal and canal in self.channels:
-                    # Se o canal já está tocando, parar antes de tocar novo som
-                    if self.channels[canal].get_busy():
-                        self.channels[canal].stop()
-                    self.channels[canal].play(som)
-                else:
-                    som.play()
-            except (OSError, AttributeError, RuntimeError) as e:
-                print(f"Erro ao tocar som '{nome_som}': {e}")
-        else:
-            pass
+            volume_final = volume * self.volume_sfx * self.volume_master
+            volume_final = max(0.0, min(1.0, volume_final))  # Garantir range válido
+            esquerda = direita = 1.0
+            if posicao is not None:
+                ganhos = self.espacial.ganhos(posicao[0], posicao[1])
+                if ganhos is not None:
+                    atenuacao, esquerda, direita = ganhos
+                    volume_final *= atenuacao
+                if ganhos is None or volume_final < LIMIAR_AUDIVEL:
+                    self.vozes.registrar_inaudivel()
+                    return
+            variantes = self.variantes_sons.get(nome_som)
+            som = aleatorio_visual.choice(variantes) if variantes else self.sound_effects[nome_som]
+            self.vozes.pedir(nome_som, som, volume_final, canal, esquerda, direita)
+
+    def definir_ouvinte(self, x: float, y: float):
+        """Posição do ouvinte para os sons posicionais (normalmente o jogador)"""
+        self.espacial.definir_ouvinte(x, y)
+
+    def despachar_sons(self):
+        """Tocar os sons pedidos no quadro (chamado uma vez por quadro pelo loop principal)"""
+        try:
+            self.vozes.despachar()
+        except (pygame.error, RuntimeError) as e:
+            print(f"Erro ao tocar sons: {e}")
+
+    def estatisticas_vozes(self) -> Dict[str, int]:
+        """Vozes ativas, pedidos, coalescidos, tocados, roubados e descartados"""
+        return self.vozes.estatisticas()
 
     def tocar_musica(self, nome_musica: str, loop: bool = True, fade_in: float = 0.0):
         """Tocar música de fundo"""
@@ -325,10 +291,8 @@ class AudioManager:
     def parar_todos_sons(self):
         """Parar todos os sons em execução"""
         try:
-            # Parar todos os canais
-            for canal in self.channels.values():
-                if canal.get_busy():
-                    canal.stop()
+            # Parar as vozes e descartar os pedidos ainda não despachados
+            self.vozes.parar()
 
             # Parar qualquer som que esteja tocando nos canais padrão
             pygame.mixer.stop()
@@ -353,11 +317,7 @@ class AudioManager:
 
     def verificar_canais_ocupados(self):
         """Verificar quantos canais estão ocupados"""
-        canais_ocupados = 0
-        for canal in self.channels.values():
-            if canal.get_busy():
-                canais_ocupados += 1
-        return canais_ocupados
+        return self.vozes.vozes_ativas()
 
     def tocar_som_controlado(self, nome_som: str, volume: float = 1.0, canal: Optional[str] = None):
         """Tocar som com controle de volume baseado no número de canais ocupados"""
@@ -414,85 +374,5 @@ class AudioManager:
         """Listar todas as músicas disponíveis"""
         return list(self.music_tracks.keys())
 
-    def _gerar_sons_ui(self):
-        """Gerar sons de interface proceduralmente"""
-        try:
-            sample_rate = 22050
-
-            # Som de seleção (ui_select) - tom suave
-            duracao = 0.1
-            t = np.linspace(0, duracao, int(sample_rate * duracao), False)
-            freq = 800  # Frequência agradável
-            amplitude = 0.3
-
-            # Tom simples com fade out
-            som_select = amplitude * np.sin(2 * np.pi * freq * t)
-            fade_samples = int(sample_rate * 0.05)  # 50ms de fade
-            som_select[-fade_samples:] *= np.linspace(1, 0, fade_samples)
-
-            # Converter para pygame Sound
-            som_select = np.clip(som_select, -1, 1)
-            som_select_stereo = np.array([som_select, som_select]).T
-            som_select_int = (som_select_stereo * 32767).astype(np.int16)
-
-            self.sound_effects['ui_select'] = pygame.sndarray.make_sound(som_select_int)
-
-            # Som de clique (ui_click) - mais percussivo
-            duracao = 0.08
-            t = np.linspace(0, duracao, int(sample_rate * duracao), False)
-            freq = 1200
-            amplitude = 0.4
-
-            som_click = amplitude * np.sin(2 * np.pi * freq * t) * np.exp(-t * 20)
-            som_click = np.clip(som_click, -1, 1)
-            som_click_stereo = np.array([som_click, som_click]).T
-            som_click_int = (som_click_stereo * 32767).astype(np.int16)
-
-            self.sound_effects['ui_click'] = pygame.sndarray.make_sound(som_click_int)
-
-            # Som de confirmação (ui_confirm) - mais alegre
-            duracao = 0.15
-            t = np.linspace(0, duracao, int(sample_rate * duracao), False)
-
-            # Duas frequências para soar mais musical
-            freq1, freq2 = 600, 800
-            amplitude = 0.3
-
-            som_confirm = amplitude * (
-                np.sin(2 * np.pi * freq1 * t) +
-                0.5 * np.sin(2 * np.pi * freq2 * t)
-            )
-            fade_samples = int(sample_rate * 0.1)
-            som_confirm[-fade_samples:] *= np.linspace(1, 0, fade_samples)
-
-            som_confirm = np.clip(som_confirm, -1, 1)
-            som_confirm_stereo = np.array([som_confirm, som_confirm]).T
-            som_confirm_int = (som_confirm_stereo * 32767).astype(np.int16)
-
-            self.sound_effects['ui_confirm'] = pygame.sndarray.make_sound(som_confirm_int)
-
-            # Som de voltar (ui_back) - tom descendente
-            duracao = 0.12
-            t = np.linspace(0, duracao, int(sample_rate * duracao), False)
-            freq_inicial = 600
-            freq_final = 400
-            amplitude = 0.3
-
-            # Frequência que desce
-            freq_t = freq_inicial + (freq_final - freq_inicial) * (t / duracao)
-            som_back = amplitude * np.sin(2 * np.pi * freq_t * t)
-
-            fade_samples = int(sample_rate * 0.05)
-            som_back[-fade_samples:] *= np.linspace(1, 0, fade_samples)
-
-            som_back = np.clip(som_back, -1, 1)
-            som_back_stereo = np.array([som_back, som_back]).T
-            som_back_int = (som_back_stereo * 32767).astype(np.int16)
-
-            self.sound_effects['ui_back'] = pygame.sndarray.make_sound(som_back_int)
-
-        except (OSError, ImportError, ValueError, AttributeError) as e:
-            print(f"Erro ao gerar sons de UI: {e}")
-
-# Instância global do gerenciador de áudio
-gerenciador_audio = AudioManager()
+# Instância global do gerenciador de áudio (mixer e síntese só no primeiro uso)
+gerenciador_audio = SingletonPreguicoso('gerenciador_audio', AudioManager)
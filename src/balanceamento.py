@@ -0,0 +1,326 @@
+"""
+Simulador de balanceamento em lote do Brawl Stars Clone.
+Este módulo roda muitas partidas headless (bot contra a IA dos inimigos) em
+um pool de processos, uma por núcleo, para cada combinação de Brawler e
+conjunto de parâmetros, e agrega taxa de vitória, tempo até a vitória por
+gemas, dano e Supers usados em uma tabela.
+
+Os resultados são gravados partida a partida em um arquivo JSONL; rodar de
+novo com o mesmo arquivo retoma a varredura pulando as partidas já feitas.
+Cada resultado guarda o hash dos parâmetros do conjunto e a semente: se um
+conjunto mudar de valores (ou a semente base mudar), as partidas antigas
+deixam de contar e são refeitas.
+Com --historico as partidas novas também entram, em lotes, num banco de
+histórico (src.historico_partidas) para consultas por Brawler, data e
+resultado.
+
+Uso:
+    python -m src.balanceamento --personagens Shelly Colt --partidas 20 \\
+        --parametros parametros.json --saida balanceamento.jsonl
+
+Formato de parametros.json (nome do conjunto -> ajustes):
+    {"base": {},
+     "carga_alta": {"src.super_system:TAXAS_CARGA_BRAWLERS.Shelly.carga_por_dano": 24},
+     "inimigos_rapidos": {"src.config:MULTIPLICADOR_VELOCIDADE_POR_NIVEL": 1.3}}
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import multiprocessing
+import os
+import sys
+from collections import defaultdict
+
+# Jogo headless reaproveitado entre partidas do mesmo processo trabalhador
+_JOGO_TRABALHADOR = None
+
+
+def _resolver_parametro(caminho):
+    """
+    Resolver um caminho de parâmetro 'modulo:ATRIBUTO[.chave...]'.
+    Returns:
+        Tupla (modulo, nome_atributo, chaves) onde chaves indexa dicionários aninhados
+    """
+    nome_modulo, _, atributo = caminho.partition(':')
+    partes = atributo.split('.')
+    return importlib.import_module(nome_modulo), partes[0], partes[1:]
+
+
+def aplicar_parametros(parametros):
+    """
+    Aplicar ajustes de balanceamento no processo atual.
+    Constantes importadas com 'from módulo import NOME' também são trocadas
+    nos módulos do jogo que guardaram uma cópia do valor original.
+    Args:
+        parametros: Dicionário caminho -> novo valor
+    Returns:
+        Lista de ações para desfazer os ajustes (usada por restaurar_parametros)
+    """
+    desfazer = []
+    for caminho, valor in parametros.items():
+        modulo, nome, chaves = _resolver_parametro(caminho)
+        if chaves:
+            # Valor dentro de dicionário (compartilhado por referência entre módulos)
+            alvo = getattr(modulo, nome)
+            for chave in chaves[:-1]:
+                alvo = alvo[chave]
+            desfazer.append((alvo, chaves[-1], alvo[chaves[-1]]))
+            alvo[chaves[-1]] = valor
+            continue
+
+        original = getattr(modulo, nome)
+        for outro in list(sys.modules.values()):
+            nome_outro = getattr(outro, '__name__', '') or ''
+            if not nome_outro.startswith('src') or not hasattr(outro, nome):
+                continue
+            if outro is modulo or getattr(outro, nome) is original:
+                desfazer.append((outro, nome, original))
+                setattr(outro, nome, valor)
+    return desfazer
+
+
+def restaurar_parametros(desfazer):
+    """Desfazer os ajustes feitos por aplicar_parametros"""
+    for alvo, chave, original in reversed(desfazer):
+        if isinstance(alvo, dict):
+            alvo[chave] = original
+        else:
+            setattr(alvo, chave, original)
+
+
+def _inicializar_trabalhador():
+    """Preparar o processo trabalhador para rodar partidas headless"""
+    # Importado aqui: o modo headless precisa estar ativo antes dos módulos do jogo
+    from src.headless import ativar_modo_headless  # pylint: disable=import-outside-toplevel
+    ativar_modo_headless()
+
+
+def _executar_tarefa(tarefa):
+    """
+    Rodar uma partida (executado dentro do processo trabalhador).
+    Args:
+        tarefa: Dicionário com personagem, conjunto, parametros, indice, semente e tempo_maximo
+    Returns:
+        Dicionário do resultado da partida com a identificação da tarefa
+    """
+    global _JOGO_TRABALHADOR  # pylint: disable=global-statement
+    # pylint: disable=import-outside-toplevel
+    from src.simulacao_headless import criar_jogo_headless, executar_partida_headless
+    from src.headless import ControladorBot
+
+    # Criar o jogo antes dos ajustes: todos os módulos já importados recebem os novos valores
+    if _JOGO_TRABALHADOR is None:
+        _JOGO_TRABALHADOR = criar_jogo_headless()
+    desfazer = aplicar_parametros(tarefa['parametros'])
+    try:
+        resultado = executar_partida_headless(
+            tarefa['personagem'], controlador=ControladorBot(), game=_JOGO_TRABALHADOR,
+            tempo_maximo=tarefa['tempo_maximo'], semente=tarefa['semente']
+        )
+    finally:
+        restaurar_parametros(desfazer)
+
+    resultado.update({
+        'conjunto': tarefa['conjunto'],
+        'indice': tarefa['indice'],
+        'hash_parametros': tarefa['hash_parametros'],
+    })
+    return resultado
+
+
+def hash_parametros(parametros):
+    """Hash estável de um conjunto de parâmetros (independe da ordem das chaves)"""
+    texto = json.dumps(parametros, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(texto.encode('utf-8')).hexdigest()[:16]
+
+
+def _chave_tarefa(personagem, conjunto, indice, hash_conjunto, semente):
+    """Identificar uma partida da varredura (parâmetros e semente fazem parte da identidade)"""
+    return f"{personagem}|{conjunto}|{indice}|{hash_conjunto}|{semente}"
+
+
+def _chave_resultado(resultado):
+    """Chave de um resultado gravado (registros sem hash ou semente nunca coincidem)"""
+    return _chave_tarefa(resultado.get('personagem'), resultado.get('conjunto'), resultado.get('indice'),
+                         resultado.get('hash_parametros'), resultado.get('semente'))
+
+
+def carregar_resultados(arquivo):
+    """
+    Ler os resultados já gravados (linhas inválidas de uma execução interrompida são ignoradas).
+    Returns:
+        Lista de dicionários de resultado
+    """
+    resultados = []
+    if not os.path.exists(arquivo):
+        return resultados
+    with open(arquivo, 'r', encoding='utf-8') as f:
+        for linha in f:
+            try:
+                resultados.append(json.loads(linha))
+            except json.JSONDecodeError:
+                continue
+    return resultados
+
+
+def executar_varredura(personagens, conjuntos_parametros, partidas, arquivo_saida,
+                       processos=None, tempo_maximo=None, semente_base=0, historico=None):
+    """
+    Rodar (ou retomar) uma varredura de balanceamento em paralelo.
+    Args:
+        personagens: Lista de nomes de Brawlers
+        conjuntos_parametros: Dicionário nome do conjunto -> ajustes
+        partidas: Partidas por combinação Brawler x conjunto
+        arquivo_saida: Arquivo JSONL com um resultado por linha
+        processos: Tamanho do pool (padrão: um por núcleo)
+        tempo_maximo: Tempo simulado máximo por partida (padrão do modo headless)
+        semente_base: Deslocamento das sementes das partidas
+        historico: HistoricoPartidas que recebe as partidas novas (opcional)
+    Returns:
+        Lista com os resultados desta varredura (antigos ainda válidos e novos)
+    """
+    from src.config import TEMPO_MAXIMO_PARTIDA_HEADLESS  # pylint: disable=import-outside-toplevel
+    tempo_maximo = tempo_maximo or TEMPO_MAXIMO_PARTIDA_HEADLESS
+
+    esperadas = {}
+    for personagem in personagens:
+        for conjunto, parametros in conjuntos_parametros.items():
+            hash_conjunto = hash_parametros(parametros)
+            for indice in range(partidas):
+                # Mesma semente para o mesmo índice: conjuntos comparados no mesmo mapa
+                semente = semente_base + indice
+                esperadas[_chave_tarefa(personagem, conjunto, indice, hash_conjunto, semente)] = {
+                    'personagem': personagem,
+                    'conjunto': conjunto,
+                    'parametros': parametros,
+                    'hash_parametros': hash_conjunto,
+                    'indice': indice,
+                    'semente': semente,
+                    'tempo_maximo': tempo_maximo,
+                }
+
+    # Resultados de outras configurações (parâmetros ou sementes diferentes) ficam no
+    # arquivo, mas não entram nesta varredura nem na agregação
+    gravados = carregar_resultados(arquivo_saida)
+    resultados = [r for r in gravados if _chave_resultado(r) in esperadas]
+    if len(resultados) < len(gravados):
+        print(f"Ignorando {len(gravados) - len(resultados)} partidas de {arquivo_saida} "
+              f"com parâmetros ou sementes diferentes")
+    feitas = {_chave_resultado(r) for r in resultados}
+    tarefas = [tarefa for chave, tarefa in esperadas.items() if chave not in feitas]
+
+    if not tarefas:
+        print(f"Nada a fazer: {len(resultados)} partidas já em {arquivo_saida}")
+        return resultados
+
+    processos = processos or os.cpu_count() or 1
+    print(f"Rodando {len(tarefas)} partidas em {processos} processos "
+          f"({len(feitas)} já concluídas)")
+
+    # 'spawn' dá a cada trabalhador um SDL/pygame limpo
+    contexto = multiprocessing.get_context('spawn')
+    with contexto.Pool(processos, initializer=_inicializar_trabalhador) as pool, \
+            open(arquivo_saida, 'a', encoding='utf-8') as saida:
+        for concluidas, resultado in enumerate(pool.imap_unordered(_executar_tarefa, tarefas), 1):
+            # Gravar imediatamente para que a varredura possa ser retomada
+            saida.write(json.dumps(resultado, ensure_ascii=False) + '\n')
+            saida.flush()
+            resultados.append(resultado)
+            if historico is not None:
+                historico.registrar(
+                    resultado['personagem'], resultado['vitoria'], resultado['tempo_partida'],
+                    resultado.get('exp_ganha', 0), dano_causado=resultado['dano_causado'],
+                    dano_recebido=resultado['dano_recebido'], inimigos_eliminados=resultado['inimigos_eliminados'],
+                    gemas_coletadas=resultado['gemas_coletadas'])
+            if concluidas % max(1, len(tarefas) // 20) == 0:
+                print(f"  {concluidas}/{len(tarefas)} partidas")
+        # Encerrar os trabalhadores pela fila: o SDL intercepta o SIGTERM de terminate()
+        pool.close()
+        pool.join()
+    if historico is not None:
+        historico.descarregar()
+
+    return resultados
+
+
+def agregar_resultados(resultados):
+    """
+    Agregar os resultados por Brawler e conjunto de parâmetros.
+    Returns:
+        Dicionário (personagem, conjunto) -> métricas agregadas
+    """
+    grupos = defaultdict(list)
+    for resultado in resultados:
+        grupos[(resultado['personagem'], resultado['conjunto'])].append(resultado)
+
+    agregado = {}
+    for chave, partidas in sorted(grupos.items()):
+        vitorias = [p for p in partidas if p['vitoria']]
+        agregado[chave] = {
+            'partidas': len(partidas),
+            'taxa_vitoria': len(vitorias) / len(partidas),
+            'tempo_vitoria_medio': (sum(p['tempo_partida'] for p in vitorias) / len(vitorias)
+                                    if vitorias else None),
+            'dano_causado_medio': sum(p['dano_causado'] for p in partidas) / len(partidas),
+            'dano_recebido_medio': sum(p['dano_recebido'] for p in partidas) / len(partidas),
+            'supers_medio': sum(p['supers_usados'] for p in partidas) / len(partidas),
+            'exp_media': sum(p.get('exp_ganha', 0) for p in partidas) / len(partidas),
+        }
+    return agregado
+
+
+def formatar_tabela(agregado):
+    """Formatar as métricas agregadas como tabela de texto"""
+    cabecalho = (f"{'Brawler':<10} {'Conjunto':<18} {'N':>4} {'Vitória':>8} {'T.vitória':>10} "
+                 f"{'Dano':>8} {'Recebido':>9} {'Supers':>7} {'EXP':>6}")
+    linhas = [cabecalho, '-' * len(cabecalho)]
+    for (personagem, conjunto), m in agregado.items():
+        tempo = f"{m['tempo_vitoria_medio']:.1f}s" if m['tempo_vitoria_medio'] is not None else '-'
+        linhas.append(
+            f"{personagem:<10} {conjunto:<18} {m['partidas']:>4} {m['taxa_vitoria']:>7.0%} {tempo:>10} "
+            f"{m['dano_causado_medio']:>8.0f} {m['dano_recebido_medio']:>9.0f} "
+            f"{m['supers_medio']:>7.1f} {m['exp_media']:>6.0f}"
+        )
+    return '\n'.join(linhas)
+
+
+def main(argumentos=None):
+    """Ponto de entrada da linha de comando"""
+    parser = argparse.ArgumentParser(description="Varredura de balanceamento com partidas headless")
+    parser.add_argument('--personagens', nargs='+', default=None,
+                        help="Brawlers a simular (padrão: todos)")
+    parser.add_argument('--partidas', type=int, default=10, help="Partidas por Brawler e conjunto")
+    parser.add_argument('--parametros', default=None, help="JSON com os conjuntos de parâmetros")
+    parser.add_argument('--saida', default='balanceamento.jsonl', help="Arquivo JSONL de resultados")
+    parser.add_argument('--processos', type=int, default=None, help="Processos (padrão: núcleos)")
+    parser.add_argument('--tempo-maximo', type=float, default=None, help="Segundos simulados por partida")
+    parser.add_argument('--semente', type=int, default=0, help="Semente base das partidas")
+    parser.add_argument('--historico', default=None, help="Banco SQLite que recebe as partidas simuladas")
+    args = parser.parse_args(argumentos)
+
+    personagens = args.personagens
+    if not personagens:
+        from src.characters.personagens import listar_personagens  # pylint: disable=import-outside-toplevel
+        personagens = listar_personagens()
+
+    conjuntos = {'base': {}}
+    if args.parametros:
+        with open(args.parametros, 'r', encoding='utf-8') as f:
+            conjuntos = json.load(f)
+
+    historico = None
+    if args.historico:
+        from src.historico_partidas import HistoricoPartidas  # pylint: disable=import-outside-toplevel
+        historico = HistoricoPartidas(args.historico)
+
+    resultados = executar_varredura(personagens, conjuntos, args.partidas, args.saida,
+                                    args.processos, args.tempo_maximo, args.semente, historico)
+    if historico is not None:
+        historico.fechar()
+    print(formatar_tabela(agregar_resultados(resultados)))
+
+
+if __name__ == '__main__':
+    main()
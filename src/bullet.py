@@ -5,12 +5,13 @@ movimento, detecção de colisão com obstáculos, diferenciação entre tiros
 de jogador e inimigos, sistema de dano e efeitos visuais com renderização 3D.
 """
 
-import random
 import pygame
-import time
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, TAMANHO_TIRO, COR_TIRO, VELOCIDADE_TIRO
 from src.pygame_constants import SRCALPHA
 from src.renderer_3d import renderer_3d
+from src.headless import modo_headless_ativo
+from src.swept_collision import first_impact
+from src.aleatoriedade import aleatorio_visual
 
 # Importar gerenciador de efeitos uma vez no topo para melhor performance
 try:
@@ -40,11 +41,15 @@ class Bullet(pygame.sprite.Sprite):
         self.pos_x = float(x)
         self.pos_y = float(y)
 
+        # Trajeto do último passo (para colisão contínua) e obstáculo que o interrompeu
+        self.pos_anterior_x = self.pos_x
+        self.pos_anterior_y = self.pos_y
+        self.obstaculo_atingido = None
+
         # Propriedades para rastro e efeitos
         self.cor_base = (255, 0, 0) if de_inimigo else COR_TIRO
         self.posicoes_anteriores = []
-        self.tempo_criacao = time.time()
-        
+
         # Tempo de vida limitado - tiros duram 3 segundos (alcance de 1500 pixels)
         self.tempo_vida_maximo = 3.0
         self.tempo_vida_atual = 0.0
@@ -54,10 +59,13 @@ class Bullet(pygame.sprite.Sprite):
 
     def _renderizar_projetil(self):
         """Renderiza o projétil usando o sistema 3D"""
+        if modo_headless_ativo():
+            return  # Sem tela não há o que desenhar
+
         self.image.fill((0, 0, 0, 0))  # Limpar superfície
 
-        # Calcular tempo para animações
-        tempo_jogo = time.time() - self.tempo_criacao
+        # Animação segue o tempo de vida do projétil (não o relógio real)
+        tempo_jogo = self.tempo_vida_atual
           # Usar renderer 3D para desenhar o projétil
         renderer_3d.desenhar_projetil_3d(
             self.image,
@@ -80,16 +88,34 @@ class Bullet(pygame.sprite.Sprite):
         if not self.ativo:
             return
 
+        # Impacto em obstáculo não consumido pelo jogo no passo anterior
+        if self.obstaculo_atingido is not None:
+            self.kill()
+            return
+
         # Atualizar tempo de vida
         self.tempo_vida_atual += dt
         if self.tempo_vida_atual >= self.tempo_vida_maximo:
             self.kill()
             return
 
-        # Mover
+        # Mover guardando a origem do passo para a varredura contínua
+        self.pos_anterior_x = self.pos_x
+        self.pos_anterior_y = self.pos_y
         self.pos_x += self.velocidade_x * dt
         self.pos_y += self.velocidade_y * dt
 
+        # Verificar colisão contínua com obstáculos: o trajeto é cortado no ponto
+        # de impacto e o jogo decide o que fazer (dano em destrutíveis, remoção)
+        toi, obstaculo = first_impact(
+            self.pos_anterior_x, self.pos_anterior_y, self.pos_x, self.pos_y,
+            obstaculos, self.rect.width / 2, self.rect.height / 2
+        )
+        if obstaculo is not None:
+            self.pos_x = self.pos_anterior_x + (self.pos_x - self.pos_anterior_x) * toi
+            self.pos_y = self.pos_anterior_y + (self.pos_y - self.pos_anterior_y) * toi
+            self.obstaculo_atingido = obstaculo
+
         self.rect.centerx = int(self.pos_x)
         self.rect.centery = int(self.pos_y)
 
@@ -104,7 +130,7 @@ class Bullet(pygame.sprite.Sprite):
         # Criar efeito de rastro se disponível
         if EFEITOS_DISPONIVEL and len(self.posicoes_anteriores) > 2:
             # Criar rastro apenas ocasionalmente para performance
-            if random.random() < 0.3:  # 30% de chance
+            if aleatorio_visual.random() < 0.3:  # 30% de chance
                 try:
                     gerenciador_efeitos.criar_rastro_projetil(
                         self.rect.centerx, self.rect.centery,
@@ -116,12 +142,30 @@ class Bullet(pygame.sprite.Sprite):
         # Verificar se saiu da tela (apenas para projéteis muito distantes)
         if self.fora_da_tela_distante():
             self.kill()
-        
-        # Verificar colisão com obstáculos
-        for obstaculo in obstaculos:
-            if self.rect.colliderect(obstaculo.rect):
-                self.kill()
-                break
+
+    def segmento_varredura(self):
+        """
+        Obter o trajeto percorrido no último passo de simulação.
+        Returns:
+            Tupla (x0, y0, x1, y1) com as posições do centro no início e no fim do passo
+        """
+        return self.pos_anterior_x, self.pos_anterior_y, self.pos_x, self.pos_y
+
+    def area_varredura(self):
+        """
+        Obter o retângulo que envolve todo o trajeto do último passo.
+        Returns:
+            pygame.Rect cobrindo o projétil na origem e no destino
+        """
+        largura = self.rect.width
+        altura = self.rect.height
+        x_min = min(self.pos_anterior_x, self.pos_x) - largura / 2
+        y_min = min(self.pos_anterior_y, self.pos_y) - altura / 2
+        return pygame.Rect(
+            int(x_min), int(y_min),
+            int(abs(self.pos_x - self.pos_anterior_x) + largura) + 1,
+            int(abs(self.pos_y - self.pos_anterior_y) + altura) + 1
+        )
 
     def reset(self, x, y, dx, dy, velocidade_mult=1.0, dano=25, de_inimigo=False, tipo_tiro="normal"):
         """
@@ -139,6 +183,9 @@ class Bullet(pygame.sprite.Sprite):
         self.rect.center = (x, y)
         self.pos_x = float(x)
         self.pos_y = float(y)
+        self.pos_anterior_x = self.pos_x
+        self.pos_anterior_y = self.pos_y
+        self.obstaculo_atingido = None
         self.velocidade_x = dx * VELOCIDADE_TIRO * velocidade_mult
         self.velocidade_y = dy * VELOCIDADE_TIRO * velocidade_mult
         self.dano = dano
@@ -150,7 +197,7 @@ class Bullet(pygame.sprite.Sprite):
 
         # Atualizar cor baseada no tipo e origem
         self.cor_base = (255, 0, 0) if de_inimigo else COR_TIRO
-        self.tempo_criacao = time.time()        # Limpar rastro anterior
+        # Limpar rastro anterior
         self.posicoes_anteriores.clear()
 
         # Re-renderizar com novos parâmetros
@@ -5,12 +5,18 @@ permitindo que jogadores se escondam estrategicamente dos inimigos.
 Os arbustos reduzem a visibilidade e podem ser usados taticamente.
 """
 
-import random
 import math
 import pygame
-from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, TAMANHO_CELULA_ARBUSTOS
 from src.pygame_constants import SRCALPHA
 from src.ambiente_dinamico import EfeitoVentoArbustos
+from src.aleatoriedade import aleatorio_jogo, aleatorio_visual
+
+# Margem (pixels) em que o centro de uma entidade conta como "dentro" do arbusto.
+# Equivale ao teste de Arbusto.verificar_entidade_dentro: hitbox de 30x30 da
+# entidade (meia largura 15) contra o arbusto recuado em 10 pixels -> 15 - 10 = 5
+MARGEM_COBERTURA_ARBUSTO = 5
+SEM_ARBUSTO = -1
 
 
 class Arbusto(pygame.sprite.Sprite):
@@ -28,14 +34,14 @@ class Arbusto(pygame.sprite.Sprite):
         self.rect = pygame.Rect(x - largura//2, y - altura//2, largura, altura)
 
         # Propriedades do arbusto
-        self.densidade = random.uniform(0.6, 0.9)  # Densidade da vegetação
+        self.densidade = aleatorio_jogo.uniform(0.6, 0.9)  # Densidade da vegetação
         self.cor_base = (34, 139, 34)  # Verde floresta
         self.cor_escura = (0, 100, 0)  # Verde escuro
         self.cor_clara = (144, 238, 144)  # Verde claro
 
         # Animação sutil
-        self.tempo_animacao = random.uniform(0, math.pi * 2)
-        self.intensidade_animacao = random.uniform(0.02, 0.05) #Lista de entidades dentro do arbusto
+        self.tempo_animacao = aleatorio_visual.uniform(0, math.pi * 2)
+        self.intensidade_animacao = aleatorio_visual.uniform(0.02, 0.05) #Lista de entidades dentro do arbusto
         self.entidades_dentro = set()
 
         # Efeitos de balanço pelo vento
@@ -70,7 +76,7 @@ class Arbusto(pygame.sprite.Sprite):
                 cy = self.altura // 2 + int(math.sin(angulo) * raio_offset)
 
                 # Tamanho do círculo
-                raio_circulo = random.randint(12, 20) + camada * 5
+                raio_circulo = aleatorio_visual.randint(12, 20) + camada * 5
 
                 # Desenhar círculo de folhagem
                 superficie_folha = pygame.Surface((raio_circulo * 2, raio_circulo * 2), SRCALPHA)
@@ -82,14 +88,14 @@ class Arbusto(pygame.sprite.Sprite):
                 pos_y = max(0, min(self.altura - raio_circulo * 2, cy - raio_circulo))
                 self.image.blit(superficie_folha, (pos_x, pos_y))  # Adicionar detalhes de textura
         for _ in range(15):
-            x = random.randint(10, self.largura - 10)
-            y = random.randint(10, self.altura - 10)
-            tamanho = random.randint(2, 4)
+            x = aleatorio_visual.randint(10, self.largura - 10)
+            y = aleatorio_visual.randint(10, self.altura - 10)
+            tamanho = aleatorio_visual.randint(2, 4)
 
             # Gerar cor de detalhe garantindo valores válidos
-            r = max(0, min(255, self.cor_escura[0] + random.randint(-20, 20)))
-            g = max(0, min(255, self.cor_escura[1] + random.randint(-20, 20)))
-            b = max(0, min(255, self.cor_escura[2] + random.randint(-20, 20)))
+            r = max(0, min(255, self.cor_escura[0] + aleatorio_visual.randint(-20, 20)))
+            g = max(0, min(255, self.cor_escura[1] + aleatorio_visual.randint(-20, 20)))
+            b = max(0, min(255, self.cor_escura[2] + aleatorio_visual.randint(-20, 20)))
             cor_detalhe = (r, g, b, 150)
 
             pygame.draw.circle(self.image, cor_detalhe, (x, y), tamanho)
@@ -176,6 +182,17 @@ class GerenciadorArbustos:
         self.largura_mapa = largura_mapa
         self.altura_mapa = altura_mapa
 
+        # Grade rasterizada de cobertura: cada célula guarda o id (índice em
+        # lista_arbustos) do arbusto que a cobre ou SEM_ARBUSTO
+        self.tamanho_celula = TAMANHO_CELULA_ARBUSTOS
+        self.colunas_grade = math.ceil(largura_mapa / self.tamanho_celula)
+        self.linhas_grade = math.ceil(altura_mapa / self.tamanho_celula)
+        self.grade_cobertura = [SEM_ARBUSTO] * (self.colunas_grade * self.linhas_grade)
+        self.lista_arbustos = []
+
+        # Entidades verificadas no último quadro -> id do arbusto em que estão
+        self.entidades_rastreadas = {}
+
     def gerar_arbustos_aleatorios(self, quantidade=8):
         """Gerar arbustos em posições estratégicas do mapa"""
         self.arbustos.empty()        # Definir áreas onde arbustos podem aparecer (evitar bordas)
@@ -186,8 +203,8 @@ class GerenciadorArbustos:
         tentativas = 0
 
         while len(arbustos_gerados) < quantidade and tentativas < 100:
-            x = random.randint(margem, SCREEN_WIDTH - margem)
-            y = random.randint(margem, SCREEN_HEIGHT - margem)
+            x = aleatorio_jogo.randint(margem, SCREEN_WIDTH - margem)
+            y = aleatorio_jogo.randint(margem, SCREEN_HEIGHT - margem)
 
             # Verificar distância mínima de outros arbustos
             muito_proximo = False
@@ -199,8 +216,8 @@ class GerenciadorArbustos:
 
             if not muito_proximo:
                 # Tamanho variável dos arbustos
-                largura = random.randint(70, 100)
-                altura = random.randint(70, 100)
+                largura = aleatorio_jogo.randint(70, 100)
+                altura = aleatorio_jogo.randint(70, 100)
 
                 arbusto = Arbusto(x, y, largura, altura)
                 self.arbustos.add(arbusto)
@@ -208,6 +225,8 @@ class GerenciadorArbustos:
 
             tentativas += 1
 
+        self._reconstruir_grade()
+
     def gerar_arbustos_estrategicos(self, obstaculos=None):
         """Gerar arbustos em posições estratégicas como no Brawl Stars"""
         if obstaculos is None:
@@ -258,8 +277,8 @@ class GerenciadorArbustos:
 
         # Gerar arbustos aleatórios adicionais
         for _ in range(8):  # Reduzido de 15 para 8 arbustos extras
-            x = random.randint(100, SCREEN_WIDTH - 100)
-            y = random.randint(100, SCREEN_HEIGHT - 100)
+            x = aleatorio_jogo.randint(100, SCREEN_WIDTH - 100)
+            y = aleatorio_jogo.randint(100, SCREEN_HEIGHT - 100)
             posicoes_candidatas.append((x, y))
 
         # Filtrar posições que não colidem com obstáculos
@@ -281,10 +300,81 @@ class GerenciadorArbustos:
                         break
 
             if posicao_valida:
-                tamanho = random.randint(60, 100)  # Tamanhos mais variados
+                tamanho = aleatorio_jogo.randint(60, 100)  # Tamanhos mais variados
                 arbusto = Arbusto(x, y, tamanho, tamanho)
                 self.arbustos.add(arbusto)
 
+        self._reconstruir_grade()
+
+    def adicionar_arbustos(self, arbustos):
+        """
+        Adicionar arbustos ao mapa (a grade de cobertura é reconstruída uma única vez).
+        Args:
+            arbustos: Iterável de Arbusto
+        """
+        self.arbustos.add(*arbustos)
+        self._reconstruir_grade()
+
+    def _reconstruir_grade(self):
+        """
+        Rasterizar a cobertura dos arbustos na grade de ocupação.
+        Executado apenas quando o mapa é gerado; depois disso toda consulta de
+        visibilidade é uma leitura O(1) na grade.
+        """
+        self.lista_arbustos = list(self.arbustos)
+        tamanho = self.tamanho_celula
+        colunas = self.colunas_grade
+        grade = [SEM_ARBUSTO] * (colunas * self.linhas_grade)
+
+        for id_arbusto, arbusto in enumerate(self.lista_arbustos):
+            x_min = arbusto.rect.left - MARGEM_COBERTURA_ARBUSTO
+            x_max = arbusto.rect.right + MARGEM_COBERTURA_ARBUSTO
+            y_min = arbusto.rect.top - MARGEM_COBERTURA_ARBUSTO
+            y_max = arbusto.rect.bottom + MARGEM_COBERTURA_ARBUSTO
+
+            col_inicio = max(0, int(x_min // tamanho))
+            col_fim = min(colunas - 1, int(x_max // tamanho))
+            lin_inicio = max(0, int(y_min // tamanho))
+            lin_fim = min(self.linhas_grade - 1, int(y_max // tamanho))
+
+            for linha in range(lin_inicio, lin_fim + 1):
+                centro_y = linha * tamanho + tamanho / 2
+                if not y_min < centro_y < y_max:
+                    continue
+                base = linha * colunas
+                for coluna in range(col_inicio, col_fim + 1):
+                    centro_x = coluna * tamanho + tamanho / 2
+                    # Em sobreposições vale o primeiro arbusto (mesma ordem da busca linear)
+                    if x_min < centro_x < x_max and grade[base + coluna] == SEM_ARBUSTO:
+                        grade[base + coluna] = id_arbusto
+
+        self.grade_cobertura = grade
+
+        # Posições em cache referem-se à grade antiga
+        for entidade in self.entidades_rastreadas:
+            entidade.celula_arbusto = None
+            entidade.arbusto_id = SEM_ARBUSTO
+        self.entidades_rastreadas = {}
+
+    def _indice_celula(self, x, y):
+        """Obter o índice linear da célula da grade para uma posição (-1 fora do mapa)"""
+        coluna = int(x // self.tamanho_celula)
+        linha = int(y // self.tamanho_celula)
+        if 0 <= coluna < self.colunas_grade and 0 <= linha < self.linhas_grade:
+            return linha * self.colunas_grade + coluna
+        return -1
+
+    def arbusto_na_posicao(self, x, y):
+        """
+        Obter o id do arbusto que cobre uma posição.
+        Returns:
+            Índice em lista_arbustos ou SEM_ARBUSTO
+        """
+        celula = self._indice_celula(x, y)
+        if celula < 0:
+            return SEM_ARBUSTO
+        return self.grade_cobertura[celula]
+
     def atualizar(self, dt, entidades, efeito_vento=None):
         """Atualizar sistema de arbustos"""
         # Atualizar animações dos arbustos com efeito de vento
@@ -296,22 +386,37 @@ class GerenciadorArbustos:
 
     def _atualizar_visibilidade(self, entidades):
         """Atualizar sistema de visibilidade nos arbustos"""
-        # Limpar listas anteriores
-        for arbusto in self.arbustos:
-            arbusto.entidades_dentro.clear()
+        rastreadas = {}
 
-        # Verificar todas as entidades
         for entidade in entidades:
-            for arbusto in self.arbustos:
-                if arbusto.verificar_entidade_dentro(entidade):
-                    arbusto.adicionar_entidade(entidade)
+            anterior = self.entidades_rastreadas.pop(entidade, SEM_ARBUSTO)
+
+            # Só consultar a grade quando a entidade troca de célula
+            celula = self._indice_celula(entidade.pos_x, entidade.pos_y)
+            if getattr(entidade, 'celula_arbusto', None) != celula:
+                entidade.celula_arbusto = celula
+                entidade.arbusto_id = self.grade_cobertura[celula] if celula >= 0 else SEM_ARBUSTO
+
+            atual = entidade.arbusto_id
+            if atual != anterior:
+                if anterior != SEM_ARBUSTO:
+                    self.lista_arbustos[anterior].remover_entidade(entidade)
+                if atual != SEM_ARBUSTO:
+                    self.lista_arbustos[atual].adicionar_entidade(entidade)
+            rastreadas[entidade] = atual
+
+        # Entidades que deixaram de ser verificadas (ex.: jogador morto) saem dos arbustos
+        for entidade, id_arbusto in self.entidades_rastreadas.items():
+            if id_arbusto != SEM_ARBUSTO:
+                self.lista_arbustos[id_arbusto].remover_entidade(entidade)
+            entidade.celula_arbusto = None
+            entidade.arbusto_id = SEM_ARBUSTO
+
+        self.entidades_rastreadas = rastreadas
 
     def entidade_esta_escondida(self, entidade):
         """Verificar se uma entidade está escondida em algum arbusto"""
-        for arbusto in self.arbustos:
-            if arbusto.entidade_esta_escondida(entidade):
-                return True
-        return False
+        return getattr(entidade, 'arbusto_id', SEM_ARBUSTO) != SEM_ARBUSTO
 
     def pode_ver_entidade(self, observador, alvo):
         """Verificar se o observador pode ver o alvo (considerando arbustos)"""
@@ -328,8 +433,18 @@ class GerenciadorArbustos:
         return True  # Pode ver normalmente se não estiver escondido
 
     def obter_cobertura_para_posicao(self, x, y):
-        """Obter nível de cobertura para uma posição específica"""
-        for arbusto in self.arbustos:
+        """
+        Obter nível de cobertura para uma posição específica.
+        A posição precisa estar dentro do retângulo do arbusto (sem
+        MARGEM_COBERTURA_ARBUSTO). A grade só descarta os pontos longe de
+        todo arbusto: como a margem é maior que meia célula, qualquer ponto
+        dentro de um retângulo cai numa célula marcada, e os arbustos
+        anteriores ao id da célula não contêm o ponto.
+        """
+        id_arbusto = self.arbusto_na_posicao(x, y)
+        if id_arbusto == SEM_ARBUSTO:
+            return 0.0
+        for arbusto in self.lista_arbustos[id_arbusto:]:
             if arbusto.rect.collidepoint(x, y):
                 return arbusto.densidade
         return 0.0
@@ -350,14 +465,12 @@ class GerenciadorArbustos:
 
     def limpar_arbustos(self):
         """Limpar todos os arbustos"""
-        self.arbustos.clear()
+        self.arbustos.empty()
+        self._reconstruir_grade()
 
     def entidade_esta_em_arbusto(self, entidade):
         """Verificar se uma entidade específica está dentro de algum arbusto"""
-        for arbusto in self.arbustos:
-            if entidade in arbusto.entidades_dentro:
-                return True
-        return False
+        return getattr(entidade, 'arbusto_id', SEM_ARBUSTO) != SEM_ARBUSTO
 
     def desenhar(self, screen):
         """Método de conveniência para desenhar (compatibilidade com game.py)"""
@@ -0,0 +1,74 @@
+"""
+Cache em disco dos sons procedurais do Brawl Stars Clone.
+Cada som sintetizado é gravado como .npy (int16, no formato do mixer) em
+PASTA_CACHE_AUDIO, com o nome igual à chave de src.sintese_audio.chave_som
+(hash do gerador, parâmetros, taxa de amostragem, canais e versão da
+síntese). Nas execuções seguintes o arquivo é aberto com mmap, sem
+sintetizar nada. Mudar um parâmetro muda a chave: entradas antigas apenas
+deixam de ser usadas.
+"""
+
+import os
+import numpy as np
+from src.config import PASTA_CACHE_AUDIO
+
+
+class CacheAudio:
+    """
+    Buffers de áudio endereçados pelo conteúdo.
+    Attributes:
+        pasta (str): Diretório dos arquivos .npy
+        acertos (int): Sons lidos do cache
+        faltas (int): Sons que precisaram ser sintetizados
+    """
+
+    def __init__(self, pasta=PASTA_CACHE_AUDIO):
+        self.pasta = pasta
+        self.acertos = 0
+        self.faltas = 0
+
+    def caminho(self, chave):
+        """Arquivo de uma entrada"""
+        return os.path.join(self.pasta, f"{chave}.npy")
+
+    def carregar(self, chave):
+        """
+        Abrir uma entrada com mmap.
+        Args:
+            chave: Chave do som
+        Returns:
+            Array int16 somente leitura, ou None se a entrada não existe ou está corrompida
+        """
+        try:
+            buffer = np.load(self.caminho(chave), mmap_mode='r', allow_pickle=False)
+        except (OSError, ValueError):
+            self.faltas += 1
+            return None
+        if buffer.dtype != np.int16 or not buffer.flags['C_CONTIGUOUS']:
+            self.faltas += 1
+            return None
+        self.acertos += 1
+        return buffer
+
+    def salvar(self, chave, buffer):
+        """
+        Gravar uma entrada (arquivo temporário + rename: leitores nunca veem um arquivo pela metade).
+        Args:
+            chave: Chave do som
+            buffer: Array int16 contíguo
+        Returns:
+            True se gravou
+        """
+        destino = self.caminho(chave)
+        temporario = f"{destino}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.pasta, exist_ok=True)
+            with open(temporario, 'wb') as f:
+                np.save(f, buffer, allow_pickle=False)
+            os.replace(temporario, destino)
+        except OSError as e:
+            print(f"Erro ao salvar som no cache: {e}")
+            if os.path.exists(temporario):
+                os.remove(temporario)
+            return False
+        return True
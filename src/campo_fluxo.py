@@ -0,0 +1,151 @@
+"""
+Campo de fluxo (flow field) compartilhado para navegação dos inimigos.
+Este módulo calcula uma única busca em largura a partir da célula do jogador
+sobre a grade de obstáculos. Cada inimigo apenas consulta a direção da célula
+em que está, então o custo de navegação não cresce com o número de inimigos.
+O campo só é recalculado quando o jogador muda de célula ou a grade muda
+(obstáculo destrutível removido).
+"""
+
+import math
+from collections import deque
+from src.grade_obstaculos import GradeObstaculos
+
+# Distância das células não alcançáveis a partir do jogador
+INALCANCAVEL = -1
+
+# Vizinhança 8-conectada (dcol, dlin)
+_VIZINHOS = ((1, 0), (-1, 0), (0, 1), (0, -1),
+             (1, 1), (1, -1), (-1, 1), (-1, -1))
+_DIAGONAL = 1 / math.sqrt(2)
+
+
+class CampoFluxo:
+    """
+    Campo de distâncias até o jogador e direções de descida por célula.
+    Attributes:
+        grade (GradeObstaculos): Grade de navegação (obstáculos expandidos pela hitbox)
+        distancias (list): Passos até a célula do jogador (INALCANCAVEL se isolada)
+        recalculos (int): Quantas vezes a busca foi executada
+    """
+
+    def __init__(self, grade: GradeObstaculos):
+        self.grade = grade
+        self.distancias = [INALCANCAVEL] * grade.total_celulas
+        # Direções calculadas sob demanda e reaproveitadas até o próximo recálculo
+        self.direcoes = [None] * grade.total_celulas
+        self.celula_alvo = None
+        self.versao_grade = None
+        self.desatualizado = False
+        self.recalculos = 0
+
+    def atualizar(self, x, y):
+        """
+        Marcar o campo para recálculo se o alvo mudou de célula ou a grade mudou.
+        A busca só roda na próxima consulta de direção, então quadros em que
+        nenhum inimigo precisa contornar paredes não pagam pelo recálculo.
+        Args:
+            x: Posição X do alvo (jogador)
+            y: Posição Y do alvo (jogador)
+        Returns:
+            True se o campo ficou desatualizado
+        """
+        celula = self.grade.indice_da_posicao(x, y)
+        if celula == self.celula_alvo and self.versao_grade == self.grade.versao:
+            return False
+
+        self.celula_alvo = celula
+        self.versao_grade = self.grade.versao
+        self.desatualizado = True
+        return True
+
+    def _calcular(self, origem):
+        """Busca em largura 8-conectada a partir da célula do alvo"""
+        self.recalculos += 1
+        self.desatualizado = False
+        grade = self.grade
+        colunas = grade.colunas
+        linhas = grade.linhas
+        celulas = grade.celulas
+        distancias = [INALCANCAVEL] * grade.total_celulas
+        self.direcoes = [None] * grade.total_celulas
+
+        # A célula do jogador é sempre a raiz, mesmo se encostada em um obstáculo
+        distancias[origem] = 0
+        fila = deque((origem,))
+        while fila:
+            atual = fila.popleft()
+            proxima_distancia = distancias[atual] + 1
+            coluna = atual % colunas
+            linha = atual // colunas
+            for dcol, dlin in _VIZINHOS:
+                ncol = coluna + dcol
+                nlin = linha + dlin
+                if not (0 <= ncol < colunas and 0 <= nlin < linhas):
+                    continue
+                vizinho = nlin * colunas + ncol
+                if celulas[vizinho] or distancias[vizinho] != INALCANCAVEL:
+                    continue
+                # Diagonais não podem cortar a quina de um obstáculo
+                if dcol and dlin and (celulas[linha * colunas + ncol] or celulas[nlin * colunas + coluna]):
+                    continue
+                distancias[vizinho] = proxima_distancia
+                fila.append(vizinho)
+
+        self.distancias = distancias
+
+    def distancia_em(self, x, y):
+        """Obter a distância (em células) de uma posição até o jogador"""
+        if self.desatualizado:
+            self._calcular(self.celula_alvo)
+        return self.distancias[self.grade.indice_da_posicao(x, y)]
+
+    def direcao_em(self, x, y):
+        """
+        Obter a direção normalizada a seguir a partir de uma posição.
+        Args:
+            x: Posição X de quem navega
+            y: Posição Y de quem navega
+        Returns:
+            Tupla (dx, dy) unitária, ou None se não há caminho até o jogador
+        """
+        if self.celula_alvo is None:
+            return None
+        if self.desatualizado:
+            self._calcular(self.celula_alvo)
+        indice = self.grade.indice_da_posicao(x, y)
+        direcao = self.direcoes[indice]
+        if direcao is None:
+            direcao = self._direcao_celula(indice)
+            self.direcoes[indice] = direcao
+        return direcao or None
+
+    def _direcao_celula(self, indice):
+        """Escolher o vizinho de menor distância (vazio se não houver caminho)"""
+        grade = self.grade
+        colunas = grade.colunas
+        celulas = grade.celulas
+        distancias = self.distancias
+        coluna = indice % colunas
+        linha = indice // colunas
+
+        # Células bloqueadas (inimigo encostado na margem) também descem pelos vizinhos
+        melhor = distancias[indice]
+        if melhor == 0:
+            return ()
+        if melhor == INALCANCAVEL:
+            melhor = math.inf
+        melhor_direcao = ()
+        for dcol, dlin in _VIZINHOS:
+            ncol = coluna + dcol
+            nlin = linha + dlin
+            if not (0 <= ncol < grade.colunas and 0 <= nlin < grade.linhas):
+                continue
+            distancia = distancias[nlin * colunas + ncol]
+            if distancia == INALCANCAVEL or distancia >= melhor:
+                continue
+            if dcol and dlin and (celulas[linha * colunas + ncol] or celulas[nlin * colunas + coluna]):
+                continue
+            melhor = distancia
+            melhor_direcao = (dcol * _DIAGONAL, dlin * _DIAGONAL) if dcol and dlin else (dcol, dlin)
+        return melhor_direcao
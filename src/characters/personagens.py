@@ -6,12 +6,12 @@ possui mecânicas distintas que afetam o gameplay e estratégia.
 """
 
 import math
-import random
 import pygame
 from src.config import TAMANHO_JOGADOR, VELOCIDADE_JOGADOR, COOLDOWN_TIRO
 from src.sprite_renderer import SpriteRenderer
 from src.renderer_3d import renderer_3d  # pylint: disable=import-error
 from src.pygame_constants import SRCALPHA
+from src.aleatoriedade import aleatorio_visual
 
 
 class PersonagemBase:
@@ -142,8 +142,8 @@ class PersonagemBase:
     def _desenhar_particulas_movimento(self, superficie, pos, tempo_jogo):  # pylint: disable=unused-argument
         """Desenha partículas de movimento atrás do personagem"""
         for i in range(3):
-            offset_x = -15 - i * 8 + random.randint(-3, 3)
-            offset_y = random.randint(-5, 5)
+            offset_x = -15 - i * 8 + aleatorio_visual.randint(-3, 3)
+            offset_y = aleatorio_visual.randint(-5, 5)
             particula_pos = (pos[0] + offset_x, pos[1] + offset_y)
             alpha = 100 - i * 30
             tamanho = 3 - i
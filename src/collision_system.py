@@ -5,6 +5,7 @@ reduzindo a criação/destruição frequente de objetos e melhorando a performan
 """
 
 from typing import List, Optional
+import pygame
 from src.bullet import Bullet
 from src.quadtree import QuadTree
 
@@ -179,6 +180,16 @@ class CollisionOptimizer:
         """
         return self.quadtree.retrieve(sprite)
 
+    def get_sweep_candidates(self, area: pygame.Rect) -> List:
+        """
+        Obter candidatos de colisão para uma área varrida (trajeto completo de um projétil).
+        Args:
+            area: Retângulo que envolve o trajeto do quadro
+        Returns:
+            Lista de sprites que podem colidir
+        """
+        return self.quadtree.retrieve_area(area)
+
     def broad_phase_collision(self, group1, group2) -> List:
         """
         Fase ampla de detecção de colisão.
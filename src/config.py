@@ -11,6 +11,40 @@ SCREEN_HEIGHT = 720
 FPS = 60
 TITLE = "Brawl Stars Clone"
 
+# Simulação em passo fixo (independente da taxa de renderização)
+TAXA_SIMULACAO = 60  # Passos de simulação por segundo (Hz)
+MAX_PASSOS_SIMULACAO = 5  # Limite de passos por quadro (evita a espiral da morte)
+DISTANCIA_MAXIMA_INTERPOLACAO = 100  # Deslocamentos maiores (teleporte/respawn) não são interpolados
+
+# Modo headless (simulação sem tela)
+TEMPO_MAXIMO_PARTIDA_HEADLESS = 180.0  # Segundos simulados antes de encerrar a partida sem vitória
+
+# Gravação e reprodução de partidas
+PASTA_REPLAYS = "replays"  # Pasta das gravações feitas com --gravar
+
+# Persistência da progressão (gravação em segundo plano)
+ARQUIVO_PROGRESSAO = "progressao.json"  # Save dos Brawlers
+ATRASO_GRAVACAO_PROGRESSAO = 0.5  # Segundos de espera que juntam pedidos de gravação seguidos
+
+# Histórico de partidas (SQLite, só inserções)
+ARQUIVO_HISTORICO_PARTIDAS = "historico_partidas.db"  # Banco com uma linha por partida
+TAMANHO_LOTE_HISTORICO = 64  # Partidas acumuladas em memória antes de uma transação de inserção
+PARTIDAS_RECENTES_HISTORICO = 8  # Partidas listadas na aba de histórico do Brawler
+ESPERA_HISTORICO_APOS_ERRO = 5.0  # Segundos sem tocar no banco depois de uma falha (consultas usam a memória)
+
+# Perfilador de quadros (overlay F7, exportação CSV F8)
+CAPACIDADE_PERFIL_QUADROS = 600  # Quadros guardados no buffer circular (10 s a 60 FPS)
+PASTA_PERFIS = "perfis"  # Pasta dos CSVs e rastros exportados
+
+# Rastreamento trace_event (F9 ou --rastrear[=segundos])
+DURACAO_RASTREAMENTO = 5.0  # Segundos gravados por janela de rastreamento
+MAX_EVENTOS_RASTREAMENTO = 200000  # Limite de eventos por janela (protege a memória)
+
+# Monitor de ritmo de quadros (percentis por estado e engasgos)
+LIMIAR_ENGASGO = 2.0  # Quadros acima deste múltiplo do alvo (1/FPS) são engasgos
+PRECISAO_HISTOGRAMA_QUADROS = 0.01  # Erro relativo máximo dos percentis (1%)
+MAX_ENGASGOS_REGISTRADOS = 100  # Engasgos mais recentes guardados no resumo
+
 # Cores
 COR_FUNDO = (34, 139, 34)  # Verde escuro
 COR_OBSTACULO = (139, 69, 19)  # Marrom
@@ -45,6 +79,9 @@ QUANTIDADE_OBSTACULOS = 20
 VIDA_OBSTACULO_DESTRUTIVEL_MIN = 80
 VIDA_OBSTACULO_DESTRUTIVEL_MAX = 120
 PONTOS_DESTRUIR_OBSTACULO = 10
+TAMANHO_CELULA_OBSTACULOS = 20  # Resolução (pixels) da grade de obstáculos (visão e navegação)
+MARGEM_NAVEGACAO_INIMIGOS = 15  # Folga (pixels) em volta dos obstáculos na grade de navegação
+TAMANHO_CELULA_ARBUSTOS = 4  # Resolução (pixels) da grade de cobertura dos arbustos
 
 # Configurações dos power-ups
 TAMANHO_POWER_UP = 20
@@ -60,6 +97,11 @@ MULTIPLICADOR_TIRO_POR_NIVEL = 1.15  # Aumento de 15% na frequência de tiro por
 INIMIGOS_ADICIONAIS_POR_NIVEL = 1  # +1 inimigo a cada 2 níveis
 NIVEL_MAXIMO = 20  # Nível máximo para balanceamento
 
+# Escalonador de IA dos inimigos (nível de detalhe)
+RAIO_IA_PROXIMO = 400  # Inimigos até esta distância do jogador pensam em todo quadro
+INTERVALOS_PENSAMENTO_IA = (0.0, 0.1, 0.25)  # Segundos entre decisões: próximo, médio, patrulha
+ORCAMENTO_IA_MS = 2.0  # Tempo máximo por quadro para decisões da IA
+
 # Configurações das gemas (Gem Grab)
 TAMANHO_GEMA = 15  # Tamanho da gema
 COR_GEMA = (128, 0, 128)  # Roxo - cor característica das gemas
@@ -91,3 +133,25 @@ VOLUME_MUSIC = 0.5   # Volume da música de fundo
 AUDIO_FREQUENCY = 22050  # Frequência de amostragem
 AUDIO_BUFFER_SIZE = 512  # Tamanho do buffer de áudio
 AUDIO_CHANNELS = 2       # Número de canais (mono=1, stereo=2)
+PASTA_CACHE_AUDIO = "cache_audio"  # Sons procedurais já sintetizados (.npy por chave de conteúdo)
+VARIANTES_POR_SOM = 4  # Variantes de tom/filtro dos sons de combate (sorteadas a cada toque)
+DESVIO_TOM_VARIANTES = 0.08  # Variação máxima de tom entre as variantes (±8%)
+TRABALHADORES_SINTESE_AUDIO = 4  # Threads que sintetizam o banco de sons (limitado aos núcleos)
+
+# Gerenciador de vozes (pedidos de som juntados e despachados uma vez por quadro)
+CANAIS_MIXER = 16  # Vozes simultâneas
+GANHO_COALESCENCIA_SONS = 0.25  # Ganho por duplicação de pedidos iguais no mesmo quadro
+PRIORIDADES_SONS = {  # Maior prioridade rouba o canal de vozes menos importantes
+    'ui': 4, 'habilidades': 3, 'power_ups': 3, 'impactos': 2, 'tiros': 1, 'ambiente': 0, 'padrao': 2
+}
+PREFIXOS_CATEGORIA_SOM = (  # Categoria dos sons tocados sem canal explícito
+    ('ui_', 'ui'), ('super', 'habilidades'), ('habilidade', 'habilidades'), ('powerup', 'power_ups'),
+    ('impacto', 'impactos'), ('explosao', 'impactos'), ('tiro', 'tiros'), ('ambiente', 'ambiente'),
+)
+
+# Áudio posicional (pan e atenuação em relação ao jogador, por tabelas)
+DISTANCIA_REFERENCIA_AUDIO = 150  # Até esta distância (px) o som toca no volume cheio
+DISTANCIA_MAXIMA_AUDIO = 1000  # A partir desta distância o som é inaudível
+LARGURA_PAN_AUDIO = 640  # Deslocamento horizontal (px) que leva o som todo para um lado
+RESOLUCAO_TABELAS_AUDIO = 257  # Entradas das tabelas de pan e atenuação (ímpar: o centro tem entrada própria)
+LIMIAR_AUDIVEL = 0.02  # Volume final abaixo do qual o som nem ocupa uma voz
@@ -6,9 +6,11 @@ outros efeitos que tornam o gameplay mais dinâmico e visualmente atrativo.
 """
 
 import math
-import random
 import pygame
 from src.pygame_constants import SRCALPHA
+from src.aleatoriedade import aleatorio_visual
+from src.rastreamento import rastreador_eventos
+from src.inicializacao import SingletonPreguicoso
 
 class EfeitoVisual(pygame.sprite.Sprite):
     """Classe base para efeitos visuais"""
@@ -49,6 +51,7 @@ class EfeitoExplosao(EfeitoVisual):
         self.cor = cor
         self.tamanho_max = tamanho_max
         self.tamanho_atual = 0
+        rastreador_eventos.instante('explosao', 'efeitos', {'tamanho': tamanho_max})
 
         # Criar surface inicial
         self.image = pygame.Surface((tamanho_max * 2, tamanho_max * 2), SRCALPHA)
@@ -83,15 +86,15 @@ class EfeitoParticulas(EfeitoVisual):
 
         # Criar partículas
         for _ in range(quantidade):
-            angulo = random.uniform(0, 2 * math.pi)
-            velocidade = random.uniform(50, 150)
+            angulo = aleatorio_visual.uniform(0, 2 * math.pi)
+            velocidade = aleatorio_visual.uniform(50, 150)
             self.particulas.append({
                 'x': 0,
                 'y': 0,
                 'vx': math.cos(angulo) * velocidade,
                 'vy': math.sin(angulo) * velocidade,
-                'vida': random.uniform(0.5, duracao),
-                'tamanho': random.randint(2, 6)
+                'vida': aleatorio_visual.uniform(0.5, duracao),
+                'tamanho': aleatorio_visual.randint(2, 6)
             })
 
         # Criar surface
@@ -201,8 +204,8 @@ class EfeitoRaio(EfeitoVisual):
         # Adicionar linhas de energia (efeito tremulante)
         if progresso > 0.3:
             for _ in range(3):
-                offset_x = random.randint(-2, 2)
-                offset_y = random.randint(-2, 2)
+                offset_x = aleatorio_visual.randint(-2, 2)
+                offset_y = aleatorio_visual.randint(-2, 2)
                 start_tremulo = (start_pos[0] + offset_x, start_pos[1] + offset_y)
                 end_tremulo = (end_pos[0] + offset_x, end_pos[1] + offset_y)
                 pygame.draw.line(self.image, cor_com_alpha, start_tremulo, end_tremulo, 2)
@@ -503,7 +506,7 @@ class EfeitoColetaGema(EfeitoVisual):
         """Criar partículas em todas as direções"""
         for i in range(self.num_particulas):
             angulo = (2 * math.pi * i) / self.num_particulas
-            velocidade = random.uniform(100, 200)
+            velocidade = aleatorio_visual.uniform(100, 200)
 
             vel_x = math.cos(angulo) * velocidade
             vel_y = math.sin(angulo) * velocidade - 50  # Bias para cima
@@ -515,12 +518,12 @@ class EfeitoColetaGema(EfeitoVisual):
                 (100, 255, 255),  # Ciano
                 (0, 200, 255),    # Azul brilhante
             ]
-            cor = random.choice(cores)
+            cor = aleatorio_visual.choice(cores)
 
             particula = ParticulaGema(
-                self.pos_x + random.uniform(-5, 5),
-                self.pos_y + random.uniform(-5, 5),
-                vel_x, vel_y, cor, random.randint(3, 6)
+                self.pos_x + aleatorio_visual.uniform(-5, 5),
+                self.pos_y + aleatorio_visual.uniform(-5, 5),
+                vel_x, vel_y, cor, aleatorio_visual.randint(3, 6)
             )
 
             # Adicionar ao gerenciador de efeitos
@@ -713,8 +716,8 @@ class EfeitoScreenShake:
         intensidade_atual = self.intensidade * progresso
 
         # Gerar offsets aleatórios
-        self.offset_x = random.randint(-int(intensidade_atual), int(intensidade_atual))
-        self.offset_y = random.randint(-int(intensidade_atual), int(intensidade_atual))
+        self.offset_x = aleatorio_visual.randint(-int(intensidade_atual), int(intensidade_atual))
+        self.offset_y = aleatorio_visual.randint(-int(intensidade_atual), int(intensidade_atual))
         self.tempo_restante -= dt
 
     def obter_offset(self):
@@ -755,7 +758,7 @@ class EfeitoNumeroFlutuante(EfeitoVisual):
         self.valor = valor
         self.tipo = tipo
         self.velocidade_y = -50  # Velocidade inicial para cima
-        self.velocidade_x = random.randint(-20, 20)  # Movimento lateral aleatório
+        self.velocidade_x = aleatorio_visual.randint(-20, 20)  # Movimento lateral aleatório
 
         # Definir cor baseada no tipo
         cores = {
@@ -868,5 +871,5 @@ class EfeitoAnimacaoGema(EfeitoVisual):
             pygame.draw.line(self.image, (*self.cor_gema, self.alpha//2),
                            centro, (int(end_x), int(end_y)), 2)
 
-# Instância global do gerenciador de efeitos
-gerenciador_efeitos = GerenciadorEfeitos()
+# Instância global do gerenciador de efeitos (construída no primeiro uso)
+gerenciador_efeitos = SingletonPreguicoso('gerenciador_efeitos', GerenciadorEfeitos)
@@ -0,0 +1,115 @@
+"""
+Escalonador de nível de detalhe (LOD) da IA dos inimigos.
+Este módulo decide quais inimigos "pensam" em cada quadro: os próximos do
+jogador a cada quadro, os distantes e os em patrulha com frequência reduzida.
+As decisões caras (comportamento, linha de visão e campo de fluxo) são
+distribuídas entre quadros dentro de um orçamento fixo em milissegundos; a
+integração do movimento continua acontecendo em todo quadro.
+"""
+
+import time
+import numpy as np
+from src.config import RAIO_IA_PROXIMO, INTERVALOS_PENSAMENTO_IA, ORCAMENTO_IA_MS
+
+# Níveis de detalhe da IA
+NIVEL_PROXIMO = 0
+NIVEL_MEDIO = 1
+NIVEL_DISTANTE = 2
+NOMES_NIVEIS = ('proximo', 'medio', 'distante')
+
+
+class EscalonadorIA:
+    """
+    Seleciona e fatia os inimigos que devem tomar decisões no quadro.
+    Attributes:
+        intervalos (np.ndarray): Segundos entre decisões por nível
+        orcamento_ms (float): Tempo máximo por quadro para decisões (None: sem limite)
+        contagem_niveis (list): Inimigos em cada nível no último quadro
+        estouros_orcamento (int): Quadros em que o orçamento acabou com decisões pendentes
+        adiados (int): Decisões adiadas para o próximo quadro no último quadro
+    """
+
+    def __init__(self, intervalos=INTERVALOS_PENSAMENTO_IA, orcamento_ms=ORCAMENTO_IA_MS,
+                 raio_proximo=RAIO_IA_PROXIMO, tamanho_fatia=32):
+        self.intervalos = np.asarray(intervalos, dtype=np.float64)
+        self.orcamento_ms = orcamento_ms
+        self.raio_proximo = raio_proximo
+        self.tamanho_fatia = tamanho_fatia
+
+        # Estatísticas
+        self.contagem_niveis = [0] * len(NOMES_NIVEIS)
+        self.pensamentos = 0
+        self.adiados = 0
+        self.estouros_orcamento = 0
+        self.tempo_ms = 0.0
+
+    def classificar(self, niveis, esperas, distancias, em_patrulha, dt):
+        """
+        Atribuir o nível de cada inimigo e listar quem deve pensar agora.
+        Args:
+            niveis: Array de níveis (atualizado no lugar)
+            esperas: Array de tempo até a próxima decisão (atualizado no lugar)
+            distancias: Distância de cada inimigo até o jogador
+            em_patrulha: Máscara dos inimigos patrulhando na última decisão
+            dt: Delta time em segundos
+        Returns:
+            Índices dos inimigos com decisão pendente, mais urgentes primeiro
+        """
+        niveis[:] = np.where(distancias <= self.raio_proximo, NIVEL_PROXIMO,
+                             np.where(em_patrulha, NIVEL_DISTANTE, NIVEL_MEDIO))
+        esperas -= dt
+        self.contagem_niveis = np.bincount(
+            niveis.astype(np.int64), minlength=len(NOMES_NIVEIS)
+        ).tolist()
+
+        pendentes = np.flatnonzero(esperas <= 0)
+        # Prioridade: nível mais próximo e, dentro do nível, o mais atrasado
+        ordem = np.lexsort((esperas[pendentes], niveis[pendentes]))
+        return pendentes[ordem]
+
+    def fatias(self, pendentes):
+        """
+        Entregar os pendentes em fatias até o orçamento do quadro acabar.
+        A primeira fatia é sempre entregue para garantir progresso.
+        Args:
+            pendentes: Índices retornados por classificar
+        Yields:
+            Arrays de índices a processar
+        """
+        self.pensamentos = 0
+        self.adiados = 0
+        inicio = time.perf_counter()
+        # Sem orçamento todas as decisões rodam (resultado independe do relógio)
+        limite = self.orcamento_ms / 1000.0 if self.orcamento_ms is not None else None
+        total = len(pendentes)
+        for comeco in range(0, total, self.tamanho_fatia):
+            if comeco and limite is not None and time.perf_counter() - inicio > limite:
+                # Restantes continuam pendentes e ganham prioridade no próximo quadro
+                self.adiados = total - comeco
+                self.estouros_orcamento += 1
+                break
+            fatia = pendentes[comeco:comeco + self.tamanho_fatia]
+            self.pensamentos += len(fatia)
+            yield fatia
+        self.tempo_ms = (time.perf_counter() - inicio) * 1000.0
+
+    def reagendar(self, niveis, esperas, indices):
+        """Definir a espera até a próxima decisão dos inimigos que acabaram de pensar"""
+        esperas[indices] = self.intervalos[niveis[indices].astype(np.int64)]
+
+    def obter_estatisticas(self):
+        """
+        Obter estatísticas do escalonador.
+        Returns:
+            Dicionário com contagens por nível, decisões e estouros de orçamento
+        """
+        estatisticas = {f'nivel_{nome}': quantidade
+                        for nome, quantidade in zip(NOMES_NIVEIS, self.contagem_niveis)}
+        estatisticas.update({
+            'decisoes_quadro': self.pensamentos,
+            'decisoes_adiadas': self.adiados,
+            'estouros_orcamento': self.estouros_orcamento,
+            'tempo_decisoes_ms': round(self.tempo_ms, 3),
+            'orcamento_ms': self.orcamento_ms,
+        })
+        return estatisticas
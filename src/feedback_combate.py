@@ -6,9 +6,9 @@ de impacto e efeitos de luz dinâmicos durante confrontos.
 """
 
 import math
-import random
 import pygame
 from src.pygame_constants import SRCALPHA
+from src.aleatoriedade import aleatorio_visual
 
 class FeedbackCombate:
     """Gerenciador de feedback visual e tátil de combate"""
@@ -66,15 +66,15 @@ class FeedbackCombate:
         cores = cores_base.get(tipo, cores_base["normal"])
         for _ in range(quantidade):
             particula = {
-                'x': x + random.uniform(-5, 5),
-                'y': y + random.uniform(-5, 5),
-                'vel_x': random.uniform(-100, 100),
-                'vel_y': random.uniform(-100, -20),
-                'cor': random.choice(cores),
-                'tamanho': random.uniform(2, 6),
-                'vida': random.uniform(0.3, 0.8),
-                'vida_max': random.uniform(0.3, 0.8),
-                'gravidade': random.uniform(150, 300),
+                'x': x + aleatorio_visual.uniform(-5, 5),
+                'y': y + aleatorio_visual.uniform(-5, 5),
+                'vel_x': aleatorio_visual.uniform(-100, 100),
+                'vel_y': aleatorio_visual.uniform(-100, -20),
+                'cor': aleatorio_visual.choice(cores),
+                'tamanho': aleatorio_visual.uniform(2, 6),
+                'vida': aleatorio_visual.uniform(0.3, 0.8),
+                'vida_max': aleatorio_visual.uniform(0.3, 0.8),
+                'gravidade': aleatorio_visual.uniform(150, 300),
                 'tipo': tipo
             }
             particula['vida_max'] = particula['vida']
@@ -84,18 +84,18 @@ class FeedbackCombate:
         """Cria partículas de sangue (efeito estilizado, não gráfico)"""
         cores_sangue = [(139, 0, 0), (165, 42, 42), (128, 0, 0)]
         for _ in range(quantidade):
-            angulo = random.uniform(0, 2 * math.pi)
-            velocidade = random.uniform(50, 150)
+            angulo = aleatorio_visual.uniform(0, 2 * math.pi)
+            velocidade = aleatorio_visual.uniform(50, 150)
             particula = {
                 'x': x,
                 'y': y,
                 'vel_x': math.cos(angulo) * velocidade + direcao_x * 50,
                 'vel_y': math.sin(angulo) * velocidade + direcao_y * 50,
-                'cor': random.choice(cores_sangue),
-                'tamanho': random.uniform(1, 3),
-                'vida': random.uniform(0.5, 1.2),
-                'vida_max': random.uniform(0.5, 1.2),
-                'gravidade': random.uniform(100, 200)
+                'cor': aleatorio_visual.choice(cores_sangue),
+                'tamanho': aleatorio_visual.uniform(1, 3),
+                'vida': aleatorio_visual.uniform(0.5, 1.2),
+                'vida_max': aleatorio_visual.uniform(0.5, 1.2),
+                'gravidade': aleatorio_visual.uniform(100, 200)
             }
             particula['vida_max'] = particula['vida']
             self.particulas_sangue.append(particula)
@@ -170,8 +170,8 @@ class FeedbackCombate:
             else:
                 # Shake com decay exponencial
                 intensidade_atual = self.shake_intensidade * (1.0 - progresso)
-                self.shake_offset_x = random.uniform(-intensidade_atual, intensidade_atual)
-                self.shake_offset_y = random.uniform(-intensidade_atual, intensidade_atual)
+                self.shake_offset_x = aleatorio_visual.uniform(-intensidade_atual, intensidade_atual)
+                self.shake_offset_y = aleatorio_visual.uniform(-intensidade_atual, intensidade_atual)
         # Atualizar slow motion
         if self.slow_motion_ativo:
             self.slow_motion_tempo += dt_real
@@ -6,7 +6,6 @@ detecção de colisões e coordenação entre todos os componentes do jogo.
 É o núcleo que orquestra toda a experiência de gameplay.
 """
 
-import random
 import math
 import pygame
 
@@ -38,13 +37,26 @@ from src.config import (
     GEMAS_PARA_VITORIA, PONTOS_POR_GEMA, TEMPO_RESPAWN, VIDA_RESPAWN_PERCENTUAL,
     AREA_RESPAWN_MARGEM, DISTANCIA_MINIMA_INIMIGOS_RESPAWN,
     TEMPO_COUNTDOWN_VITORIA, COOLDOWN_TIRO, VIDA_OBSTACULO_DESTRUTIVEL_MIN,
-    VIDA_OBSTACULO_DESTRUTIVEL_MAX, PONTOS_DESTRUIR_OBSTACULO
+    VIDA_OBSTACULO_DESTRUTIVEL_MAX, PONTOS_DESTRUIR_OBSTACULO, MARGEM_NAVEGACAO_INIMIGOS,
+    ORCAMENTO_IA_MS
 )
 from src.collision_system import ProjectilePool, CollisionOptimizer
+from src.swept_collision import swept_segment_aabb, first_impact
 from src.bullet import Bullet
 from src.bushes import GerenciadorArbustos
+from src.grade_obstaculos import GradeObstaculos
+from src.visibilidade import ServicoVisibilidade
+from src.campo_fluxo import CampoFluxo
+from src.lote_inimigos import LoteInimigos
+from src.escalonador_ia import EscalonadorIA
+from src.passo_fixo import InterpoladorEstados
+from src.perfilador import perfilador_quadro
+from src.rastreamento import rastreador_eventos
 from src.ambiente_dinamico import GerenciadorAmbiente
-from src.achievement_system import SistemaConquistas, Conquista
+from src.achievement_system import sistema_conquistas
+from src.headless import modo_headless_ativo
+from src.replay import EstadoTeclas, gravacao_ativa, gravador_entrada
+from src.aleatoriedade import aleatorio_jogo, servico_aleatorio
 
 class Game:
     """
@@ -68,10 +80,19 @@ class Game:
     """
     def __init__(self, screen):
         self.screen = screen
+        # Modo headless: mesma lógica de gameplay sem renderização, áudio e UI
+        self.headless = modo_headless_ativo()
+        # Controlador externo (bot/roteiro) que substitui o input humano
+        self.controlador = None
+        # Teclas pressionadas reconstruídas dos eventos (reproduzíveis, ao contrário de get_pressed)
+        self.teclas = EstadoTeclas()
+        # Gravação das entradas para reprodução determinística (flag --gravar)
+        self.gravador = gravador_entrada if gravacao_ativa() else None
+        self.semente_partida = None
         # Estados: selecao_personagem, jogando, game_over, menu_audio
         self.estado = "selecao_personagem"
-        self.seletor_personagem = SeletorPersonagem(screen)
-        self.menu_audio = MenuAudio(screen)
+        self.seletor_personagem = None if self.headless else SeletorPersonagem(screen)
+        self.menu_audio = None if self.headless else MenuAudio(screen)
         self.personagem_selecionado = None
         self.feedback_combate = inicializar_feedback_combate(SCREEN_WIDTH, SCREEN_HEIGHT)
         self.jogo_ativo = True
@@ -95,16 +116,16 @@ class Game:
         # Sistema de respawn
         self.jogador_morto = False
         self.tempo_respawn_restante = 0.0
-        self.posicao_morte = None        # Sistema de conquistas
-        self.sistema_conquistas = SistemaConquistas()
+        self.posicao_morte = None        # Sistema de conquistas (global, também usado pelos menus)
+        self.sistema_conquistas = sistema_conquistas
+        self.super_usada_conquistas = 0  # Último valor de super_usada enviado às conquistas
 
         # Sistema de progressão - estatísticas da partida
-        self.tempo_inicio_partida = 0
+        self.tempo_partida = 0.0  # Segundos simulados (independente do relógio real)
         self.dano_total_causado = 0
         self.inimigos_eliminados = 0
         self.dano_total_recebido = 0
         self.resultado_progressao = None
-        self._inicializar_conquistas()
         # Tempo de jogo para animações 3D
         self.tempo_jogo = 0.0
         # Variável de debug para fonte (inicializada aqui para evitar definição fora do __init__)
@@ -122,30 +143,6 @@ class Game:
         self._inicializar_arbustos()
         self._inicializar_ambiente()
 
-    def _inicializar_conquistas(self):
-        """Define as conquistas disponíveis no jogo."""
-        self.sistema_conquistas.adicionar_conquista(
-            Conquista(
-                nome="Primeira Gema",
-                descricao="Colete sua primeira gema.",
-                criterio=lambda contexto: contexto['gemas_coletadas'] >= 1
-            )
-        )
-        self.sistema_conquistas.adicionar_conquista(
-            Conquista(
-                nome="Caçador de Inimigos",
-                descricao="Derrote 10 inimigos.",
-                criterio=lambda contexto: contexto['inimigos_derrotados'] >= 10
-            )
-        )
-        self.sistema_conquistas.adicionar_conquista(
-            Conquista(
-                nome="Super Usada",
-                descricao="Use sua habilidade especial pela primeira vez.",
-                criterio=lambda contexto: contexto['super_usada'] >= 1
-            )
-        )
-
     def _inicializar_grupos_sprites(self):
         """
         Inicializar todos os grupos de sprites do jogo.
@@ -179,9 +176,29 @@ class Game:
         # Inicializar pool de projéteis
         self.projectile_pool = ProjectilePool(size=300)
 
+        # Grade de obstáculos e serviço de linha de visão (IA e auto-aim)
+        self.grade_obstaculos = GradeObstaculos(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.servico_visibilidade = ServicoVisibilidade(self.grade_obstaculos)
+
+        # Grade de navegação (obstáculos expandidos pela hitbox) e campo de fluxo até o jogador
+        self.grade_navegacao = GradeObstaculos(SCREEN_WIDTH, SCREEN_HEIGHT, margem=MARGEM_NAVEGACAO_INIMIGOS)
+        self.campo_fluxo = CampoFluxo(self.grade_navegacao)
+
+        # Estado da IA de todos os inimigos em arrays (atualização vetorizada)
+        # com decisões fatiadas por nível de detalhe dentro de um orçamento por quadro.
+        # O orçamento depende do relógio real, então fica desligado quando a
+        # partida precisa ser reproduzível (headless ou gravação)
+        deterministico = self.headless or self.gravador is not None
+        self.escalonador_ia = EscalonadorIA(orcamento_ms=None if deterministico else ORCAMENTO_IA_MS)
+        self.lote_inimigos = LoteInimigos(self.servico_visibilidade, self.campo_fluxo, self.escalonador_ia)
+
+        # Posições do passo de simulação anterior para interpolar a renderização
+        self.interpolador = InterpoladorEstados()
+        self.fator_interpolacao = 1.0
+
     def _inicializar_componentes_ui(self):
         """Inicializar componentes de UI"""
-        self.ui = UI()
+        self.ui = None if self.headless else UI()
 
     def _inicializar_estado_jogo(self):
         """Inicializar estado do jogo"""
@@ -200,7 +217,8 @@ class Game:
     def _inicializar_audio(self):
         """Inicializar sistema de áudio"""
         self.inicializar_jogo()
-        gerenciador_audio.carregar_sons()
+        if not self.headless:
+            gerenciador_audio.carregar_sons()
 
     def _inicializar_arbustos(self):
         """Inicializar sistema de arbustos"""
@@ -208,6 +226,8 @@ class Game:
 
     def _inicializar_ambiente(self):
         """Inicializar sistema de ambiente dinâmico"""
+        if self.headless:
+            return  # Clima e iluminação são apenas visuais
         self.gerenciador_ambiente = GerenciadorAmbiente(SCREEN_WIDTH, SCREEN_HEIGHT)
 
     def inicializar_jogo(self):
@@ -216,6 +236,8 @@ class Game:
         self.todos_sprites.empty()
         self.jogadores.empty()
         self.inimigos.empty()
+        self.lote_inimigos.limpar()
+        self.interpolador.limpar()
         self.tiros.empty()
         self.obstaculos.empty()
         self.power_ups.empty()
@@ -241,7 +263,7 @@ class Game:
         self.posicao_morte = None
 
         # Resetar estatísticas da partida
-        self.tempo_inicio_partida = pygame.time.get_ticks()
+        self.tempo_partida = 0.0
         self.dano_total_causado = 0
         self.inimigos_eliminados = 0
         self.dano_total_recebido = 0
@@ -253,11 +275,31 @@ class Game:
         self.quantidade_inimigos_atual = QUANTIDADE_INIMIGOS_BASE
         self.multiplicador_tiro_atual = 1.0
 
-    def iniciar_partida(self, nome_personagem):
+    def reiniciar(self):
+        """
+        Preparar o jogo para ser reaproveitado (volta à seleção de personagem).
+        Usado pelo gerenciador de estados ao reentrar no jogo, no lugar de
+        construir outro Game (seletor, pools, sons, arbustos e ambiente).
+        """
+        self.inicializar_jogo()
+        self.estado = "selecao_personagem"
+        self.teclas.limpar()
+        self.gerenciador_gemas = None
+        self.gemas_coletadas = 0
+        self.vitoria_countdown_ativo = False
+        self.tempo_vitoria_restante = 0.0
+        self.vitoria_alcancada = False
+        self.resultado_progressao = None
+        if self.feedback_combate:
+            self.feedback_combate.limpar_efeitos()
+
+    def iniciar_partida(self, nome_personagem, semente=None):
         """
         Iniciar uma nova partida com o personagem selecionado.
         Args:
             nome_personagem (str): Nome do personagem escolhido pelo jogador
+            semente (int): Semente da partida (padrão: sorteada); repetir a
+                semente e as entradas repete a partida
         Esta função:
         - Limpa todos os sprites existentes
         - Cria novo jogador com personagem selecionado
@@ -265,6 +307,12 @@ class Game:
         - Altera estado para "jogando"
         - Inicia música de batalha
         """
+        # Ressemear a aleatoriedade antes de gerar qualquer elemento da partida
+        self.semente_partida = servico_aleatorio.reiniciar(semente)
+        if self.gravador:
+            self.gravador.iniciar(self, nome_personagem, self.semente_partida)
+        self.teclas.limpar()
+
         # Obter o objeto personagem pelo nome
         personagem = obter_personagem(nome_personagem)
         self.personagem_selecionado = personagem
@@ -273,17 +321,29 @@ class Game:
         self.todos_sprites.empty()
         self.jogadores.empty()
         self.inimigos.empty()
+        self.lote_inimigos.limpar()
+        self.interpolador.limpar()
         self.tiros.empty()
         self.obstaculos.empty()
         self.power_ups.empty()
+        self.projectile_pool.clear_all()
+        self.collision_optimizer.clear()
+
+        # Nova partida começa do nível 1 (também ao reiniciar com R)
+        self._inicializar_dificuldade()
 
         # Criar jogador com personagem selecionado
         self.jogador = Player(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, nome_personagem)
+        # O jogador novo começa com super_usada = 0: zerar o último valor enviado
+        # às conquistas, senão os supers da nova partida só contam após superar o antigo
+        self.super_usada_conquistas = 0
         self.todos_sprites.add(self.jogador)
         self.jogadores.add(self.jogador)
 
         # Criar elementos do jogo
         self.criar_obstaculos()
+        self.grade_obstaculos.reconstruir(self.obstaculos)
+        self.grade_navegacao.reconstruir(self.obstaculos)
         self.criar_inimigos()
         self.criar_power_ups()
 
@@ -308,6 +368,12 @@ class Game:
         self.tempo_respawn_restante = 0.0
         self.posicao_morte = None
 
+        # Resetar estatísticas da partida
+        self.tempo_partida = 0.0
+        self.dano_total_causado = 0
+        self.inimigos_eliminados = 0
+        self.dano_total_recebido = 0
+
         # Mudar estado
         self.estado = "jogando"
         self.jogo_ativo = True
@@ -332,11 +398,11 @@ class Game:
             tentativas = 0
 
             while not obstaculo_criado and tentativas < 100:
-                x = random.randint(
+                x = aleatorio_jogo.randint(
                     TAMANHO_OBSTACULO,
                     SCREEN_WIDTH - TAMANHO_OBSTACULO
                 )
-                y = random.randint(
+                y = aleatorio_jogo.randint(
                     TAMANHO_OBSTACULO,
                     SCREEN_HEIGHT - TAMANHO_OBSTACULO
                 )
@@ -356,7 +422,7 @@ class Game:
                 if distancia_jogador > 100 and posicao_valida:
                     # Determinar se é destrutível
                     destrutivel = i < obstaculos_destruteis
-                    vida_obstaculo = random.randint(VIDA_OBSTACULO_DESTRUTIVEL_MIN,
+                    vida_obstaculo = aleatorio_jogo.randint(VIDA_OBSTACULO_DESTRUTIVEL_MIN,
                                                   VIDA_OBSTACULO_DESTRUTIVEL_MAX) if destrutivel else 100
                     obstaculo = Obstacle(x, y, destrutivel, vida_obstaculo)
                     self.todos_sprites.add(obstaculo)
@@ -372,8 +438,8 @@ class Game:
             tentativas = 0
 
             while not inimigo_criado and tentativas < 100:
-                x = random.randint(50, SCREEN_WIDTH - 50)
-                y = random.randint(50, SCREEN_HEIGHT - 50)
+                x = aleatorio_jogo.randint(50, SCREEN_WIDTH - 50)
+                y = aleatorio_jogo.randint(50, SCREEN_HEIGHT - 50)
 
                 # Verificar se não está muito perto do jogador
                 distancia_jogador = self._calcular_distancia_jogador(x, y)
@@ -384,15 +450,30 @@ class Game:
                         self.velocidade_inimigos_atual,
                         self.multiplicador_tiro_atual
                     )
-                    # Definir referência do sistema de arbustos
-                    if hasattr(self, 'gerenciador_arbustos'):
-                        inimigo.gerenciador_arbustos = self.gerenciador_arbustos
-                    self.todos_sprites.add(inimigo)
-                    self.inimigos.add(inimigo)
+                    self.adicionar_inimigo(inimigo)
                     inimigo_criado = True
 
                 tentativas += 1
 
+    def adicionar_inimigo(self, inimigo):
+        """
+        Colocar um inimigo já construído na partida (sistemas compartilhados e grupos de sprites).
+        Args:
+            inimigo: Enemy criado para o jogador atual
+        """
+        self._vincular_sistemas_inimigo(inimigo)
+        self.todos_sprites.add(inimigo)
+        self.inimigos.add(inimigo)
+
+    def _vincular_sistemas_inimigo(self, inimigo):
+        """Definir as referências dos sistemas compartilhados usados pela IA do inimigo"""
+        # Sistema de arbustos
+        if hasattr(self, 'gerenciador_arbustos'):
+            inimigo.gerenciador_arbustos = self.gerenciador_arbustos
+        # Movimento, cooldowns e tiros passam a ser calculados em lote
+        self.lote_inimigos.adicionar(inimigo)
+        rastreador_eventos.instante('spawn_inimigo', 'jogo', {'x': int(inimigo.pos_x), 'y': int(inimigo.pos_y)})
+
     def _verificar_colisao_power_up_obstaculos(self, x, y):
         """Verificar se posição do power-up colide com obstáculos"""
         temp_rect = pygame.Rect(
@@ -414,11 +495,11 @@ class Game:
             tentativas = 0
 
             while not power_up_criado and tentativas < 100:
-                x = random.randint(
+                x = aleatorio_jogo.randint(
                     TAMANHO_POWER_UP,
                     SCREEN_WIDTH - TAMANHO_POWER_UP
                 )
-                y = random.randint(
+                y = aleatorio_jogo.randint(
                     TAMANHO_POWER_UP,
                     SCREEN_HEIGHT - TAMANHO_POWER_UP
                 )
@@ -483,6 +564,7 @@ class Game:
 
     def handle_game_event(self, event):
         """Gerenciar eventos do estado geral do jogo"""
+        self.teclas.processar_evento(event)
         if self.estado == "selecao_personagem":
             resultado = self.seletor_personagem.handle_selection_event(event)
             if resultado == "voltar":
@@ -502,6 +584,8 @@ class Game:
             return True
 
         elif self.estado == "jogando":
+            if self.gravador:
+                self.gravador.registrar_evento(event)
             if event.type == KEYDOWN:
                 if event.key == K_ESCAPE:
                     self.estado = "selecao_personagem"  # Voltar para seleção
@@ -509,7 +593,7 @@ class Game:
                 if event.key == K_R and not self.jogo_ativo: # Reiniciar com mesmo personagem
                     if self.personagem_selecionado:
                         # Processar progressão como derrota antes de reiniciar
-                        if hasattr(self, 'tempo_inicio_partida'):
+                        if hasattr(self, 'tempo_partida'):
                             self._processar_progressao_fim_partida(False)
                         self.iniciar_partida(self.personagem_selecionado)
                         return True
@@ -540,12 +624,11 @@ class Game:
 
             # Processar input contínuo para debug
             if hasattr(self, 'gerenciador_ambiente') and self.gerenciador_ambiente.debug_ativo:
-                teclas = pygame.key.get_pressed()
-                self.gerenciador_ambiente.processar_input_debug(teclas)
+                self.gerenciador_ambiente.processar_input_debug(self.teclas)
 
             if self.jogo_ativo and self.jogador and not self.jogador_morto:
                 # Processar eventos de controles virtuais
-                resultado_touch = self.ui.processar_evento_touch(event)
+                resultado_touch = self.ui.processar_evento_touch(event) if self.ui else None
                 if resultado_touch == 'attack_press':
                     # Disparar usando botão de ataque virtual
                     self.jogador.atirar_botao_virtual(self.tiros, self.todos_sprites, self)
@@ -577,6 +660,9 @@ class Game:
 
     def update(self, dt):
         """Atualizar lógica do jogo"""
+        if self.gravador and self.estado == "jogando":
+            self.gravador.registrar_passo(dt)
+
         # Atualizar tempo de jogo para animações 3D
         self.tempo_jogo += dt
 
@@ -600,47 +686,96 @@ class Game:
         if not self.jogador:
             return
 
+        self.tempo_partida += dt
+
+        # Guardar o estado anterior ao passo para a interpolação da renderização
+        self.interpolador.capturar(self._entidades_interpoladas())
+
         # Atualizar sistema de partículas 3D
-        sistema_particulas_3d.update(dt)
+        with perfilador_quadro.secao('particulas'):
+            sistema_particulas_3d.update(dt)
+        with perfilador_quadro.secao('ia'):
+            self._atualizar_linha_de_visao()
         self._atualizar_sprites(dt)
-        self._atualizar_sistema_gemas(dt)
-        self._verificar_nivel_e_respawn()
-        self._processar_colisoes_tiros()
-
-        # Só processar colisões do jogador se ele não estiver morto
+        # Supers são contados pelo jogador: só avisa as conquistas quando o contador muda
+        if self.jogador.super_usada != self.super_usada_conquistas:
+            self.super_usada_conquistas = self.jogador.super_usada
+            self.atualizar_estatistica_conquistas('super_usada', self.super_usada_conquistas)
+        # O jogador é o ouvinte dos sons posicionais (fica no lugar da morte até o respawn)
         if not self.jogador_morto:
-            self._processar_colisoes_jogador(dt)
+            gerenciador_audio.definir_ouvinte(*self.jogador.rect.center)
+        with perfilador_quadro.secao('gemas'):
+            self._atualizar_sistema_gemas(dt)
+            self._verificar_nivel_e_respawn()
+
+        with perfilador_quadro.secao('colisoes'):
+            self._processar_colisoes_tiros()
+            # Só processar colisões do jogador se ele não estiver morto
+            if not self.jogador_morto:
+                self._processar_colisoes_jogador(dt)
+            self._descartar_tiros_bloqueados()
+
+        self._verificar_game_over(dt)
+        with perfilador_quadro.secao('ia'):
+            self._fazer_inimigos_atirarem(dt)
+        with perfilador_quadro.secao('gemas'):
+            # Verificar vitória por gemas
+            self._verificar_vitoria_gemas()
+            # Processar countdown de vitória se ativo
+            self._processar_countdown_vitoria(dt)
+
+    def _entidades_interpoladas(self):
+        """Listar as entidades móveis desenhadas com interpolação entre passos"""
+        entidades = list(self.inimigos)
+        entidades.extend(self.tiros)
+        if not self.jogador_morto:
+            entidades.append(self.jogador)
+        return entidades
 
-        self._verificar_game_over()
-        self._fazer_inimigos_atirarem(dt)        # Verificar vitória por gemas
-        self._verificar_vitoria_gemas()
-        # Processar countdown de vitória se ativo
-        self._processar_countdown_vitoria()
+    def _atualizar_linha_de_visao(self):
+        """Iniciar o quadro do serviço de visão e atualizar o campo de fluxo"""
+        # A linha de visão dos inimigos é respondida em lote por LoteInimigos
+        self.servico_visibilidade.iniciar_quadro()
+        if not self.jogador_morto:
+            # Campo de fluxo só é recalculado quando o jogador muda de célula
+            self.campo_fluxo.atualizar(self.jogador.rect.centerx, self.jogador.rect.centery)
 
     def _atualizar_sprites(self, dt):
         """Atualizar sprites e efeitos visuais"""
-        # Obter direção do joystick virtual
-        joystick_direcao = self.ui.obter_direcao_joystick()
-
-        # Se jogador está morto, não atualizar o jogador
-        if self.jogador_morto:
-            # Atualizar apenas sprites que não são o jogador
-            for sprite in self.todos_sprites:
-                if sprite != self.jogador:
-                    sprite.update(dt, self.obstaculos)
+        # Obter direção do controlador externo (headless) ou do joystick virtual
+        if self.controlador:
+            joystick_direcao = self.controlador.comandar(self, dt)
+        elif self.ui:
+            joystick_direcao = self.ui.obter_direcao_joystick()
         else:
-            # Atualizar jogador com direção do joystick
-            self.jogador.update(dt, self.obstaculos, joystick_direcao)
+            joystick_direcao = None
+
+        with perfilador_quadro.secao('sprites'):
+            # Se jogador está morto, não atualizar o jogador
+            if self.jogador_morto:
+                # Atualizar apenas sprites que não são o jogador
+                for sprite in self.todos_sprites:
+                    if sprite != self.jogador:
+                        sprite.update(dt, self.obstaculos)
+            else:
+                # Atualizar jogador com direção do joystick
+                self.jogador.update(dt, self.obstaculos, joystick_direcao, self.teclas)
+
+                # Atualizar outros sprites normalmente
+                for sprite in self.todos_sprites:
+                    if sprite != self.jogador:
+                        sprite.update(dt, self.obstaculos)
 
-            # Atualizar outros sprites normalmente
-            for sprite in self.todos_sprites:
-                if sprite != self.jogador:
-                    sprite.update(dt, self.obstaculos)
-        gerenciador_efeitos.update(dt)
+        # IA e movimento de todos os inimigos de uma vez
+        with perfilador_quadro.secao('ia'):
+            self.lote_inimigos.atualizar(dt, self.jogador, self.obstaculos)
+        with perfilador_quadro.secao('efeitos'):
+            gerenciador_efeitos.update(dt)
 
         # Atualizar sistema de ambiente dinâmico
         if hasattr(self, 'gerenciador_ambiente'):
-            self.gerenciador_ambiente.atualizar(dt)
+            with perfilador_quadro.secao('ambiente'):
+                self.gerenciador_ambiente.atualizar(dt)
 
         # Atualizar sistema de arbustos com efeito de vento
         if hasattr(self, 'gerenciador_arbustos'):
@@ -653,11 +788,13 @@ class Game:
             efeito_vento = None
             if hasattr(self, 'gerenciador_ambiente'):
                 efeito_vento = self.gerenciador_ambiente.obter_efeito_vento()
-            self.gerenciador_arbustos.atualizar(dt, entidades_para_verificar, efeito_vento)
+            with perfilador_quadro.secao('arbustos'):
+                self.gerenciador_arbustos.atualizar(dt, entidades_para_verificar, efeito_vento)
 
         # Atualizar pool de projéteis (limpar projéteis inativos)
         if hasattr(self, 'projectile_pool'):
-            self.projectile_pool.update(dt)
+            with perfilador_quadro.secao('sprites'):
+                self.projectile_pool.update(dt)
 
     def _verificar_nivel_e_respawn(self):
         """Verificar aumento de nível e respawn de inimigos"""
@@ -676,56 +813,68 @@ class Game:
         tiros_jogador = [tiro for tiro in self.tiros if self._tiro_ativo_jogador(tiro)]
 
         for tiro in tiros_jogador:
-            # Usar QuadTree para obter candidatos próximos
-            candidatos_inimigos = self.collision_optimizer.get_collision_candidates(tiro)
-
-            # Verificar colisões precisas apenas com candidatos próximos
-            hit_target = False
-            for inimigo in candidatos_inimigos:
-                if inimigo in self.inimigos and tiro.rect.colliderect(inimigo.rect):
-                    self._processar_dano_inimigo(tiro, inimigo)
-                    hit_target = True
-                    break  # Tiro só pode atingir um inimigo
-            # Se não atingiu inimigo, verificar obstáculos destrutíveis
-            if not hit_target:
+            # Usar QuadTree para obter candidatos ao longo de todo o trajeto do passo
+            candidatos_inimigos = self.collision_optimizer.get_sweep_candidates(tiro.area_varredura())
+            candidatos_inimigos = [inimigo for inimigo in candidatos_inimigos if inimigo in self.inimigos]
+
+            # Colisão contínua: o primeiro inimigo no trajeto é atingido (sem tunelamento)
+            x0, y0, x1, y1 = tiro.segmento_varredura()
+            _, inimigo = first_impact(
+                x0, y0, x1, y1, candidatos_inimigos,
+                tiro.rect.width / 2, tiro.rect.height / 2
+            )
+            if inimigo is not None:
+                self._processar_dano_inimigo(tiro, inimigo)
+            else:
+                # Se não atingiu inimigo, verificar obstáculos destrutíveis
                 self._processar_colisoes_tiros_obstaculos(tiro)
 
     def _processar_colisoes_tiros_obstaculos(self, tiro):
         """Processar colisões entre tiros e obstáculos destrutíveis"""
-        for obstaculo in self.obstaculos:
-            if tiro.rect.colliderect(obstaculo.rect):
-                if obstaculo.destrutivel:
-                    dano = getattr(tiro, 'dano', 25)
-                    destruido = obstaculo.receber_dano(dano)
-                    # Efeito visual de impacto no obstáculo
-                    gerenciador_efeitos.criar_efeito_impacto(
-                        obstaculo.rect.centerx, obstaculo.rect.centery, "normal"
-                    )
-                    if destruido:
-                        # Efeito de destruição
-                        gerenciador_efeitos.grupo_efeitos.add(EfeitoExplosao(
-                            obstaculo.rect.centerx, obstaculo.rect.centery,
-                            (139, 69, 19), 50, 0.8
-                        ))
-                        # Partículas de madeira
-                        gerenciador_efeitos.grupo_efeitos.add(EfeitoParticulas(
-                            obstaculo.rect.centerx, obstaculo.rect.centery,
-                            (160, 82, 45), 12, 1.0, 60
-                        ))
-                        # Partículas 3D de destruição
-                        sistema_particulas_3d.adicionar_destruicao_obstaculo(
-                            obstaculo.rect.centerx, obstaculo.rect.centery,
-                            (139, 69, 19)
-                        )
-                        # Remover obstáculo
-                        obstaculo.kill()
-                        self.obstaculos.remove(obstaculo)
-                        self.todos_sprites.remove(obstaculo)
-                          # Pontuação por destruir obstáculo
-                        self.pontuacao += PONTOS_DESTRUIR_OBSTACULO
-                # Destruir tiro
+        # O impacto já foi detectado de forma contínua em Bullet.update
+        obstaculo = getattr(tiro, 'obstaculo_atingido', None)
+        if obstaculo is None:
+            return
+
+        if obstaculo.destrutivel:
+            dano = getattr(tiro, 'dano', 25)
+            destruido = obstaculo.receber_dano(dano)
+            # Efeito visual de impacto no obstáculo
+            gerenciador_efeitos.criar_efeito_impacto(
+                obstaculo.rect.centerx, obstaculo.rect.centery, "normal"
+            )
+            if destruido:
+                # Efeito de destruição
+                gerenciador_efeitos.grupo_efeitos.add(EfeitoExplosao(
+                    obstaculo.rect.centerx, obstaculo.rect.centery,
+                    (139, 69, 19), 50, 0.8
+                ))
+                # Partículas de madeira
+                gerenciador_efeitos.grupo_efeitos.add(EfeitoParticulas(
+                    obstaculo.rect.centerx, obstaculo.rect.centery,
+                    (160, 82, 45), 12, 1.0, 60
+                ))
+                # Partículas 3D de destruição
+                sistema_particulas_3d.adicionar_destruicao_obstaculo(
+                    obstaculo.rect.centerx, obstaculo.rect.centery,
+                    (139, 69, 19)
+                )
+                # Remover obstáculo (liberando as grades de visão e navegação)
+                self.grade_obstaculos.remover_obstaculo(obstaculo)
+                self.grade_navegacao.remover_obstaculo(obstaculo)
+                obstaculo.kill()
+                self.obstaculos.remove(obstaculo)
+                self.todos_sprites.remove(obstaculo)
+                # Pontuação por destruir obstáculo
+                self.pontuacao += PONTOS_DESTRUIR_OBSTACULO
+        # Destruir tiro
+        tiro.kill()
+
+    def _descartar_tiros_bloqueados(self):
+        """Remover tiros cujo trajeto terminou em um obstáculo neste passo"""
+        for tiro in list(self.tiros):
+            if getattr(tiro, 'obstaculo_atingido', None) is not None:
                 tiro.kill()
-                break
 
     def _processar_colisoes_jogador(self, _dt):
         """Processar colisões entre jogador e outros elementos"""
@@ -771,7 +920,12 @@ class Game:
             if hasattr(tiro, 'ativo') and not tiro.ativo:
                 continue
 
-            if pygame.sprite.collide_rect(tiro, self.jogador):
+            x0, y0, x1, y1 = tiro.segmento_varredura()
+            toi = swept_segment_aabb(
+                x0, y0, x1, y1, self.jogador.rect,
+                tiro.rect.width / 2, tiro.rect.height / 2
+            )
+            if toi is not None:
                 dano = getattr(tiro, 'dano', 25)                # Efeito visual de dano no jogador
                 gerenciador_efeitos.grupo_efeitos.add(EfeitoExplosao(
                     self.jogador.rect.centerx, self.jogador.rect.centery,
@@ -784,7 +938,7 @@ class Game:
                     self.feedback_combate.criar_particulas_impacto(
                         self.jogador.rect.centerx, self.jogador.rect.centery, "normal", 10
                     )
-                self.jogador.receber_dano(dano)
+                self.jogador.receber_dano(dano, self)
                 tiro.kill()
 
         # Colisões jogador-power-up
@@ -855,7 +1009,7 @@ class Game:
         gerenciador_efeitos.ativar_screen_shake(intensidade_shake, 0.2)
 
         # Som de impacto em inimigo
-        gerenciador_audio.tocar_som('impacto_inimigo', canal='impactos')
+        gerenciador_audio.tocar_som('impacto_inimigo', canal='impactos', posicao=inimigo.rect.center)
 
         # Feedback de combate quando inimigo recebe dano
         if self.feedback_combate:
@@ -868,7 +1022,7 @@ class Game:
         if inimigo.vida <= 0:
             self._processar_morte_inimigo(inimigo)
 
-    def _verificar_game_over(self):
+    def _verificar_game_over(self, dt):
         """Verificar se o jogador morreu e iniciar respawn"""
         if self.jogador and hasattr(self.jogador, 'vida') and self.jogador.vida <= 0 and not self.jogador_morto:
             # Jogador morreu, iniciar processo de respawn
@@ -904,15 +1058,13 @@ class Game:
 
         elif self.jogador_morto:
             # Processar respawn
-            self._processar_respawn()
+            self._processar_respawn(dt)
 
-    def _fazer_inimigos_atirarem(self, dt):
+    def _fazer_inimigos_atirarem(self, dt):  # pylint: disable=unused-argument
         """Fazer inimigos atirarem"""
-        for inimigo in self.inimigos:
-            tiro = inimigo.tentar_atirar(dt)
-            if tiro:
-                self.todos_sprites.add(tiro)
-                self.tiros.add(tiro)
+        for tiro in self.lote_inimigos.decidir_tiros(self.jogador):
+            self.todos_sprites.add(tiro)
+            self.tiros.add(tiro)
 
     def _processar_morte_inimigo(self, inimigo):
         """Processar morte de inimigo"""
@@ -924,7 +1076,7 @@ class Game:
             self.feedback_combate.processar_abate(inimigo.rect.centerx, inimigo.rect.centery)
 
         # Som de explosão quando inimigo morre (usando canal específico)
-        gerenciador_audio.tocar_som('explosao', canal='impactos')
+        gerenciador_audio.tocar_som('explosao', canal='impactos', posicao=inimigo.rect.center)
 
         # Efeito visual de morte do inimigo
         gerenciador_efeitos.grupo_efeitos.add(EfeitoParticulas(
@@ -942,14 +1094,16 @@ class Game:
 
     def render(self):
         """Renderizar o jogo"""
+        if self.headless:
+            return
         if self.estado == "selecao_personagem":
             self.seletor_personagem.render()
         elif self.estado == "menu_audio":
             self.menu_audio.render()
-        elif self.estado == "vitoria":
-            self.renderizar_jogo()  # Renderizar o jogo com a tela de vitória sobreposta
         else:
-            self.renderizar_jogo()
+            # Desenhar entre os dois últimos passos de simulação (também sob a tela de vitória)
+            with self.interpolador.interpolar(self.fator_interpolacao), perfilador_quadro.secao('mundo'):
+                self.renderizar_jogo()
 
     def renderizar_jogo(self):
         """Renderizar jogo principal com efeitos visuais melhorados"""
@@ -968,7 +1122,8 @@ class Game:
         if hasattr(self, 'gerenciador_ambiente'):
             # Não incluir personagens/inimigos pois eles já têm sombras próprias no renderer_3d
             objetos_com_sombra = list(self.obstaculos)
-            self.gerenciador_ambiente.desenhar_sombras(self.screen, objetos_com_sombra)
+            with perfilador_quadro.secao('ambiente'):
+                self.gerenciador_ambiente.desenhar_sombras(self.screen, objetos_com_sombra)
 
         # Aplicar offset de camera para screen shake
         if camera_offset != (0, 0):
@@ -986,12 +1141,14 @@ class Game:
 
         # Renderizar efeitos de feedback de combate (sempre por último)
         if self.feedback_combate:
-            self.feedback_combate.renderizar_particulas(self.screen, camera_offset)
-            self.feedback_combate.renderizar_luzes(self.screen, camera_offset)
-            self.feedback_combate.renderizar_flash_screen(self.screen)
+            with perfilador_quadro.secao('efeitos'):
+                self.feedback_combate.renderizar_particulas(self.screen, camera_offset)
+                self.feedback_combate.renderizar_luzes(self.screen, camera_offset)
+                self.feedback_combate.renderizar_flash_screen(self.screen)
 
         # Desenhar UI (sempre sem shake)
-        self._renderizar_ui()
+        with perfilador_quadro.secao('ui'):
+            self._renderizar_ui()
 
     def _renderizar_countdown_vitoria(self):
         """Renderizar o countdown de vitória na interface"""
@@ -1075,8 +1232,11 @@ class Game:
             self.screen.blit(tiro.image, tiro.rect)
 
         # Renderizar partículas 3D
-        sistema_particulas_3d.render(self.screen)        # Renderizar efeitos visuais tradicionais
-        gerenciador_efeitos.draw(self.screen)
+        with perfilador_quadro.secao('particulas'):
+            sistema_particulas_3d.render(self.screen)
+        # Renderizar efeitos visuais tradicionais
+        with perfilador_quadro.secao('efeitos'):
+            gerenciador_efeitos.draw(self.screen)
         self._renderizar_elementos_jogo()
 
         # Desenhar debug de colisões se ativo
@@ -1152,17 +1312,22 @@ class Game:
         """Renderizar elementos do jogo (gemas, arbustos, efeitos, etc.)"""
         # Desenhar gemas
         if self.gerenciador_gemas:
-            self.gerenciador_gemas.render(self.screen)        # Desenhar arbustos
+            with perfilador_quadro.secao('gemas'):
+                self.gerenciador_gemas.render(self.screen)
+        # Desenhar arbustos
         if hasattr(self, 'gerenciador_arbustos'):
-            self.gerenciador_arbustos.desenhar(self.screen)
+            with perfilador_quadro.secao('arbustos'):
+                self.gerenciador_arbustos.desenhar(self.screen)
 
         # Desenhar efeitos visuais
-        gerenciador_efeitos.draw(self.screen)
+        with perfilador_quadro.secao('efeitos'):
+            gerenciador_efeitos.draw(self.screen)
 
         # Desenhar partículas ambientais
         if hasattr(self, 'gerenciador_ambiente'):
-            self.gerenciador_ambiente.desenhar_particulas_ambiente(self.screen)
-            self.gerenciador_ambiente.desenhar_particulas_clima(self.screen)
+            with perfilador_quadro.secao('ambiente'):
+                self.gerenciador_ambiente.desenhar_particulas_ambiente(self.screen)
+                self.gerenciador_ambiente.desenhar_particulas_clima(self.screen)
 
         # Desenhar barras de vida dos inimigos
         for inimigo in self.inimigos:
@@ -1178,14 +1343,17 @@ class Game:
 
         # Aplicar overlay de iluminação (dia/noite)
         if hasattr(self, 'gerenciador_ambiente'):
-            self.gerenciador_ambiente.aplicar_overlay_iluminacao(self.screen)
+            with perfilador_quadro.secao('ambiente'):
+                self.gerenciador_ambiente.aplicar_overlay_iluminacao(self.screen)
 
         # Desenhar UI
         if self.jogador:
             info_nivel = self.obter_info_nivel()
-            self.ui.desenhar(self.screen, self.jogador, self.pontuacao, self.jogo_ativo,
-            self.estado, info_nivel, self.gemas_coletadas, self.jogador_morto,
-            self.tempo_respawn_restante, self.vitoria_countdown_ativo, self.tempo_vitoria_restante)
+            with perfilador_quadro.secao('ui'):
+                self.ui.desenhar(self.screen, self.jogador, self.pontuacao, self.jogo_ativo,
+                                 self.estado, info_nivel, self.gemas_coletadas, self.jogador_morto,
+                                 self.tempo_respawn_restante, self.vitoria_countdown_ativo,
+                                 self.tempo_vitoria_restante)
 
     def _desenhar_sprite_com_efeito_arbusto(self, sprite):
         """
@@ -1280,8 +1448,8 @@ class Game:
         max_tentativas = 20
 
         while tentativas < max_tentativas:
-            x = random.randint(50, SCREEN_WIDTH - 50)
-            y = random.randint(50, SCREEN_HEIGHT - 50)
+            x = aleatorio_jogo.randint(50, SCREEN_WIDTH - 50)
+            y = aleatorio_jogo.randint(50, SCREEN_HEIGHT - 50)
 
             # Verificar se não está muito perto do jogador
             if self.jogador:
@@ -1304,12 +1472,7 @@ class Game:
                             self.velocidade_inimigos_atual,
                             self.multiplicador_tiro_atual
                         )
-                        # Definir referência do sistema de arbustos
-                        if hasattr(self, 'gerenciador_arbustos'):
-                            inimigo.gerenciador_arbustos = self.gerenciador_arbustos
-
-                        self.todos_sprites.add(inimigo)
-                        self.inimigos.add(inimigo)
+                        self.adicionar_inimigo(inimigo)
                         return  # Inimigo criado com sucesso
 
             tentativas += 1
@@ -1331,6 +1494,7 @@ class Game:
 
             if gemas_coletadas > 0:
                 self.gemas_coletadas += gemas_coletadas
+                self.atualizar_estatistica_conquistas('gemas_coletadas', self.gemas_coletadas)
                 self.pontuacao += gemas_coletadas * PONTOS_POR_GEMA
 
                 # Criar efeito visual de coleta
@@ -1372,9 +1536,11 @@ class Game:
                 getattr(self.jogador.personagem, 'nome', 'Jogador') if hasattr(self.jogador, 'personagem') else 'Jogador'
             )        # Registrar vitória na progressão
         try:
-            if hasattr(sistema_progressao, 'processar_fim_partida') and self.personagem_selecionado:
+            # Partidas headless (simulação/testes) não alteram a progressão salva
+            if (not self.headless and hasattr(sistema_progressao, 'processar_fim_partida')
+                    and self.personagem_selecionado):
                 # Calcular tempo da partida em segundos
-                tempo_partida = (pygame.time.get_ticks() - self.tempo_inicio_partida) / 1000.0 if hasattr(self, 'tempo_inicio_partida') else 0
+                tempo_partida = getattr(self, 'tempo_partida', 0)
                 
                 # Estatísticas da partida
                 stats = {
@@ -1419,10 +1585,10 @@ class Game:
             if self.gemas_coletadas < 0:
                 self.gemas_coletadas = 0
 
-    def _processar_respawn(self):
+    def _processar_respawn(self, dt):
         """Processar timer de respawn e reaparecer jogador"""
         if self.tempo_respawn_restante > 0:
-            self.tempo_respawn_restante -= 1/60.0  # Assumindo 60 FPS
+            self.tempo_respawn_restante -= dt
             return
 
         # Tempo de respawn acabou, respawnar jogador
@@ -1515,13 +1681,13 @@ class Game:
                 self.vitoria_countdown_ativo = False
                 self.tempo_vitoria_restante = 0.0
 
-    def _processar_countdown_vitoria(self):
+    def _processar_countdown_vitoria(self, dt):
         """Processar timer de countdown de vitória"""
         if not self.vitoria_countdown_ativo:
             return
 
         # Atualizar timer
-        self.tempo_vitoria_restante -= 1/60.0  # Assumindo 60 FPS
+        self.tempo_vitoria_restante -= dt
 
         # Verificar se ainda tem gemas suficientes
         if self.gemas_coletadas < GEMAS_PARA_VITORIA:
@@ -1563,29 +1729,30 @@ class Game:
                 (255, 255, 0), 25  # Explosão amarela adicional
             )
 
-    def verificar_conquistas(self):
-        """Verifica e desbloqueia conquistas com base no estado atual do jogo."""
-        if not self.jogador:
+    def atualizar_estatistica_conquistas(self, chave, valor):
+        """
+        Avisar o sistema de conquistas que uma estatística mudou (só as conquistas dependentes são avaliadas).
+        Args:
+            chave: Estatística ('gemas_coletadas', 'inimigos_derrotados', 'super_usada')
+            valor: Valor atual na partida
+        """
+        # Partidas headless (simulação/testes) não desbloqueiam conquistas salvas
+        if self.headless:
             return
-            
-        contexto = {
-            'gemas_coletadas': self.gemas_coletadas,  # Usar atributo do game ao invés do jogador
-            'inimigos_derrotados': self.inimigos_eliminados,  # Usar atributo do game
-            'super_usada': getattr(self.jogador, 'super_usada', 0) if hasattr(self.jogador, 'super_usada') else 0
-        }
-        desbloqueadas = self.sistema_conquistas.verificar_conquistas(contexto)
-        for conquista in desbloqueadas:
+        for conquista in self.sistema_conquistas.atualizar_estatistica(chave, valor):
+            sistema_progressao.registrar_conquista(conquista.nome)
             print(f"Conquista desbloqueada: {conquista.nome} - {conquista.descricao}")
             if hasattr(self.ui, 'exibir_notificacao'):
                 self.ui.exibir_notificacao(f"Conquista desbloqueada: {conquista.nome}")
 
     def _processar_progressao_fim_partida(self, vitoria):
         """Processa a progressão do Brawler ao fim da partida"""
-        if not self.personagem_selecionado:
+        # Partidas headless (simulação/testes) não alteram a progressão salva
+        if not self.personagem_selecionado or self.headless:
             return
 
         # Calcular tempo da partida em segundos
-        tempo_partida = (pygame.time.get_ticks() - self.tempo_inicio_partida) / 1000.0
+        tempo_partida = self.tempo_partida
 
         # Estatísticas da partida
         stats = {
@@ -1626,6 +1793,7 @@ class Game:
     def registrar_inimigo_eliminado(self):
         """Registra eliminação de inimigo"""
         self.inimigos_eliminados += 1
+        self.atualizar_estatistica_conquistas('inimigos_derrotados', self.inimigos_eliminados)
 
     def registrar_dano_recebido(self, dano):
         """Registra dano recebido pelo jogador"""
@@ -1654,6 +1822,17 @@ class Game:
             print("\n--- Sistema de Colisões ---")
             print(f"QuadTree inicializado: {self.collision_optimizer.quadtree is not None}")
 
+        # Estatísticas do escalonador de IA
+        if hasattr(self, 'escalonador_ia'):
+            print("\n--- IA dos Inimigos ---")
+            for key, value in self.escalonador_ia.obter_estatisticas().items():
+                print(f"{key}: {value}")
+
+        # Estatísticas das vozes de áudio
+        print("\n--- Vozes de Áudio ---")
+        for key, value in gerenciador_audio.estatisticas_vozes().items():
+            print(f"{key}: {value}")
+
         # Estatísticas do ambiente
         if hasattr(self, 'gerenciador_ambiente'):
             print("\n--- Sistema de Ambiente ---")
@@ -4,7 +4,6 @@ Este módulo implementa as gemas que são o objetivo principal do modo de jogo,
 incluindo spawn aleatório, coleta pelo jogador e renderização visual.
 """
 
-import random
 import math
 import pygame
 from src.config import (
@@ -12,6 +11,7 @@ from src.config import (
     GEMAS_SIMULTANEAS_MAX, RAIO_COLETA_GEMA
 )
 from src.efeitos_visuais import gerenciador_efeitos
+from src.aleatoriedade import aleatorio_jogo, aleatorio_visual
 
 
 class Gema:
@@ -35,7 +35,7 @@ class Gema:
         self.cor = COR_GEMA
         self.coletada = False
         self.tempo_animacao = 0
-        self.brilho_offset = random.uniform(0, 2 * math.pi)
+        self.brilho_offset = aleatorio_visual.uniform(0, 2 * math.pi)
 
         # Efeito visual de spawn
         self.spawn_time = 0
@@ -184,8 +184,8 @@ class GerenciadorGemas:
         for _ in range(tentativas):
             # Posição aleatória no mapa (com margem das bordas)
             margem = 50
-            x = random.randint(margem, self.largura_mapa - margem)
-            y = random.randint(margem, self.altura_mapa - margem)
+            x = aleatorio_jogo.randint(margem, self.largura_mapa - margem)
+            y = aleatorio_jogo.randint(margem, self.altura_mapa - margem)
             posicao_valida = True
             gema_rect = pygame.Rect(x - TAMANHO_GEMA, y - TAMANHO_GEMA,
                                   TAMANHO_GEMA * 2, TAMANHO_GEMA * 2)
@@ -11,7 +11,9 @@ from src.game import Game
 from src.menu_audio import MenuAudio
 from src.menu_conquistas import MenuConquistas
 from src.menu_progressao import menu_progressao, menu_detalhes
+from src.achievement_system import sistema_conquistas
 from src.audio_manager import gerenciador_audio
+from src.rastreamento import rastreador_eventos
 
 class EstadoJogo:
     """Estados possíveis do jogo"""
@@ -31,6 +33,7 @@ class GerenciadorEstados:
         self.screen = screen
         self.estado_atual = EstadoJogo.MENU_PRINCIPAL
         self.estados = {}
+        self.fabricas = {}
         self.transicao_ativa = False
         self.tempo_transicao = 0.0
         self.duracao_transicao = 0.5
@@ -38,20 +41,41 @@ class GerenciadorEstados:
         self.inicializar_estados()
 
     def inicializar_estados(self):
-        """Inicializar todos os estados do jogo"""
-        # Criar um jogo temporário para acessar o sistema de conquistas
-        jogo_temp = Game(self.screen)
-        self.estados[EstadoJogo.MENU_PRINCIPAL] = MenuPrincipal(self.screen, jogo_temp)
-        self.estados[EstadoJogo.JOGO] = None  # Será criado quando necessário
-        self.estados[EstadoJogo.CONFIGURACOES] = MenuAudio(self.screen)
-        self.estados[EstadoJogo.CONQUISTAS] = MenuConquistas(self.screen, jogo_temp.sistema_conquistas)
-        self.estados[EstadoJogo.PROGRESSAO] = menu_progressao
-        self.estados[EstadoJogo.DETALHES_BRAWLER] = menu_detalhes
+        """
+        Registrar as fábricas dos estados do jogo.
+        Cada estado é construído na primeira entrada (obter_estado) e
+        reaproveitado nas seguintes; só o menu principal é criado já no início.
+        """
+        self.fabricas = {
+            EstadoJogo.MENU_PRINCIPAL: lambda: MenuPrincipal(self.screen),
+            EstadoJogo.JOGO: lambda: Game(self.screen),
+            EstadoJogo.CONFIGURACOES: lambda: MenuAudio(self.screen),
+            EstadoJogo.CONQUISTAS: lambda: MenuConquistas(self.screen, sistema_conquistas),
+            EstadoJogo.PROGRESSAO: lambda: menu_progressao,
+            EstadoJogo.DETALHES_BRAWLER: lambda: menu_detalhes,
+        }
+        self.obter_estado(self.estado_atual)
+
+    def obter_estado(self, estado):
+        """
+        Obter a instância de um estado, construindo-a na primeira vez.
+        Args:
+            estado: Valor de EstadoJogo
+        Returns:
+            Instância do estado (None se o estado não tem fábrica)
+        """
+        instancia = self.estados.get(estado)
+        if instancia is None and estado in self.fabricas:
+            with rastreador_eventos.span(f'criar_estado_{estado}', 'estado'):
+                instancia = self.fabricas[estado]()
+            self.estados[estado] = instancia
+        return instancia
 
     def mudar_estado(self, novo_estado):
         """Mudar para um novo estado"""
         if novo_estado == self.estado_atual:
             return
+        rastreador_eventos.instante('mudar_estado', 'estado', {'estado': novo_estado})
 
         # Efeitos de saída do estado atual
         if self.estado_atual == EstadoJogo.MENU_PRINCIPAL:
@@ -60,12 +84,15 @@ class GerenciadorEstados:
             # Pausar música do jogo se houver
             pass
 
-        # Criar novo estado se necessário
-        if novo_estado == EstadoJogo.JOGO and self.estados[EstadoJogo.JOGO] is None:
-            self.estados[EstadoJogo.JOGO] = Game(self.screen)
-        elif novo_estado == EstadoJogo.JOGO and self.estados[EstadoJogo.JOGO] is not None:
-            # Reiniciar jogo existente
-            self.estados[EstadoJogo.JOGO] = Game(self.screen) # Efeitos de entrada do novo estado
+        # Criar o estado na primeira entrada; nas seguintes, reaproveitar
+        reaproveitado = novo_estado in self.estados
+        estado = self.obter_estado(novo_estado)
+        if reaproveitado and hasattr(estado, 'reiniciar'):
+            estado.reiniciar()  # Jogo volta à seleção de personagem
+        elif reaproveitado and hasattr(estado, 'recarregar'):
+            estado.recarregar()
+
+        # Efeitos de entrada do novo estado
         if novo_estado == EstadoJogo.MENU_PRINCIPAL:
             # Som ambiente sutil para menu
             if gerenciador_audio.som_disponivel('ambiente_menu'):
@@ -153,10 +180,16 @@ class GerenciadorEstados:
 
         return True
 
-    def render(self):
-        """Renderizar estado atual"""
+    def render(self, alpha=1.0):
+        """
+        Renderizar estado atual.
+        Args:
+            alpha: Fração entre os dois últimos passos de simulação (interpolação)
+        """
         estado = self.estados.get(self.estado_atual)
         if estado:
+            if hasattr(estado, 'fator_interpolacao'):
+                estado.fator_interpolacao = alpha
             # Estados especiais de progressão
             if self.estado_atual == EstadoJogo.PROGRESSAO:
                 from src.characters.personagens import PERSONAGENS_DISPONIVEIS
@@ -0,0 +1,172 @@
+"""
+Gerenciador de vozes do Brawl Stars Clone.
+Em vez de tocar cada pedido de som na hora, o AudioManager entrega os
+pedidos a este gerenciador, que os junta durante o quadro e os despacha uma
+vez por quadro:
+
+- pedidos repetidos do mesmo som no mesmo quadro viram uma única voz, mais
+  alta conforme a quantidade (coalescência);
+- cada voz ocupa um canal do mixer escolhido por prioridade: canal livre
+  primeiro; sem canal livre, a voz de menor prioridade (e, no empate, a
+  mais baixa e mais antiga) é roubada; se todas forem mais importantes, o
+  pedido é descartado;
+- sons posicionais chegam com os ganhos de cada lado (src.audio_espacial);
+  na coalescência fica o pan do pedido mais alto.
+
+As estatísticas (vozes ativas, pedidos, coalescidos, roubos, descartes e
+sons inaudíveis) ajudam a dimensionar CANAIS_MIXER.
+"""
+
+import math
+import time
+import pygame
+from src.config import GANHO_COALESCENCIA_SONS, PRIORIDADES_SONS, PREFIXOS_CATEGORIA_SOM
+
+
+class PedidoSom:
+    """
+    Pedidos de um mesmo som acumulados no quadro.
+    Attributes:
+        som (pygame.mixer.Sound): Som (variante) a tocar
+        volume (float): Maior volume pedido
+        quantidade (int): Quantos pedidos foram juntados
+        prioridade (int): Prioridade da categoria do som
+        esquerda (float): Ganho do canal esquerdo (pan do pedido mais alto)
+        direita (float): Ganho do canal direito
+    """
+
+    __slots__ = ('som', 'volume', 'quantidade', 'prioridade', 'esquerda', 'direita')
+
+    def __init__(self, som, volume, prioridade, esquerda=1.0, direita=1.0):
+        self.som = som
+        self.volume = volume
+        self.quantidade = 1
+        self.prioridade = prioridade
+        self.esquerda = esquerda
+        self.direita = direita
+
+    def volume_final(self):
+        """Volume da voz resultante (cresce com o logaritmo da quantidade)"""
+        ganho = 1.0 + GANHO_COALESCENCIA_SONS * math.log2(self.quantidade)
+        return min(1.0, self.volume * ganho)
+
+
+class GerenciadorVozes:
+    """
+    Alocação dos canais do mixer por prioridade, com coalescência por quadro.
+    Attributes:
+        canais (list): Canais do mixer gerenciados
+        vozes (list): Por canal, (prioridade, volume, início) da voz atual ou None
+        pedidos (dict): Nome do som -> PedidoSom do quadro em andamento
+        estatisticas_totais (dict): Contadores acumulados desde o início
+    """
+
+    def __init__(self, quantidade_canais):
+        self.canais = [pygame.mixer.Channel(indice) for indice in range(quantidade_canais)]
+        self.vozes = [None] * quantidade_canais
+        self.pedidos = {}
+        self.prioridades_cache = {}
+        self.estatisticas_totais = {'pedidos': 0, 'coalescidos': 0, 'tocados': 0, 'roubados': 0, 'descartados': 0,
+                                     'inaudiveis': 0}
+
+    def prioridade(self, nome_som, categoria=None):
+        """
+        Prioridade de um som.
+        Args:
+            nome_som: Nome do som (a categoria sai do prefixo quando não informada)
+            categoria: Categoria explícita ('ui', 'tiros', 'impactos'...)
+        """
+        if categoria in PRIORIDADES_SONS:
+            return PRIORIDADES_SONS[categoria]
+        prioridade = self.prioridades_cache.get(nome_som)
+        if prioridade is None:
+            categoria = next((cat for prefixo, cat in PREFIXOS_CATEGORIA_SOM if nome_som.startswith(prefixo)),
+                             None)
+            prioridade = PRIORIDADES_SONS.get(categoria, PRIORIDADES_SONS['padrao'])
+            self.prioridades_cache[nome_som] = prioridade
+        return prioridade
+
+    def pedir(self, nome_som, som, volume, categoria=None, esquerda=1.0, direita=1.0):
+        """
+        Registrar um pedido de som para o próximo despacho.
+        Args:
+            nome_som: Nome do som (chave da coalescência)
+            som: pygame.mixer.Sound a tocar
+            volume: Volume final (0.0 a 1.0, já com master, sfx e distância)
+            categoria: Categoria opcional (define a prioridade)
+            esquerda, direita: Ganhos de pan de cada lado
+        """
+        self.estatisticas_totais['pedidos'] += 1
+        pedido = self.pedidos.get(nome_som)
+        if pedido is None:
+            self.pedidos[nome_som] = PedidoSom(som, volume, self.prioridade(nome_som, categoria), esquerda, direita)
+            return
+        pedido.quantidade += 1
+        if volume > pedido.volume:
+            pedido.volume = volume
+            pedido.esquerda = esquerda
+            pedido.direita = direita
+        self.estatisticas_totais['coalescidos'] += 1
+
+    def registrar_inaudivel(self):
+        """Contar um pedido descartado por estar longe demais do ouvinte"""
+        self.estatisticas_totais['pedidos'] += 1
+        self.estatisticas_totais['inaudiveis'] += 1
+
+    def despachar(self):
+        """Tocar os pedidos do quadro (mais prioritários primeiro) e limpar a fila"""
+        if not self.pedidos:
+            return
+        pedidos = sorted(self.pedidos.values(), key=lambda p: (p.prioridade, p.volume), reverse=True)
+        self.pedidos = {}
+        agora = time.perf_counter()
+        for pedido in pedidos:
+            volume = pedido.volume_final()
+            indice = self._escolher_canal(pedido.prioridade, volume)
+            if indice is None:
+                self.estatisticas_totais['descartados'] += 1
+                continue
+            canal = self.canais[indice]
+            canal.play(pedido.som)
+            canal.set_volume(volume * pedido.esquerda, volume * pedido.direita)
+            self.vozes[indice] = (pedido.prioridade, volume, agora)
+            self.estatisticas_totais['tocados'] += 1
+
+    def _escolher_canal(self, prioridade, volume):
+        """
+        Encontrar um canal para uma nova voz.
+        Returns:
+            Índice do canal livre ou roubado, ou None (pedido descartado)
+        """
+        vitima = None
+        for indice, canal in enumerate(self.canais):
+            if not canal.get_busy():
+                self.vozes[indice] = None
+                return indice
+            voz = self.vozes[indice]
+            if voz is None:
+                # Canal ocupado por um som tocado fora do gerenciador
+                continue
+            if vitima is None or voz < self.vozes[vitima]:
+                vitima = indice
+        # Menor prioridade, depois a mais baixa, depois a mais antiga
+        if vitima is None or self.vozes[vitima][:2] > (prioridade, volume):
+            return None
+        self.canais[vitima].stop()
+        self.estatisticas_totais['roubados'] += 1
+        return vitima
+
+    def parar(self):
+        """Parar todas as vozes e descartar os pedidos pendentes"""
+        self.pedidos = {}
+        for indice, canal in enumerate(self.canais):
+            canal.stop()
+            self.vozes[indice] = None
+
+    def vozes_ativas(self):
+        """Quantidade de canais tocando agora"""
+        return sum(1 for canal in self.canais if canal.get_busy())
+
+    def estatisticas(self):
+        """Contadores acumulados mais as vozes ativas e o total de canais"""
+        return {**self.estatisticas_totais, 'vozes_ativas': self.vozes_ativas(), 'canais': len(self.canais)}
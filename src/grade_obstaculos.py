@@ -0,0 +1,119 @@
+"""
+Grade de ocupação de obstáculos do Brawl Stars Clone.
+Este módulo rasteriza os obstáculos estáticos do mapa em uma grade regular,
+servindo de base para consultas espaciais baratas como linha de visão
+(raycasting) e navegação dos inimigos. A grade só é reconstruída quando o
+mapa é gerado ou quando um obstáculo destrutível é removido.
+"""
+
+import math
+import numpy as np
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, TAMANHO_CELULA_OBSTACULOS
+
+
+class GradeObstaculos:
+    """
+    Grade de células livres/bloqueadas gerada a partir dos obstáculos.
+    Uma célula é bloqueada quando seu centro está dentro do retângulo de algum
+    obstáculo expandido pela margem (usada para dar folga à hitbox de quem navega).
+    Attributes:
+        tamanho_celula (int): Lado de cada célula em pixels
+        colunas (int): Número de colunas da grade
+        linhas (int): Número de linhas da grade
+        versao (int): Incrementada sempre que a ocupação muda
+    """
+
+    def __init__(self, largura=SCREEN_WIDTH, altura=SCREEN_HEIGHT,
+                 tamanho_celula=TAMANHO_CELULA_OBSTACULOS, margem=0):
+        self.largura = largura
+        self.altura = altura
+        self.tamanho_celula = tamanho_celula
+        self.margem = margem
+        self.colunas = math.ceil(largura / tamanho_celula)
+        self.linhas = math.ceil(altura / tamanho_celula)
+        self.total_celulas = self.colunas * self.linhas
+
+        # bytearray para leitura rápida célula a célula; a view NumPy compartilha a memória
+        self.celulas = bytearray(self.total_celulas)
+        self.matriz = np.frombuffer(self.celulas, dtype=np.uint8).reshape(self.linhas, self.colunas)
+
+        self.obstaculos = []
+        self.versao = 0
+
+    def reconstruir(self, obstaculos):
+        """
+        Rasterizar todos os obstáculos do mapa.
+        Args:
+            obstaculos: Iterável de sprites com atributo rect
+        """
+        self.obstaculos = list(obstaculos)
+        self.celulas[:] = bytes(self.total_celulas)
+        for obstaculo in self.obstaculos:
+            self._rasterizar(obstaculo.rect, 1)
+        self.versao += 1
+
+    def remover_obstaculo(self, obstaculo):
+        """
+        Liberar as células de um obstáculo destruído.
+        Args:
+            obstaculo: Obstáculo removido do mapa
+        """
+        if obstaculo not in self.obstaculos:
+            return
+        self.obstaculos.remove(obstaculo)
+        self._rasterizar(obstaculo.rect, 0)
+        # Reaplicar vizinhos que compartilhavam células com o obstáculo removido
+        area = obstaculo.rect.inflate(self.margem * 2 + self.tamanho_celula * 2,
+                                      self.margem * 2 + self.tamanho_celula * 2)
+        for outro in self.obstaculos:
+            if outro.rect.colliderect(area):
+                self._rasterizar(outro.rect, 1)
+        self.versao += 1
+
+    def _rasterizar(self, rect, valor):
+        """Marcar as células cujo centro está dentro do retângulo expandido"""
+        tamanho = self.tamanho_celula
+        x_min = rect.left - self.margem
+        x_max = rect.right + self.margem
+        y_min = rect.top - self.margem
+        y_max = rect.bottom + self.margem
+
+        col_inicio = max(0, int(x_min // tamanho))
+        col_fim = min(self.colunas - 1, int(x_max // tamanho))
+        lin_inicio = max(0, int(y_min // tamanho))
+        lin_fim = min(self.linhas - 1, int(y_max // tamanho))
+
+        for linha in range(lin_inicio, lin_fim + 1):
+            centro_y = linha * tamanho + tamanho / 2
+            if not y_min <= centro_y < y_max:
+                continue
+            base = linha * self.colunas
+            for coluna in range(col_inicio, col_fim + 1):
+                centro_x = coluna * tamanho + tamanho / 2
+                if x_min <= centro_x < x_max:
+                    self.celulas[base + coluna] = valor
+
+    def celula_da_posicao(self, x, y):
+        """
+        Obter coluna e linha da célula que contém uma posição (limitadas à grade).
+        Returns:
+            Tupla (coluna, linha)
+        """
+        coluna = min(self.colunas - 1, max(0, int(x // self.tamanho_celula)))
+        linha = min(self.linhas - 1, max(0, int(y // self.tamanho_celula)))
+        return coluna, linha
+
+    def indice_da_posicao(self, x, y):
+        """Obter o índice linear da célula que contém uma posição"""
+        coluna, linha = self.celula_da_posicao(x, y)
+        return linha * self.colunas + coluna
+
+    def bloqueada(self, coluna, linha):
+        """Verificar se uma célula está bloqueada (fora da grade conta como bloqueada)"""
+        if 0 <= coluna < self.colunas and 0 <= linha < self.linhas:
+            return self.celulas[linha * self.colunas + coluna] != 0
+        return True
+
+    def bloqueada_em(self, x, y):
+        """Verificar se a célula que contém uma posição está bloqueada"""
+        return self.celulas[self.indice_da_posicao(x, y)] != 0
@@ -0,0 +1,143 @@
+"""
+Modo headless (sem tela) do Brawl Stars Clone.
+Este módulo define como o modo headless é ativado (flag --headless ou
+variável de ambiente BRAWL_HEADLESS) e os controladores que substituem o
+jogador humano: um bot simples e um roteiro de comandos temporizados.
+No modo headless a mesma lógica de gameplay roda com renderização, áudio e
+interface desligados, avançando tão rápido quanto a CPU permitir.
+"""
+
+import math
+import os
+
+# Variável de ambiente que ativa o modo headless
+VARIAVEL_AMBIENTE_HEADLESS = 'BRAWL_HEADLESS'
+
+
+def modo_headless_ativo():
+    """Verificar se o jogo está rodando sem tela (variável de ambiente)"""
+    return os.environ.get(VARIAVEL_AMBIENTE_HEADLESS, '').strip().lower() in ('1', 'true', 'sim', 'yes')
+
+
+def ativar_modo_headless():
+    """
+    Ativar o modo headless para o processo atual.
+    Deve ser chamado antes de importar os módulos do jogo, pois os
+    singletons (áudio, renderer) consultam o modo na criação.
+    """
+    os.environ[VARIAVEL_AMBIENTE_HEADLESS] = '1'
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+
+class ControladorBot:
+    """
+    Bot simples que joga Gem Grab: busca gemas (ou caça inimigos quando não
+    há gemas), mantém distância dos inimigos, atira no mais próximo com linha
+    de visão e usa o Super.
+    Attributes:
+        distancia_segura (float): Distância mínima desejada dos inimigos
+        distancia_ataque (float): Distância até a qual o bot se aproxima sem gemas no mapa
+        usar_super (bool): Se o bot ativa o Super quando carregado
+    """
+
+    def __init__(self, distancia_segura=150.0, distancia_ataque=250.0, usar_super=True):
+        self.distancia_segura = distancia_segura
+        self.distancia_ataque = distancia_ataque
+        self.usar_super = usar_super
+
+    def comandar(self, game, dt):  # pylint: disable=unused-argument
+        """
+        Executar as ações do quadro e devolver a direção de movimento.
+        Args:
+            game: Instância do jogo controlada
+            dt: Delta time em segundos
+        Returns:
+            Tupla (dx, dy) normalizada, usada como joystick virtual
+        """
+        jogador = game.jogador
+        if not jogador or game.jogador_morto:
+            return (0, 0)
+
+        # Atirar (auto-aim do botão virtual escolhe o alvo visível)
+        if jogador.ultimo_tiro <= 0 and game.inimigos:
+            jogador.atirar_botao_virtual(game.tiros, game.todos_sprites, game)
+
+        if self.usar_super and jogador.super_system.super_disponivel:
+            jogador.usar_super()
+
+        return self._direcao_movimento(game, jogador)
+
+    def _direcao_movimento(self, game, jogador):
+        """Combinar atração pela gema mais próxima e repulsão dos inimigos próximos"""
+        x, y = jogador.rect.center
+        direcao_x = direcao_y = 0.0
+
+        gemas = game.gerenciador_gemas.gemas if game.gerenciador_gemas else []
+        if gemas:
+            alvo = min(gemas, key=lambda g: (g.x - x) ** 2 + (g.y - y) ** 2)
+            alvo_x, alvo_y, alcance = alvo.x, alvo.y, 0.0
+        elif game.inimigos:
+            # Sem gemas no mapa: caçar o inimigo mais próximo até o alcance de ataque
+            alvo = min(game.inimigos, key=lambda i: (i.rect.centerx - x) ** 2 + (i.rect.centery - y) ** 2)
+            alvo_x, alvo_y, alcance = alvo.rect.centerx, alvo.rect.centery, self.distancia_ataque
+        else:
+            alvo = None
+        if alvo is not None:
+            distancia = math.hypot(alvo_x - x, alvo_y - y)
+            if distancia > alcance:
+                direcao_x += (alvo_x - x) / distancia
+                direcao_y += (alvo_y - y) / distancia
+
+        for inimigo in game.inimigos:
+            dx = x - inimigo.rect.centerx
+            dy = y - inimigo.rect.centery
+            distancia = math.hypot(dx, dy)
+            if 0 < distancia < self.distancia_segura:
+                peso = (self.distancia_segura - distancia) / self.distancia_segura
+                direcao_x += dx / distancia * peso * 1.5
+                direcao_y += dy / distancia * peso * 1.5
+
+        magnitude = math.hypot(direcao_x, direcao_y)
+        if magnitude < 1e-6:
+            return (0, 0)
+        return (direcao_x / magnitude, direcao_y / magnitude)
+
+
+class ControladorRoteiro:
+    """
+    Controlador que reproduz um roteiro de comandos temporizados.
+    Cada comando é um dicionário com 'inicio' e 'fim' (segundos de partida)
+    e, opcionalmente, 'direcao' (dx, dy), 'atirar' (bool) e 'super' (bool).
+    """
+
+    def __init__(self, comandos):
+        self.comandos = sorted(comandos, key=lambda comando: comando['inicio'])
+        self.tempo = 0.0
+
+    def comandar(self, game, dt):
+        """
+        Executar os comandos ativos no instante atual do roteiro.
+        Args:
+            game: Instância do jogo controlada
+            dt: Delta time em segundos
+        Returns:
+            Tupla (dx, dy) do comando ativo, ou (0, 0)
+        """
+        self.tempo += dt
+        jogador = game.jogador
+        direcao = (0, 0)
+        if not jogador or game.jogador_morto:
+            return direcao
+
+        for comando in self.comandos:
+            if comando['inicio'] > self.tempo:
+                break
+            if self.tempo > comando['fim']:
+                continue
+            direcao = comando.get('direcao', direcao)
+            if comando.get('atirar') and jogador.ultimo_tiro <= 0:
+                jogador.atirar_botao_virtual(game.tiros, game.todos_sprites, game)
+            if comando.get('super') and jogador.super_system.super_disponivel:
+                jogador.usar_super()
+        return direcao
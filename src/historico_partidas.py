@@ -0,0 +1,373 @@
+"""
+Histórico de partidas do Brawl Stars Clone.
+Cada partida vira uma linha de um banco SQLite local (só inserções: gatilhos
+recusam UPDATE e DELETE na tabela de partidas). Junto com as linhas o
+histórico mantém uma tabela de agregados por Brawler, atualizada na mesma
+transação, para que o menu de progressão e o ranking leiam totais e
+posições por índice, sem varrer as partidas:
+
+- partidas(brawler, data) lista as partidas recentes de um Brawler;
+- partidas(data) e partidas(vitoria, data) filtram por período e resultado;
+- agregados(trofeus) devolve o ranking já ordenado.
+
+As partidas ficam em memória até formar um lote de TAMANHO_LOTE_HISTORICO
+(ou até a próxima consulta, ou a saída do processo): o fim da partida não
+toca no disco, e simulações gravam milhares de linhas por transação.
+
+Se o banco falhar (arquivo travado, pasta sem permissão...), o lote volta
+para a memória e é tentado de novo depois de ESPERA_HISTORICO_APOS_ERRO; as
+consultas devolvem None e quem chama usa os dados em memória da progressão.
+"""
+
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional, Tuple
+from src.config import (ARQUIVO_HISTORICO_PARTIDAS, TAMANHO_LOTE_HISTORICO, PARTIDAS_RECENTES_HISTORICO,
+                        ESPERA_HISTORICO_APOS_ERRO)
+from src.rastreamento import rastreador_eventos
+
+# Versão do esquema (guardada em PRAGMA user_version)
+VERSAO_ESQUEMA = 1
+
+# Colunas de uma partida, na ordem da inserção
+COLUNAS_PARTIDA = ('brawler', 'data', 'vitoria', 'tempo_partida', 'exp_ganha', 'trofeus_mudanca', 'trofeus',
+                   'dano_causado', 'dano_recebido', 'inimigos_eliminados', 'gemas_coletadas')
+
+# Colunas da tabela de agregados
+COLUNAS_AGREGADOS = ('brawler', 'partidas', 'vitorias', 'tempo_total', 'dano_causado', 'dano_recebido',
+                     'inimigos_eliminados', 'gemas_coletadas', 'trofeus', 'melhor_trofeus', 'ultima_partida')
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS partidas (
+    id INTEGER PRIMARY KEY,
+    brawler TEXT NOT NULL,
+    data REAL NOT NULL,
+    vitoria INTEGER NOT NULL,
+    tempo_partida REAL NOT NULL DEFAULT 0,
+    exp_ganha INTEGER NOT NULL DEFAULT 0,
+    trofeus_mudanca INTEGER,
+    trofeus INTEGER,
+    dano_causado INTEGER NOT NULL DEFAULT 0,
+    dano_recebido INTEGER NOT NULL DEFAULT 0,
+    inimigos_eliminados INTEGER NOT NULL DEFAULT 0,
+    gemas_coletadas INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_partidas_brawler_data ON partidas(brawler, data);
+CREATE INDEX IF NOT EXISTS idx_partidas_data ON partidas(data);
+CREATE INDEX IF NOT EXISTS idx_partidas_resultado ON partidas(vitoria, data);
+CREATE TRIGGER IF NOT EXISTS partidas_sem_update BEFORE UPDATE ON partidas
+BEGIN SELECT RAISE(ABORT, 'historico de partidas so aceita insercoes'); END;
+CREATE TRIGGER IF NOT EXISTS partidas_sem_delete BEFORE DELETE ON partidas
+BEGIN SELECT RAISE(ABORT, 'historico de partidas so aceita insercoes'); END;
+
+CREATE TABLE IF NOT EXISTS agregados (
+    brawler TEXT PRIMARY KEY,
+    partidas INTEGER NOT NULL DEFAULT 0,
+    vitorias INTEGER NOT NULL DEFAULT 0,
+    tempo_total REAL NOT NULL DEFAULT 0,
+    dano_causado INTEGER NOT NULL DEFAULT 0,
+    dano_recebido INTEGER NOT NULL DEFAULT 0,
+    inimigos_eliminados INTEGER NOT NULL DEFAULT 0,
+    gemas_coletadas INTEGER NOT NULL DEFAULT 0,
+    trofeus INTEGER NOT NULL DEFAULT 0,
+    melhor_trofeus INTEGER NOT NULL DEFAULT 0,
+    ultima_partida REAL
+);
+CREATE INDEX IF NOT EXISTS idx_agregados_trofeus ON agregados(trofeus DESC, brawler);
+"""
+
+# Soma de um lote aos agregados (os troféus são o valor absoluto mais recente, quando houver)
+SQL_ATUALIZAR_AGREGADOS = """
+INSERT INTO agregados (brawler, partidas, vitorias, tempo_total, dano_causado, dano_recebido,
+                       inimigos_eliminados, gemas_coletadas, trofeus, melhor_trofeus, ultima_partida)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, 0), COALESCE(?, 0), ?)
+ON CONFLICT(brawler) DO UPDATE SET
+    partidas = partidas + excluded.partidas,
+    vitorias = vitorias + excluded.vitorias,
+    tempo_total = tempo_total + excluded.tempo_total,
+    dano_causado = dano_causado + excluded.dano_causado,
+    dano_recebido = dano_recebido + excluded.dano_recebido,
+    inimigos_eliminados = inimigos_eliminados + excluded.inimigos_eliminados,
+    gemas_coletadas = gemas_coletadas + excluded.gemas_coletadas,
+    trofeus = COALESCE(?, trofeus),
+    melhor_trofeus = MAX(melhor_trofeus, excluded.melhor_trofeus),
+    ultima_partida = MAX(COALESCE(ultima_partida, 0), excluded.ultima_partida)
+"""
+
+# Troféus vindos do save da progressão (o save é a fonte de verdade dos troféus)
+SQL_SINCRONIZAR_TROFEUS = """
+INSERT INTO agregados (brawler, trofeus, melhor_trofeus) VALUES (?, ?, ?)
+ON CONFLICT(brawler) DO UPDATE SET
+    trofeus = excluded.trofeus,
+    melhor_trofeus = MAX(melhor_trofeus, excluded.melhor_trofeus)
+"""
+
+
+class HistoricoPartidas:
+    """
+    Histórico de partidas em SQLite com inserções em lote.
+    Attributes:
+        caminho (str): Arquivo do banco
+        tamanho_lote (int): Partidas acumuladas antes de uma transação
+        pendentes (list): Partidas ainda não gravadas (tuplas em COLUNAS_PARTIDA)
+        trofeus_pendentes (dict): Brawler -> (troféus, melhor) a sincronizar
+        versao (int): Cresce a cada lote gravado (invalida caches de quem consulta)
+        ultimo_erro (str): Última falha do banco (None depois de um acesso bem-sucedido)
+    """
+
+    def __init__(self, caminho=ARQUIVO_HISTORICO_PARTIDAS, tamanho_lote=TAMANHO_LOTE_HISTORICO):
+        self.caminho = caminho
+        self.tamanho_lote = tamanho_lote
+        self.pendentes = []
+        self.trofeus_pendentes: Dict[str, Tuple[int, int]] = {}
+        self.versao = 0
+        self.ultimo_erro = None
+        self._espera_ate = 0.0
+        self._conexao = None
+
+    @property
+    def conexao(self):
+        """Conexão com o banco (aberta e migrada no primeiro uso; sqlite3.Error se falhar)"""
+        if self._conexao is None:
+            with rastreador_eventos.span('abrir_historico', 'io'):
+                conexao = sqlite3.connect(self.caminho)
+                try:
+                    conexao.execute('PRAGMA journal_mode=WAL')
+                    conexao.execute('PRAGMA synchronous=NORMAL')
+                    with conexao:
+                        conexao.executescript(ESQUEMA)
+                        conexao.execute(f'PRAGMA user_version={VERSAO_ESQUEMA}')
+                except sqlite3.Error:
+                    conexao.close()
+                    raise
+                self._conexao = conexao
+        return self._conexao
+
+    def indisponivel(self):
+        """Verificar se o banco falhou há pouco (acessos suspensos até o fim da espera)"""
+        return time.monotonic() < self._espera_ate
+
+    def _registrar_erro(self, acao, erro):
+        """Suspender os acessos por um tempo e avisar uma vez por erro diferente"""
+        self._espera_ate = time.monotonic() + ESPERA_HISTORICO_APOS_ERRO
+        mensagem = f"{acao}: {erro}"
+        if mensagem != self.ultimo_erro:
+            print(f"Erro no histórico de partidas ({mensagem})")
+        self.ultimo_erro = mensagem
+
+    def registrar(self, brawler: str, vitoria: bool, tempo_partida: float = 0.0, exp_ganha: int = 0,
+                  trofeus_mudanca: Optional[int] = None, trofeus: Optional[int] = None,
+                  data: Optional[float] = None, **stats):
+        """
+        Acrescentar uma partida ao lote (sem acesso ao disco até o lote encher).
+        Args:
+            brawler: Nome do Brawler
+            vitoria: Resultado da partida
+            tempo_partida: Duração em segundos
+            exp_ganha: Experiência recebida
+            trofeus_mudanca: Troféus ganhos ou perdidos (None em simulações)
+            trofeus: Troféus do Brawler depois da partida (None em simulações)
+            data: Momento da partida (padrão: agora, em segundos desde a época)
+            **stats: dano_causado, dano_recebido, inimigos_eliminados, gemas_coletadas
+        """
+        self.pendentes.append((
+            brawler, time.time() if data is None else data, int(bool(vitoria)), float(tempo_partida),
+            int(exp_ganha), trofeus_mudanca, trofeus,
+            int(stats.get('dano_causado', 0)), int(stats.get('dano_recebido', 0)),
+            int(stats.get('inimigos_eliminados', 0)), int(stats.get('gemas_coletadas', 0)),
+        ))
+        if len(self.pendentes) >= self.tamanho_lote:
+            self.descarregar()
+
+    def registrar_lote(self, partidas):
+        """
+        Gravar muitas partidas de uma vez (ex.: resultados de simulação).
+        Args:
+            partidas: Iterável de dicionários com os argumentos de registrar()
+        """
+        tamanho_lote, self.tamanho_lote = self.tamanho_lote, float('inf')
+        try:
+            for partida in partidas:
+                self.registrar(**partida)
+        finally:
+            self.tamanho_lote = tamanho_lote
+        self.descarregar()
+
+    def sincronizar_trofeus(self, brawler: str, trofeus: int, melhor_trofeus: int):
+        """Guardar os troféus atuais de um Brawler para o ranking (aplicado no próximo lote)"""
+        self.trofeus_pendentes[brawler] = (trofeus, melhor_trofeus)
+
+    def descarregar(self, forcar=False):
+        """
+        Gravar as partidas e troféus pendentes numa única transação.
+        Args:
+            forcar: Tentar mesmo durante a espera depois de uma falha (saída do processo)
+        Returns:
+            True se não sobrou nada pendente
+        """
+        if not self.pendentes and not self.trofeus_pendentes:
+            return True
+        if self.indisponivel() and not forcar:
+            return False
+        pendentes, self.pendentes = self.pendentes, []
+        trofeus, self.trofeus_pendentes = self.trofeus_pendentes, {}
+
+        # Somar o lote por Brawler antes: uma atualização de agregados por Brawler, não por partida
+        somas = {}
+        for partida in pendentes:
+            (brawler, data, vitoria, tempo, _exp, _mudanca, trofeus_partida,
+             dano, recebido, eliminados, gemas) = partida
+            soma = somas.get(brawler)
+            if soma is None:
+                soma = somas[brawler] = [0, 0, 0.0, 0, 0, 0, 0, None, None, data]
+            soma[0] += 1
+            soma[1] += vitoria
+            soma[2] += tempo
+            soma[3] += dano
+            soma[4] += recebido
+            soma[5] += eliminados
+            soma[6] += gemas
+            if data >= soma[9]:
+                soma[9] = data
+                if trofeus_partida is not None:
+                    soma[7] = trofeus_partida
+            if trofeus_partida is not None:
+                soma[8] = max(soma[8] or 0, trofeus_partida)
+
+        with rastreador_eventos.span('gravar_historico', 'io'):
+            try:
+                with self.conexao as conexao:
+                    # Troféus do save primeiro: as partidas do lote são mais recentes
+                    conexao.executemany(SQL_SINCRONIZAR_TROFEUS, [
+                        (brawler, atual, melhor) for brawler, (atual, melhor) in trofeus.items()
+                    ])
+                    marcadores = ', '.join('?' * len(COLUNAS_PARTIDA))
+                    conexao.executemany(
+                        f"INSERT INTO partidas ({', '.join(COLUNAS_PARTIDA)}) VALUES ({marcadores})", pendentes)
+                    conexao.executemany(SQL_ATUALIZAR_AGREGADOS, [
+                        (brawler, *soma[:7], soma[7], soma[8], soma[9], soma[7])
+                        for brawler, soma in somas.items()
+                    ])
+            except sqlite3.Error as e:
+                # A transação foi desfeita: o lote volta para a fila (antes das partidas mais novas)
+                self.pendentes = pendentes + self.pendentes
+                trofeus.update(self.trofeus_pendentes)
+                self.trofeus_pendentes = trofeus
+                self._registrar_erro('gravar', e)
+                return False
+        self.ultimo_erro = None
+        self.versao += 1
+        return True
+
+    def _consultar(self, sql, parametros=()):
+        """
+        Executar uma consulta depois de gravar o lote pendente.
+        Returns:
+            Lista de linhas, ou None se o banco está indisponível
+        """
+        self.descarregar()
+        if self.indisponivel():
+            return None
+        try:
+            return self.conexao.execute(sql, parametros).fetchall()
+        except sqlite3.Error as e:
+            self._registrar_erro('consultar', e)
+            return None
+
+    def ranking(self, limite: Optional[int] = None) -> Optional[List[Tuple[str, int]]]:
+        """
+        Brawlers ordenados por troféus (lidos do índice, sem ordenar).
+        Args:
+            limite: Quantidade máxima de posições (None para todas)
+        Returns:
+            Lista de (nome, troféus), do maior para o menor, ou None se o banco falhou
+        """
+        return self._consultar("SELECT brawler, trofeus FROM agregados ORDER BY trofeus DESC, brawler LIMIT ?",
+                               (-1 if limite is None else limite,))
+
+    def posicao_ranking(self, brawler: str) -> Optional[int]:
+        """
+        Posição de um Brawler no ranking (conta quem está à frente pelo índice de troféus).
+        Returns:
+            Posição a partir de 1, ou None se o Brawler não está no histórico ou o banco falhou
+        """
+        linhas = self._consultar("SELECT trofeus FROM agregados WHERE brawler = ?", (brawler,))
+        if not linhas:
+            return None
+        trofeus = linhas[0][0]
+        contagem = self._consultar(
+            "SELECT COUNT(*) + 1 FROM agregados WHERE trofeus > ? OR (trofeus = ? AND brawler < ?)",
+            (trofeus, trofeus, brawler))
+        return contagem[0][0] if contagem else None
+
+    def agregados(self, brawler: str) -> Optional[Dict]:
+        """
+        Totais de um Brawler (uma busca pela chave primária).
+        Returns:
+            Dicionário com partidas, vitórias, derrotas, win_rate e somas, ou None se nunca jogou ou o banco falhou
+        """
+        linhas = self._consultar(f"SELECT {', '.join(COLUNAS_AGREGADOS)} FROM agregados WHERE brawler = ?",
+                                 (brawler,))
+        if not linhas:
+            return None
+        dados = dict(zip(COLUNAS_AGREGADOS, linhas[0]))
+        dados['derrotas'] = dados['partidas'] - dados['vitorias']
+        dados['win_rate'] = dados['vitorias'] / dados['partidas'] * 100 if dados['partidas'] else 0.0
+        return dados
+
+    def partidas_recentes(self, brawler: str, limite: int = PARTIDAS_RECENTES_HISTORICO) -> List[Dict]:
+        """
+        Últimas partidas de um Brawler (percorre o fim do índice brawler+data).
+        Returns:
+            Lista de dicionários com as colunas da partida, da mais recente para a mais antiga
+            (vazia se o banco falhou)
+        """
+        linhas = self._consultar(
+            f"SELECT {', '.join(COLUNAS_PARTIDA)} FROM partidas WHERE brawler = ? ORDER BY data DESC LIMIT ?",
+            (brawler, limite))
+        return [dict(zip(COLUNAS_PARTIDA, linha)) for linha in linhas or ()]
+
+    def contar_partidas(self, brawler: Optional[str] = None, vitoria: Optional[bool] = None,
+                        desde: Optional[float] = None) -> Optional[int]:
+        """
+        Contar partidas por Brawler, resultado e período (cada filtro usa o índice correspondente).
+        Args:
+            brawler: Só deste Brawler
+            vitoria: Só vitórias (True) ou derrotas (False)
+            desde: Só a partir deste momento (segundos desde a época)
+        Returns:
+            Quantidade de partidas, ou None se o banco falhou
+        """
+        condicoes, valores = [], []
+        if brawler is not None:
+            condicoes.append('brawler = ?')
+            valores.append(brawler)
+        if vitoria is not None:
+            condicoes.append('vitoria = ?')
+            valores.append(int(vitoria))
+        if desde is not None:
+            condicoes.append('data >= ?')
+            valores.append(desde)
+        onde = f" WHERE {' AND '.join(condicoes)}" if condicoes else ''
+        linhas = self._consultar(f"SELECT COUNT(*) FROM partidas{onde}", valores)
+        return linhas[0][0] if linhas else None
+
+    def fechar(self):
+        """Gravar o que estiver pendente e fechar o banco (chamado na saída)"""
+        self.descarregar(forcar=True)
+        if self._conexao is not None:
+            self._conexao.close()
+            self._conexao = None
+
+    def limpar(self):
+        """Apagar o histórico inteiro (usado ao resetar a progressão)"""
+        self.pendentes = []
+        self.trofeus_pendentes = {}
+        if self._conexao is not None:
+            self._conexao.close()
+            self._conexao = None
+        for sufixo in ('', '-wal', '-shm'):
+            if os.path.exists(self.caminho + sufixo):
+                os.remove(self.caminho + sufixo)
+        self.versao += 1
@@ -0,0 +1,217 @@
+"""
+Inicialização preguiçosa do Brawl Stars Clone.
+Este módulo fornece o SingletonPreguicoso, usado pelas instâncias globais
+caras de construir (áudio, renderização 3D, shaders, materiais, progressão,
+partículas e efeitos): o módulo exporta o proxy, e o objeto real só é
+construído no primeiro acesso a um atributo. Importar src.game deixa de
+inicializar o mixer, sintetizar sons ou ler o JSON de progressão.
+
+Também mede o tempo de importação de cada módulo (no estilo de
+python -X importtime) a partir do momento em que o relógio é instalado, e
+o tempo de construção de cada singleton. Os dois aparecem no relatório de
+inicialização do perfilador (F8) e em python main.py --importacoes.
+"""
+
+import sys
+import threading
+import time
+from src.rastreamento import rastreador_eventos
+
+# Linhas do relatório de inicialização
+LINHAS_RELATORIO_INICIALIZACAO = 15
+
+
+class SingletonPreguicoso:
+    """
+    Proxy de uma instância global construída no primeiro uso.
+    Atributos lidos ou atribuídos no proxy vão para a instância real.
+    Attributes:
+        _nome (str): Nome da instância (relatório e rastreamento)
+        _fabrica (callable): Constrói a instância real
+        _instancia: Instância real (None até o primeiro acesso)
+    """
+
+    __slots__ = ('_nome', '_fabrica', '_instancia')
+
+    def __init__(self, nome, fabrica):
+        object.__setattr__(self, '_nome', nome)
+        object.__setattr__(self, '_fabrica', fabrica)
+        object.__setattr__(self, '_instancia', None)
+        singletons_preguicosos.append(self)
+
+    def _obter(self):
+        """Construir a instância real (uma vez) e devolvê-la"""
+        instancia = self._instancia
+        if instancia is None:
+            inicio = time.perf_counter()
+            instancia = self._fabrica()
+            duracao = time.perf_counter() - inicio
+            object.__setattr__(self, '_instancia', instancia)
+            tempos_construcao[self._nome] = duracao
+            if rastreador_eventos.ativo:
+                rastreador_eventos.registrar_duracao(f'construir_{self._nome}', inicio, duracao, 'inicializacao')
+        return instancia
+
+    def __getattr__(self, nome):
+        return getattr(self._obter(), nome)
+
+    def __setattr__(self, nome, valor):
+        setattr(self._obter(), nome, valor)
+
+    def __bool__(self):
+        return True
+
+    def __repr__(self):
+        if self._instancia is None:
+            return f"<{self._nome} (não construído)>"
+        return repr(self._instancia)
+
+
+# Todos os proxies criados e o tempo de construção (s) dos que já foram usados
+singletons_preguicosos = []
+tempos_construcao = {}
+
+
+def construido(proxy):
+    """Verificar se a instância real de um SingletonPreguicoso já existe"""
+    return object.__getattribute__(proxy, '_instancia') is not None
+
+
+def instancia_real(proxy):
+    """Obter a instância real por trás de um SingletonPreguicoso (construindo se preciso)"""
+    return object.__getattribute__(proxy, '_obter')()
+
+
+class RelogioImportacao:
+    """
+    Tempo de importação por módulo, medido a partir de instalar().
+    Um localizador no início de sys.meta_path envolve o exec_module do
+    carregador de cada módulo importado na thread principal; o tempo próprio
+    desconta os módulos importados por dentro (como em -X importtime).
+    Attributes:
+        instalado (bool): Se o localizador está em sys.meta_path
+        inicio (float): perf_counter da instalação
+        modulos (dict): Módulo -> [tempo próprio, tempo acumulado] em segundos
+        marcos (dict): Nome -> segundos desde a instalação (ex.: 'janela')
+    """
+
+    def __init__(self):
+        self.instalado = False
+        self.inicio = None
+        self.modulos = {}
+        self.marcos = {}
+        self.pilha = []
+        self.thread_principal = None
+        self._procurando = False
+
+    def instalar(self):
+        """Começar a medir as importações seguintes"""
+        if self.instalado:
+            return
+        self.inicio = time.perf_counter()
+        self.thread_principal = threading.get_ident()
+        sys.meta_path.insert(0, self)
+        self.instalado = True
+
+    def desinstalar(self):
+        """Parar de medir (os tempos já medidos continuam disponíveis)"""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+        self.instalado = False
+
+    def marcar(self, nome):
+        """Registrar um marco (segundos desde a instalação)"""
+        if self.inicio is not None:
+            self.marcos[nome] = time.perf_counter() - self.inicio
+
+    def find_spec(self, nome, caminho=None, alvo=None):
+        """Localizar o módulo com os demais localizadores e medir a execução dele"""
+        if self._procurando or threading.get_ident() != self.thread_principal:
+            return None
+        self._procurando = True
+        try:
+            for localizador in sys.meta_path:
+                if localizador is self or not hasattr(localizador, 'find_spec'):
+                    continue
+                spec = localizador.find_spec(nome, caminho, alvo)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._procurando = False
+
+        carregador = spec.loader
+        # Importadores embutidos/congelados são classes; só instâncias recebem o exec_module medido
+        if carregador is None or isinstance(carregador, type) or not hasattr(carregador, 'exec_module'):
+            return spec
+        exec_original = carregador.exec_module
+        relogio = self
+
+        def exec_module_medido(modulo):
+            relogio.pilha.append(0.0)
+            inicio = time.perf_counter()
+            try:
+                exec_original(modulo)
+            finally:
+                acumulado = time.perf_counter() - inicio
+                internos = relogio.pilha.pop()
+                if relogio.pilha:
+                    relogio.pilha[-1] += acumulado
+                relogio.modulos[nome] = [acumulado - internos, acumulado]
+                # Não manter o invólucro depois da importação
+                carregador.__dict__.pop('exec_module', None)
+
+        try:
+            carregador.exec_module = exec_module_medido
+        except AttributeError:
+            pass  # Carregador sem __dict__ (não medido)
+        return spec
+
+    def tempos_por_pacote(self):
+        """
+        Somar o tempo próprio por pacote.
+        Módulos do jogo (src.*) aparecem individualmente; bibliotecas são
+        agrupadas pelo pacote de primeiro nível (pygame, numpy...).
+        Returns:
+            Lista de (nome, segundos) do maior para o menor
+        """
+        tempos = {}
+        for nome, (proprio, _acumulado) in self.modulos.items():
+            chave = nome if nome.startswith('src.') else nome.split('.', 1)[0]
+            tempos[chave] = tempos.get(chave, 0.0) + proprio
+        return sorted(tempos.items(), key=lambda item: item[1], reverse=True)
+
+    def total(self):
+        """Tempo total de importação medido (s)"""
+        return sum(proprio for proprio, _acumulado in self.modulos.values())
+
+
+def relatorio_inicializacao(linhas=LINHAS_RELATORIO_INICIALIZACAO):
+    """
+    Montar o relatório de inicialização: importações e construção dos singletons.
+    Args:
+        linhas: Máximo de linhas por seção
+    Returns:
+        Lista de linhas de texto
+    """
+    saida = []
+    if relogio_importacao.modulos:
+        saida.append(f"Importações: {relogio_importacao.total() * 1000.0:.1f} ms "
+                     f"em {len(relogio_importacao.modulos)} módulos")
+        for nome, segundos in relogio_importacao.tempos_por_pacote()[:linhas]:
+            saida.append(f"  {segundos * 1000.0:8.1f} ms  {nome}")
+    for nome, segundos in relogio_importacao.marcos.items():
+        saida.append(f"Marco {nome}: {segundos * 1000.0:.1f} ms após o início")
+
+    construidos = sorted(tempos_construcao.items(), key=lambda item: item[1], reverse=True)
+    pendentes = [proxy._nome for proxy in singletons_preguicosos  # pylint: disable=protected-access
+                 if not construido(proxy)]
+    saida.append(f"Singletons construídos: {len(construidos)} (pendentes: {', '.join(pendentes) or 'nenhum'})")
+    for nome, segundos in construidos[:linhas]:
+        saida.append(f"  {segundos * 1000.0:8.1f} ms  {nome}")
+    return saida
+
+
+# Instância global do relógio de importação
+relogio_importacao = RelogioImportacao()
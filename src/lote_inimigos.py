@@ -0,0 +1,448 @@
+"""
+Atualização vetorizada da IA dos inimigos do Brawl Stars Clone.
+Este módulo guarda o estado de todos os inimigos (posições, velocidades,
+cooldowns e temporizadores da IA) em arrays NumPy e calcula distâncias,
+escolha de comportamento (aproximar/recuar/lateral/patrulha), movimento com
+colisão e decisões de tiro para todos de uma vez. Os sprites Enemy continuam
+existindo apenas como visões finas desses arrays para renderização e colisões.
+"""
+
+import math
+import numpy as np
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.bullet import Bullet
+from src.aleatoriedade import servico_aleatorio
+
+# Campos numéricos do inimigo mantidos em arrays (um elemento por inimigo)
+CAMPOS_LOTE = (
+    'pos_x', 'pos_y', 'vel_x', 'vel_y', 'velocidade', 'ultimo_tiro',
+    'cooldown_tiro', 'tempo_mudanca_direcao', 'dir_x', 'dir_y',
+    'distancia_ideal', 'meia_largura', 'meia_altura',
+    'comportamento', 'pode_ver', 'espera_pensar', 'nivel_ia'
+)
+
+# Comportamentos escolhidos na última decisão de cada inimigo
+COMPORTAMENTO_APROXIMAR = 0
+COMPORTAMENTO_RECUAR = 1
+COMPORTAMENTO_LATERAL = 2
+COMPORTAMENTO_PATRULHA = 3
+COMPORTAMENTO_FLUXO = 4
+
+# Alcance máximo de tiro dos inimigos
+ALCANCE_TIRO_INIMIGO = 400
+# Distância em que o inimigo percebe o jogador escondido em arbusto
+ALCANCE_VISAO_ARBUSTO = 50
+# Imprecisão da mira dos inimigos
+PRECISAO_INIMIGO = 0.95
+
+
+class CampoLote:
+    """
+    Descritor que expõe um elemento de array do lote como atributo do inimigo.
+    Enquanto o inimigo não pertence a um lote o valor fica no próprio objeto.
+    """
+
+    def __set_name__(self, dono, nome):
+        self.nome = nome
+        self.nome_privado = '_' + nome
+
+    def __get__(self, instancia, dono=None):
+        if instancia is None:
+            return self
+        lote = instancia.__dict__.get('lote')
+        if lote is not None:
+            return float(lote.arrays[self.nome][instancia.indice_lote])
+        return instancia.__dict__[self.nome_privado]
+
+    def __set__(self, instancia, valor):
+        lote = instancia.__dict__.get('lote')
+        if lote is not None:
+            lote.arrays[self.nome][instancia.indice_lote] = valor
+        else:
+            instancia.__dict__[self.nome_privado] = valor
+
+
+class LoteInimigos:
+    """
+    Estado de todos os inimigos em estrutura de arrays (SoA).
+    Attributes:
+        inimigos (list): Sprites na mesma ordem dos arrays
+        quantidade (int): Número de inimigos ativos no lote
+        servico_visibilidade: Serviço de linha de visão (opcional)
+        campo_fluxo: Campo de fluxo até o jogador (opcional)
+        escalonador: EscalonadorIA que limita as decisões por quadro (opcional)
+    """
+
+    def __init__(self, servico_visibilidade=None, campo_fluxo=None, escalonador=None, capacidade=32):
+        self.servico_visibilidade = servico_visibilidade
+        self.campo_fluxo = campo_fluxo
+        self.escalonador = escalonador
+        self.inimigos = []
+        self.quantidade = 0
+        self.capacidade = capacidade
+        self.arrays = {nome: np.zeros(capacidade, dtype=np.float64) for nome in CAMPOS_LOTE}
+        self.rng = servico_aleatorio.numpy
+
+        # Retângulos dos obstáculos em arrays (recriados só quando o mapa muda)
+        self._obstaculos_chave = None
+        self._obstaculos_rects = np.zeros((0, 4), dtype=np.int64)
+
+    def adicionar(self, inimigo):
+        """
+        Colocar um inimigo no lote, copiando seu estado escalar para os arrays.
+        Args:
+            inimigo: Sprite Enemy recém-criado
+        """
+        if inimigo.lote is not None:
+            return
+        self._garantir_capacidade(self.quantidade + 1)
+        indice = self.quantidade
+        arrays = self.arrays
+        estado = inimigo.__dict__
+        for nome in ('pos_x', 'pos_y', 'velocidade', 'ultimo_tiro',
+                     'cooldown_tiro', 'tempo_mudanca_direcao'):
+            arrays[nome][indice] = estado['_' + nome]
+        arrays['vel_x'][indice] = 0.0
+        arrays['vel_y'][indice] = 0.0
+        arrays['dir_x'][indice], arrays['dir_y'][indice] = inimigo.direcao_aleatoria
+        arrays['distancia_ideal'][indice] = inimigo.distancia_ideal
+        arrays['meia_largura'][indice] = inimigo.rect.width // 2
+        arrays['meia_altura'][indice] = inimigo.rect.height // 2
+        # Recém-chegado decide no próximo quadro
+        arrays['comportamento'][indice] = COMPORTAMENTO_PATRULHA
+        arrays['pode_ver'][indice] = 0.0
+        arrays['espera_pensar'][indice] = 0.0
+        arrays['nivel_ia'][indice] = 0.0
+
+        self.inimigos.append(inimigo)
+        self.quantidade += 1
+        inimigo.indice_lote = indice
+        inimigo.lote = self
+
+    def remover(self, inimigo):
+        """
+        Retirar um inimigo do lote (troca com o último para manter os arrays densos).
+        Args:
+            inimigo: Sprite Enemy a remover
+        """
+        if inimigo.lote is not self:
+            return
+        indice = inimigo.indice_lote
+
+        # Devolver o estado ao objeto para que continue utilizável fora do lote
+        estado = inimigo.__dict__
+        for nome in ('pos_x', 'pos_y', 'velocidade', 'ultimo_tiro',
+                     'cooldown_tiro', 'tempo_mudanca_direcao'):
+            estado['_' + nome] = float(self.arrays[nome][indice])
+        inimigo.direcao_aleatoria = (float(self.arrays['dir_x'][indice]),
+                                     float(self.arrays['dir_y'][indice]))
+        inimigo.lote = None
+        inimigo.indice_lote = -1
+
+        ultimo = self.quantidade - 1
+        if indice != ultimo:
+            for array in self.arrays.values():
+                array[indice] = array[ultimo]
+            movido = self.inimigos[ultimo]
+            self.inimigos[indice] = movido
+            movido.indice_lote = indice
+        self.inimigos.pop()
+        self.quantidade -= 1
+
+    def limpar(self):
+        """Remover todos os inimigos do lote"""
+        for inimigo in list(reversed(self.inimigos)):
+            self.remover(inimigo)
+
+    def _garantir_capacidade(self, necessaria):
+        """Dobrar os arrays quando a capacidade acabar"""
+        if necessaria <= self.capacidade:
+            return
+        nova = max(necessaria, self.capacidade * 2)
+        for nome, array in self.arrays.items():
+            novo = np.zeros(nova, dtype=np.float64)
+            novo[:self.quantidade] = array[:self.quantidade]
+            self.arrays[nome] = novo
+        self.capacidade = nova
+
+    def _remover_mortos(self):
+        """Descartar sprites que já saíram dos grupos (mortos ou removidos pelo jogo)"""
+        for inimigo in [inimigo for inimigo in self.inimigos if not inimigo.alive()]:
+            self.remover(inimigo)
+
+    def _atualizar_obstaculos(self, obstaculos):
+        """Converter os retângulos dos obstáculos em array (N, 4) = left, top, right, bottom"""
+        chave = (len(obstaculos), self.servico_visibilidade.grade.versao
+                 if self.servico_visibilidade else None)
+        if chave == self._obstaculos_chave:
+            return self._obstaculos_rects
+        self._obstaculos_chave = chave
+        rects = [(o.rect.left, o.rect.top, o.rect.right, o.rect.bottom) for o in obstaculos]
+        self._obstaculos_rects = np.array(rects, dtype=np.int64).reshape(-1, 4)
+        return self._obstaculos_rects
+
+    def _visibilidade(self, indices, jogador, distancias):
+        """Calcular quais inimigos enxergam o jogador (paredes e arbustos) e se ele está em arbusto"""
+        n = len(indices)
+        if self.servico_visibilidade:
+            observadores = [self.inimigos[i] for i in indices.tolist()]
+            visiveis = np.fromiter(
+                self.servico_visibilidade.linha_de_visao_lote(observadores, jogador), dtype=bool, count=n
+            )
+        else:
+            visiveis = np.ones(n, dtype=bool)
+
+        # Todos os inimigos compartilham o mesmo sistema de arbustos
+        gerenciador_arbustos = self.inimigos[0].gerenciador_arbustos if self.inimigos else None
+        jogador_em_arbusto = bool(gerenciador_arbustos and
+                                  gerenciador_arbustos.entidade_esta_em_arbusto(jogador))
+        if jogador_em_arbusto:
+            return visiveis & (distancias < ALCANCE_VISAO_ARBUSTO), jogador_em_arbusto
+        return visiveis, jogador_em_arbusto
+
+    def atualizar(self, dt, jogador, obstaculos):
+        """
+        Atualizar IA, movimento e cooldowns de todos os inimigos.
+        As decisões são tomadas apenas pelos inimigos liberados pelo escalonador;
+        o movimento de todos é integrado em todo quadro com a última velocidade.
+        Args:
+            dt: Delta time em segundos
+            jogador: Jogador perseguido pelos inimigos
+            obstaculos: Grupo de obstáculos do mapa
+        """
+        self._remover_mortos()
+        n = self.quantidade
+        if n == 0:
+            return
+        a = {nome: array[:n] for nome, array in self.arrays.items()}
+
+        # Distâncias até o jogador
+        dx_jogador = jogador.rect.centerx - np.floor(a['pos_x'])
+        dy_jogador = jogador.rect.centery - np.floor(a['pos_y'])
+        distancias = np.hypot(dx_jogador, dy_jogador)
+
+        # Temporizadores de mudança de direção (lateral e patrulha) correm todo quadro
+        temporizado = ((a['comportamento'] == COMPORTAMENTO_LATERAL) |
+                       (a['comportamento'] == COMPORTAMENTO_PATRULHA))
+        a['tempo_mudanca_direcao'][temporizado] -= dt
+
+        # Decisões (todas ou fatiadas pelo escalonador dentro do orçamento)
+        if self.escalonador:
+            pendentes = self.escalonador.classificar(
+                a['nivel_ia'], a['espera_pensar'], distancias,
+                a['comportamento'] == COMPORTAMENTO_PATRULHA, dt
+            )
+            for fatia in self.escalonador.fatias(pendentes):
+                self._pensar(a, fatia, jogador, dx_jogador, dy_jogador, distancias)
+                self.escalonador.reagendar(a['nivel_ia'], a['espera_pensar'], fatia)
+        else:
+            self._pensar(a, np.arange(n), jogador, dx_jogador, dy_jogador, distancias)
+
+        # Integração do movimento de todos os inimigos
+        dx = a['vel_x'] * dt
+        dy = a['vel_y'] * dt
+        self._mover(a, dx, dy, self._atualizar_obstaculos(obstaculos))
+
+        # Cooldown de tiro
+        recarregando = a['ultimo_tiro'] > 0
+        a['ultimo_tiro'][recarregando] -= dt
+
+        # Sincronizar as visões (sprites) com os arrays
+        em_movimento = ((np.abs(dx) > 0.1) | (np.abs(dy) > 0.1)).tolist()
+        xs = a['pos_x'].astype(np.int64).tolist()
+        ys = a['pos_y'].astype(np.int64).tolist()
+        for inimigo, x, y, movendo in zip(self.inimigos, xs, ys, em_movimento):
+            inimigo.rect.center = (x, y)
+            inimigo.personagem.em_movimento = movendo
+            inimigo.personagem.poder_ativo = False
+
+    def _pensar(self, a, indices, jogador, dx_jogador, dy_jogador, distancias):
+        """
+        Escolher comportamento e velocidade de um subconjunto de inimigos.
+        Args:
+            a: Visões dos arrays do lote
+            indices: Índices dos inimigos que decidem agora
+            jogador: Jogador perseguido
+            dx_jogador: Diferença X até o jogador de cada inimigo
+            dy_jogador: Diferença Y até o jogador de cada inimigo
+            distancias: Distância até o jogador de cada inimigo
+        """
+        rng = self.rng
+        n = len(indices)
+        distancia = distancias[indices]
+        com_distancia = distancia > 0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            nx = np.where(com_distancia, dx_jogador[indices] / distancia, 0.0)
+            ny = np.where(com_distancia, dy_jogador[indices] / distancia, 0.0)
+
+        # Seleção de comportamento
+        pode_ver, jogador_em_arbusto = self._visibilidade(indices, jogador, distancia)
+        a['pode_ver'][indices] = pode_ver
+        distancia_ideal = a['distancia_ideal'][indices]
+        vendo = pode_ver & com_distancia
+        aproximar = vendo & (distancia > distancia_ideal * 1.5)
+        recuar = vendo & (distancia < distancia_ideal * 0.6)
+        lateral = vendo & ~aproximar & ~recuar
+        # Jogador atrás de paredes (não de arbustos) - seguir o campo de fluxo
+        if self.campo_fluxo and not jogador_em_arbusto:
+            fluxo = ~vendo
+        else:
+            fluxo = np.zeros(n, dtype=bool)
+        patrulha = ~vendo & ~fluxo
+        a['comportamento'][indices] = np.select(
+            [aproximar, recuar, lateral, fluxo],
+            [COMPORTAMENTO_APROXIMAR, COMPORTAMENTO_RECUAR, COMPORTAMENTO_LATERAL, COMPORTAMENTO_FLUXO],
+            COMPORTAMENTO_PATRULHA
+        )
+
+        # Nova direção para quem teve o temporizador expirado
+        expirado = (lateral | patrulha) & (a['tempo_mudanca_direcao'][indices] <= 0)
+
+        novo_lateral = np.flatnonzero(expirado & lateral)
+        if novo_lateral.size:
+            # 40% de chance de ir direto pro jogador, senão movimento perpendicular
+            alvos = indices[novo_lateral]
+            direto = rng.random(novo_lateral.size) < 0.4
+            sinal = np.where(rng.random(novo_lateral.size) < 0.5, 1.0, -1.0)
+            lx = nx[novo_lateral]
+            ly = ny[novo_lateral]
+            a['dir_x'][alvos] = np.where(direto, lx * 0.7, -ly * sinal)
+            a['dir_y'][alvos] = np.where(direto, ly * 0.7, lx * sinal)
+            a['tempo_mudanca_direcao'][alvos] = rng.uniform(0.5, 2.0, novo_lateral.size)
+
+        nova_patrulha = np.flatnonzero(expirado & patrulha)
+        if nova_patrulha.size:
+            alvos = indices[nova_patrulha]
+            angulos = rng.uniform(0, 2 * math.pi, nova_patrulha.size)
+            a['dir_x'][alvos] = np.cos(angulos)
+            a['dir_y'][alvos] = np.sin(angulos)
+            a['tempo_mudanca_direcao'][alvos] = rng.uniform(1.0, 3.0, nova_patrulha.size)
+
+        # Direções do campo de fluxo (uma consulta O(1) por inimigo bloqueado)
+        fluxo_x = np.zeros(n)
+        fluxo_y = np.zeros(n)
+        locais_fluxo = np.flatnonzero(fluxo)
+        if locais_fluxo.size:
+            direcao_em = self.campo_fluxo.direcao_em
+            xs = a['pos_x'][indices[locais_fluxo]].astype(np.int64).tolist()
+            ys = a['pos_y'][indices[locais_fluxo]].astype(np.int64).tolist()
+            for local, x, y in zip(locais_fluxo.tolist(), xs, ys):
+                direcao = direcao_em(x, y)
+                if direcao:
+                    fluxo_x[local], fluxo_y[local] = direcao
+
+        # Velocidades resultantes (pixels por segundo)
+        velocidade = a['velocidade'][indices]
+        fator_direcao = np.select([lateral, patrulha], [0.8, 0.3], 0.0)
+        a['vel_x'][indices] = velocidade * (
+            aproximar * nx - recuar * nx * 0.5 + fator_direcao * a['dir_x'][indices] + fluxo_x
+        )
+        a['vel_y'][indices] = velocidade * (
+            aproximar * ny - recuar * ny * 0.5 + fator_direcao * a['dir_y'][indices] + fluxo_y
+        )
+
+    def _mover(self, a, dx, dy, rects):
+        """
+        Aplicar o movimento com limites da tela e colisão por eixo contra obstáculos.
+        A colisão só é resolvida no eixo em que o inimigo andou, contra a face de
+        onde ele veio; parado no eixo, a posição não muda (nunca atravessa a parede).
+        """
+        meia_largura = a['meia_largura']
+        meia_altura = a['meia_altura']
+
+        # Eixo horizontal
+        a['pos_x'][:] = np.clip(a['pos_x'] + dx, meia_largura, SCREEN_WIDTH - meia_largura)
+        centro_x = np.floor(a['pos_x'])
+        centro_y = np.floor(a['pos_y'])
+        if len(rects):
+            bloqueio = self._primeira_colisao(centro_x, centro_y, meia_largura, meia_altura, rects)
+            bloqueio = bloqueio[dx[bloqueio[:, 0]] != 0]
+            if bloqueio.size:
+                obstaculo = rects[bloqueio[:, 1]]
+                indices = bloqueio[:, 0]
+                a['pos_x'][indices] = np.where(
+                    dx[indices] > 0,
+                    obstaculo[:, 0] - meia_largura[indices],
+                    obstaculo[:, 2] + meia_largura[indices]
+                )
+                centro_x = np.floor(a['pos_x'])
+
+        # Eixo vertical
+        a['pos_y'][:] = np.clip(a['pos_y'] + dy, meia_altura, SCREEN_HEIGHT - meia_altura)
+        centro_y = np.floor(a['pos_y'])
+        if len(rects):
+            bloqueio = self._primeira_colisao(centro_x, centro_y, meia_largura, meia_altura, rects)
+            bloqueio = bloqueio[dy[bloqueio[:, 0]] != 0]
+            if bloqueio.size:
+                obstaculo = rects[bloqueio[:, 1]]
+                indices = bloqueio[:, 0]
+                a['pos_y'][indices] = np.where(
+                    dy[indices] > 0,
+                    obstaculo[:, 1] - meia_altura[indices],
+                    obstaculo[:, 3] + meia_altura[indices]
+                )
+
+    @staticmethod
+    def _primeira_colisao(centro_x, centro_y, meia_largura, meia_altura, rects):
+        """
+        Encontrar, para cada inimigo colidindo, o primeiro obstáculo sobreposto.
+        Returns:
+            Array (K, 2) com pares (índice do inimigo, índice do obstáculo)
+        """
+        esquerda = (centro_x - meia_largura)[:, None]
+        topo = (centro_y - meia_altura)[:, None]
+        direita = esquerda + 2 * meia_largura[:, None]
+        fundo = topo + 2 * meia_altura[:, None]
+        sobrepoe = ((esquerda < rects[:, 2]) & (direita > rects[:, 0]) &
+                    (topo < rects[:, 3]) & (fundo > rects[:, 1]))
+        colidindo = np.flatnonzero(sobrepoe.any(axis=1))
+        if not colidindo.size:
+            return np.zeros((0, 2), dtype=np.int64)
+        primeiro = sobrepoe[colidindo].argmax(axis=1)
+        return np.stack((colidindo, primeiro), axis=1)
+
+    def decidir_tiros(self, jogador):
+        """
+        Decidir quais inimigos atiram neste quadro e criar os projéteis.
+        Args:
+            jogador: Alvo dos tiros
+        Returns:
+            Lista de Bullet criados
+        """
+        n = self.quantidade
+        if n == 0:
+            return []
+        a = {nome: array[:n] for nome, array in self.arrays.items()}
+
+        prontos = a['ultimo_tiro'] <= 0
+        if not prontos.any():
+            return []
+
+        dx = jogador.rect.centerx - np.floor(a['pos_x'])
+        dy = jogador.rect.centery - np.floor(a['pos_y'])
+        distancias = np.hypot(dx, dy)
+        candidatos = prontos & (distancias > 0) & (distancias < ALCANCE_TIRO_INIMIGO)
+        if not candidatos.any():
+            return []
+        # Linha de visão da última decisão de cada inimigo
+        atiradores = np.flatnonzero(candidatos & (a['pode_ver'] > 0))
+        if not atiradores.size:
+            return []
+
+        # Direção normalizada com pequena variação para simular imprecisão
+        distancia = distancias[atiradores]
+        jitter = self.rng.uniform(-0.1, 0.1, (2, atiradores.size)) * (1 - PRECISAO_INIMIGO)
+        dir_x = dx[atiradores] / distancia + jitter[0]
+        dir_y = dy[atiradores] / distancia + jitter[1]
+        magnitude = np.hypot(dir_x, dir_y)
+        dir_x /= magnitude
+        dir_y /= magnitude
+        a['ultimo_tiro'][atiradores] = a['cooldown_tiro'][atiradores]
+
+        tiros = []
+        for i, tx, ty in zip(atiradores.tolist(), dir_x.tolist(), dir_y.tolist()):
+            inimigo = self.inimigos[i]
+            tiros.append(Bullet(inimigo.rect.centerx, inimigo.rect.centery, tx, ty,
+                                de_inimigo=True, dano=inimigo.dano_base,
+                                tipo_tiro=inimigo.personagem.tipo_tiro))
+        return tiros
@@ -10,6 +10,7 @@ import numpy as np
 from typing import Dict, Tuple, Optional, List
 from enum import Enum
 from src.pygame_constants import SRCALPHA
+from src.inicializacao import SingletonPreguicoso
 
 
 class TipoMaterial(Enum):
@@ -59,8 +60,11 @@ class PropriedadesMaterial:
 class Material:
     """Classe base para materiais"""
 
-    def __init__(self, nome: str):
+    def __init__(self, nome: str, tipo: Optional[TipoMaterial] = None,
+                 propriedades: Optional[PropriedadesMaterial] = None):
         self.nome = nome
+        self.tipo = tipo
+        self.propriedades = propriedades or PropriedadesMaterial()
         self.cor_base = (255, 255, 255)
         self.metalico = 0.0
         self.rugosidade = 1.0
@@ -186,12 +190,12 @@ class MaterialCartoon(Material):
         superficie.fill(cor_base)
 
         # Arranhões aleatórios
-        np.random.seed(seed)
+        gerador = np.random.RandomState(seed)  # Gerador local: mesma textura sem mexer no estado global
         for _ in range(w // 4):
-            x1 = np.random.randint(0, w)
-            y1 = np.random.randint(0, h)
-            x2 = x1 + np.random.randint(-20, 20)
-            y2 = y1 + np.random.randint(-5, 5)
+            x1 = gerador.randint(0, w)
+            y1 = gerador.randint(0, h)
+            x2 = x1 + gerador.randint(-20, 20)
+            y2 = y1 + gerador.randint(-5, 5)
 
             cor_arranhao = (
                 min(255, cor_base[0] + 30),
@@ -221,12 +225,12 @@ class MaterialCartoon(Material):
         superficie.fill(cor_base)
 
         # Veios da madeira
-        np.random.seed(seed)
+        gerador = np.random.RandomState(seed)
         for y in range(0, h, 3):
             for x in range(w):
                 # Criar padrão de veios usando seno
                 intensidade = math.sin(x * 0.1 + y * 0.05) * 0.3 + 0.7
-                noise = np.random.uniform(0.9, 1.1)
+                noise = gerador.uniform(0.9, 1.1)
                 intensidade *= noise
                 cor_veio = (
                     int(cor_base[0] * intensidade),
@@ -249,11 +253,11 @@ class MaterialCartoon(Material):
         superficie.fill(cor_base_alpha)
 
         # Facetas cristalinas
-        np.random.seed(seed)
+        gerador = np.random.RandomState(seed)
         for _ in range(w // 8):
-            centro_x = np.random.randint(w // 4, 3 * w // 4)
-            centro_y = np.random.randint(h // 4, 3 * h // 4)
-            tamanho_faceta = np.random.randint(5, 15)
+            centro_x = gerador.randint(w // 4, 3 * w // 4)
+            centro_y = gerador.randint(h // 4, 3 * h // 4)
+            tamanho_faceta = gerador.randint(5, 15)
 
             # Criar pontos da faceta
             pontos = []
@@ -305,12 +309,12 @@ class MaterialCartoon(Material):
         superficie.fill(cor_base)
 
         # Rugosidade da pedra
-        np.random.seed(seed)
+        gerador = np.random.RandomState(seed)
         for _ in range(w * h // 4):
-            x = np.random.randint(0, w)
-            y = np.random.randint(0, h)
+            x = gerador.randint(0, w)
+            y = gerador.randint(0, h)
 
-            variacao = np.random.uniform(0.7, 1.3)
+            variacao = gerador.uniform(0.7, 1.3)
             cor_rugosa = (
                 int(min(255, max(0, cor_base[0] * variacao))),
                 int(min(255, max(0, cor_base[1] * variacao))),
@@ -342,7 +346,7 @@ class MaterialCartoon(Material):
 
         return superficie
 
-    def _gerar_textura_energia(self, tamanho: Tuple[int, int],
+    def _gerar_textura_energia(self, tamanho: Tuple[int, int],  # pylint: disable=unused-argument
                              cor_base: Tuple[int, int, int], seed: int) -> pygame.Surface:
         """Gera textura energética com pulsos e brilhos"""
         superficie = pygame.Surface(tamanho, SRCALPHA)
@@ -352,7 +356,6 @@ class MaterialCartoon(Material):
         superficie.fill(cor_base)
 
         # Pulsos de energia
-        np.random.seed(seed)
         centro_x, centro_y = w // 2, h // 2
 
         for raio in range(5, min(w, h) // 2, 8):
@@ -377,13 +380,13 @@ class MaterialCartoon(Material):
         superficie.fill(cor_base)
 
         # Padrões celulares
-        np.random.seed(seed)
+        gerador = np.random.RandomState(seed)
         for _ in range(w // 6):
-            centro_x = np.random.randint(w // 4, 3 * w // 4)
-            centro_y = np.random.randint(h // 4, 3 * h // 4)
-            raio = np.random.randint(3, 8)
+            centro_x = gerador.randint(w // 4, 3 * w // 4)
+            centro_y = gerador.randint(h // 4, 3 * h // 4)
+            raio = gerador.randint(3, 8)
 
-            intensidade = np.random.uniform(0.6, 1.4)
+            intensidade = gerador.uniform(0.6, 1.4)
             cor_celula = (
                 int(min(255, max(0, cor_base[0] * intensidade))),
                 int(min(255, max(0, cor_base[1] * intensidade))),
@@ -492,5 +495,5 @@ class GerenciadorMateriais:
         return list(self.materiais.keys())
 
 
-# Instância global do gerenciador de materiais
-gerenciador_materiais = GerenciadorMateriais()
+# Instância global do gerenciador de materiais (construída no primeiro uso)
+gerenciador_materiais = SingletonPreguicoso('gerenciador_materiais', GerenciadorMateriais)
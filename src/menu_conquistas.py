@@ -178,8 +178,9 @@ class MenuConquistas:
         self.criar_lista_conquistas()
 
         # Estatísticas
-        self.conquistas_alcancadas = sum(1 for c in sistema_conquistas.conquistas if c.alcancada)
-        self.total_conquistas = len(sistema_conquistas.conquistas)
+        self.conquistas_alcancadas = 0
+        self.total_conquistas = 0
+        self.atualizar_estatisticas()
 
         # Fontes ajustadas para resolução 1280x720
         self.font_titulo = pygame.font.Font(None, 56)
@@ -203,6 +204,19 @@ class MenuConquistas:
         ultima_conquista_y = self.itens_conquistas[-1].rect.bottom if self.itens_conquistas else 0
         self.max_scroll = max(0, ultima_conquista_y - SCREEN_HEIGHT + 100)
 
+    def atualizar_estatisticas(self):
+        """Contar as conquistas desbloqueadas"""
+        conquistas = self.sistema_conquistas.conquistas
+        self.conquistas_alcancadas = sum(1 for c in conquistas if c.alcancada)
+        self.total_conquistas = len(conquistas)
+
+    def recarregar(self):
+        """Refazer a lista ao reabrir o menu (conquistas desbloqueadas desde a última visita)"""
+        self.tempo_entrada = 0.0
+        self.scroll_y = 0
+        self.criar_lista_conquistas()
+        self.atualizar_estatisticas()
+
     def update(self, dt):
         """Atualizar menu"""
         self.tempo_entrada += dt
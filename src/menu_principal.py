@@ -12,6 +12,7 @@ from src.config import (
     COR_BOTAO_NORMAL, COR_BOTAO_HOVER, COR_BOTAO_SELECIONADO
 )
 from src.audio_manager import gerenciador_audio
+from src.achievement_system import sistema_conquistas
 from src.pygame_constants import MOUSEBUTTONDOWN, MOUSEMOTION, SRCALPHA
 
 class BotaoMenu:
@@ -231,9 +232,8 @@ class LogoAnimado:
 class MenuPrincipal:
     """Menu principal do jogo"""
 
-    def __init__(self, screen, game):
+    def __init__(self, screen):
         self.screen = screen
-        self.game = game
         self.ativo = True
         self.opcao_selecionada = 0
         self.tempo_entrada = 0.0
@@ -297,7 +297,7 @@ class MenuPrincipal:
     def exibir_conquistas(self):
         """Exibe a lista de conquistas desbloqueadas."""
         print("Conquistas Desbloqueadas:")
-        for conquista in self.game.sistema_conquistas.conquistas:
+        for conquista in sistema_conquistas.conquistas:
             status = "[✔]" if conquista.alcancada else "[ ]"
             print(f"{status} {conquista.nome} - {conquista.descricao}")
 
@@ -3,6 +3,7 @@ Interface do Sistema de Progressão do Brawl Stars Clone.
 Telas para visualizar progressão, Star Powers e estatísticas dos Brawlers.
 """
 
+import time
 import pygame
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, COR_TEXTO, COR_FUNDO
 from src.sistema_progressao import sistema_progressao
@@ -18,6 +19,19 @@ class MenuProgressao:
         self.scroll_y = 0
         self.botoes = []
         self.mostrar_star_powers = False
+        self._posicoes_ranking = {}
+        self._versao_ranking = None
+
+    def posicoes_ranking(self):
+        """Posição de cada Brawler no ranking (consultada de novo só quando o histórico muda)"""
+        historico = sistema_progressao.historico
+        historico.descarregar()
+        # Com o histórico indisponível o ranking vem da memória e não é guardado
+        if self._versao_ranking != historico.versao or historico.indisponivel():
+            self._posicoes_ranking = {nome: posicao for posicao, (nome, _trofeus)
+                                      in enumerate(sistema_progressao.get_ranking_brawlers(), 1)}
+            self._versao_ranking = historico.versao
+        return self._posicoes_ranking
 
     @property
     def font_titulo(self):
@@ -102,6 +116,12 @@ class MenuProgressao:
         nome_rect.y = y + 10
         screen.blit(nome_texto, nome_rect)
 
+        # Posição no ranking
+        posicao = self.posicoes_ranking().get(brawler.nome)
+        if posicao is not None:
+            posicao_render = self.font_pequeno.render(f"#{posicao}", True, (255, 215, 0))
+            screen.blit(posicao_render, (x + 10, y + 12))
+
         # Nível
         nivel_texto = f"Nível {brawler.nivel}"
         nivel_render = self.font_pequeno.render(nivel_texto, True, (255, 215, 0))
@@ -197,7 +217,9 @@ class MenuDetalhesBrawler:
         self._font_texto = None
         self._font_pequeno = None
         self.botoes = []
-        self.tab_ativa = 'stats'  # 'stats' ou 'star_powers'
+        self.tab_ativa = 'stats'  # 'stats', 'star_powers' ou 'historico'
+        self._historico_cache = None
+        self._chave_historico = None
 
     @property
     def font_titulo(self):
@@ -243,6 +265,8 @@ class MenuDetalhesBrawler:
             self.desenhar_estatisticas(screen, brawler)
         elif self.tab_ativa == 'star_powers':
             self.desenhar_star_powers(screen, brawler)
+        elif self.tab_ativa == 'historico':
+            self.desenhar_historico(screen, brawler)
 
     def desenhar_cabecalho(self, screen, brawler):
         """Desenha o cabeçalho com informações principais"""
@@ -304,7 +328,8 @@ class MenuDetalhesBrawler:
 
         tabs = [
             ('stats', 'Estatísticas'),
-            ('star_powers', 'Star Powers')
+            ('star_powers', 'Star Powers'),
+            ('historico', 'Histórico')
         ]
 
         self.botoes.clear()
@@ -369,6 +394,60 @@ class MenuDetalhesBrawler:
             valor_rect.y = y + 25
             screen.blit(valor_texto, valor_rect)
 
+    def dados_historico(self, nome_brawler):
+        """Agregados, posição e partidas recentes do Brawler (consultados de novo só quando o histórico muda)"""
+        historico = sistema_progressao.historico
+        historico.descarregar()
+        chave = (nome_brawler, historico.versao, historico.indisponivel())
+        if self._chave_historico != chave:
+            self._historico_cache = (
+                historico.agregados(nome_brawler),
+                sistema_progressao.get_posicao_ranking(nome_brawler),
+                historico.partidas_recentes(nome_brawler),
+            )
+            self._chave_historico = chave
+        return self._historico_cache
+
+    def desenhar_historico(self, screen, brawler):
+        """Desenha o resumo do histórico e as últimas partidas"""
+        agregados, posicao, recentes = self.dados_historico(brawler.nome)
+        hist_y = 250
+
+        if not agregados or not agregados['partidas']:
+            mensagem = ("Histórico indisponível" if sistema_progressao.historico.indisponivel()
+                        else "Nenhuma partida registrada")
+            sem_hist = self.font_texto.render(mensagem, True, COR_TEXTO)
+            screen.blit(sem_hist, sem_hist.get_rect(center=(SCREEN_WIDTH // 2, hist_y + 100)))
+            return
+
+        partidas = agregados['partidas']
+        resumo = [
+            f"Ranking: #{posicao}" if posicao else "Ranking: -",
+            f"Dano médio: {agregados['dano_causado'] / partidas:.0f}",
+            f"Eliminações/partida: {agregados['inimigos_eliminados'] / partidas:.1f}",
+            f"Duração média: {agregados['tempo_total'] / partidas:.0f}s",
+        ]
+        largura = SCREEN_WIDTH // len(resumo)
+        for i, item in enumerate(resumo):
+            texto = self.font_pequeno.render(item, True, (255, 215, 0))
+            screen.blit(texto, texto.get_rect(center=(largura * i + largura // 2, hist_y)))
+
+        for i, partida in enumerate(recentes):
+            y = hist_y + 40 + i * 32
+            vitoria = partida['vitoria']
+            trofeus = partida['trofeus_mudanca']
+            colunas = [
+                ("VITÓRIA" if vitoria else "DERROTA", (0, 255, 0) if vitoria else (255, 100, 100)),
+                (f"{trofeus:+d} 🏆" if trofeus is not None else "-", (255, 215, 0)),
+                (f"{partida['tempo_partida']:.0f}s", COR_TEXTO),
+                (f"{partida['inimigos_eliminados']} elim.", COR_TEXTO),
+                (f"{partida['gemas_coletadas']} gemas", (0, 255, 255)),
+                (time.strftime('%d/%m %H:%M', time.localtime(partida['data'])), (180, 180, 180)),
+            ]
+            largura_coluna = (SCREEN_WIDTH - 100) // len(colunas)
+            for j, (texto, cor) in enumerate(colunas):
+                screen.blit(self.font_pequeno.render(texto, True, cor), (50 + j * largura_coluna, y))
+
     def desenhar_star_powers(self, screen, brawler):
         """Desenha os Star Powers disponíveis"""
         sp_y = 260
@@ -464,6 +543,7 @@ class MenuDetalhesBrawler:
                         elif botao['action'] == 'ativar_star_power':
                             brawler = sistema_progressao.get_brawler(nome_brawler)
                             brawler.ativar_star_power(botao['star_power'])
+                            sistema_progressao.marcar_alterado(nome_brawler)
                             sistema_progressao.salvar_progressao()
                             return None
         elif evento.type == KEYDOWN:
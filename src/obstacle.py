@@ -6,9 +6,9 @@ e projéteis, criando elementos táticos no gameplay. Inclui obstáculos
 estáticos e destrutíveis que podem ser quebrados com tiros.
 """
 
-import random
 import pygame
 from src.config import TAMANHO_OBSTACULO, COR_OBSTACULO
+from src.aleatoriedade import aleatorio_visual
 
 class Obstacle(pygame.sprite.Sprite):
     """Classe dos obstáculos com suporte a destrutibilidade"""
@@ -49,24 +49,24 @@ class Obstacle(pygame.sprite.Sprite):
             self.image.fill(self.cor_dano)
             # Adicionar algumas "rachaduras"
             for _ in range(3):
-                x = random.randint(0, TAMANHO_OBSTACULO)
-                y = random.randint(0, TAMANHO_OBSTACULO)
+                x = aleatorio_visual.randint(0, TAMANHO_OBSTACULO)
+                y = aleatorio_visual.randint(0, TAMANHO_OBSTACULO)
                 pygame.draw.circle(self.image, (101, 67, 33), (x, y), 2)
         elif percentual_vida > 0.1:
             # Obstáculo muito danificado
             self.image.fill((160, 82, 45))  # Marrom mais claro
             # Mais rachaduras
             for _ in range(6):
-                x = random.randint(0, TAMANHO_OBSTACULO)
-                y = random.randint(0, TAMANHO_OBSTACULO)
+                x = aleatorio_visual.randint(0, TAMANHO_OBSTACULO)
+                y = aleatorio_visual.randint(0, TAMANHO_OBSTACULO)
                 pygame.draw.circle(self.image, (101, 67, 33), (x, y), 3)
         else:
             # Quase destruído
             self.image.fill((205, 133, 63))
             # Muitas rachaduras
             for _ in range(10):
-                x = random.randint(0, TAMANHO_OBSTACULO)
-                y = random.randint(0, TAMANHO_OBSTACULO)
+                x = aleatorio_visual.randint(0, TAMANHO_OBSTACULO)
+                y = aleatorio_visual.randint(0, TAMANHO_OBSTACULO)
                 pygame.draw.circle(self.image, (139, 69, 19), (x, y), 2)
 
     def receber_dano(self, dano):
@@ -74,9 +74,10 @@ class Obstacle(pygame.sprite.Sprite):
         if not self.destrutivel:
             return False
 
-        self.vida -= dano
-        if self.vida <= 0:
+        self.vida_atual -= dano
+        if self.vida_atual <= 0:
             return True
+        self.atualizar_visual()
         return False
 
     def render(self, surface):
@@ -6,10 +6,11 @@ efeitos visuais específicos para diferentes ações do jogo.
 """
 
 import math
-import random
 from typing import List, Tuple
 import pygame
 from src.pygame_constants import SRCALPHA
+from src.aleatoriedade import aleatorio_visual
+from src.inicializacao import SingletonPreguicoso
 
 class Particula3D:
     def __init__(self, x: float, y: float, vel_x: float, vel_y: float,
@@ -25,8 +26,8 @@ class Particula3D:
         self.tempo_vida = tempo_vida
         self.tempo_vida_inicial = tempo_vida
         self.tipo = tipo
-        self.angulo = random.uniform(0, 2 * math.pi)
-        self.vel_angular = random.uniform(-5, 5)
+        self.angulo = aleatorio_visual.uniform(0, 2 * math.pi)
+        self.vel_angular = aleatorio_visual.uniform(-5, 5)
         self.gravidade = 200 if tipo == "debris" else 50
         self.bounce = 0.7 if tipo == "debris" else 0.3
 
@@ -105,7 +106,7 @@ class Particula3D:
         pontos = []
         for i in range(6):
             angulo = (i * math.pi / 3) + self.angulo
-            variacao = random.uniform(0.7, 1.3)
+            variacao = aleatorio_visual.uniform(0.7, 1.3)
             raio = tamanho * variacao
             x = centro[0] + math.cos(angulo) * raio
             y = centro[1] + math.sin(angulo) * raio
@@ -168,58 +169,58 @@ class SistemaParticulas3D:
                           intensidade: int = 10):
         """Adiciona explosão com partículas 3D"""
         for _ in range(intensidade):
-            angulo = random.uniform(0, 2 * math.pi)
-            velocidade = random.uniform(50, 200)
+            angulo = aleatorio_visual.uniform(0, 2 * math.pi)
+            velocidade = aleatorio_visual.uniform(50, 200)
             vel_x = math.cos(angulo) * velocidade
             vel_y = math.sin(angulo) * velocidade
             self.particulas.append(Particula3D(
                 x, y, vel_x, vel_y,
-                cor, random.uniform(3, 8),
-                random.uniform(0.5, 1.5), "sparkle"
+                cor, aleatorio_visual.uniform(3, 8),
+                aleatorio_visual.uniform(0.5, 1.5), "sparkle"
             ))
 
     def adicionar_destruicao_obstaculo(self, x: float, y: float,
                                      cor: Tuple[int, int, int]):
         """Adiciona partículas de destruição de obstáculo"""
         for _ in range(10):
-            angulo = random.uniform(0, 2 * math.pi)
-            velocidade = random.uniform(100, 300)
+            angulo = aleatorio_visual.uniform(0, 2 * math.pi)
+            velocidade = aleatorio_visual.uniform(100, 300)
             vel_x = math.cos(angulo) * velocidade
             vel_y = math.sin(angulo) * velocidade - 100  # Para cima
 
             self.particulas.append(Particula3D(
                 x, y, vel_x, vel_y,
-                cor, random.uniform(4, 12),
-                random.uniform(1.0, 2.5), "debris"
+                cor, aleatorio_visual.uniform(4, 12),
+                aleatorio_visual.uniform(1.0, 2.5), "debris"
             ))
 
     def adicionar_coleta_gema(self, x: float, y: float):
         """Adiciona partículas de coleta de gema"""
         for _ in range(12):
-            angulo = random.uniform(0, 2 * math.pi)
-            velocidade = random.uniform(30, 120)
+            angulo = aleatorio_visual.uniform(0, 2 * math.pi)
+            velocidade = aleatorio_visual.uniform(30, 120)
             vel_x = math.cos(angulo) * velocidade
             vel_y = math.sin(angulo) * velocidade - 50
-            cor = random.choice([
+            cor = aleatorio_visual.choice([
                 (0, 255, 100), (100, 255, 200), (200, 255, 100)
             ])
             self.particulas.append(Particula3D(
                 x, y, vel_x, vel_y,
-                cor, random.uniform(2, 6),
-                random.uniform(0.8, 1.5), "energy"
+                cor, aleatorio_visual.uniform(2, 6),
+                aleatorio_visual.uniform(0.8, 1.5), "energy"
             ))
 
     def adicionar_impacto_tiro(self, x: float, y: float, cor: Tuple[int, int, int]):
         """Adiciona partículas de impacto de tiro"""
         for _ in range(8):
-            angulo = random.uniform(0, 2 * math.pi)
-            velocidade = random.uniform(80, 150)
+            angulo = aleatorio_visual.uniform(0, 2 * math.pi)
+            velocidade = aleatorio_visual.uniform(80, 150)
             vel_x = math.cos(angulo) * velocidade
             vel_y = math.sin(angulo) * velocidade
             self.particulas.append(Particula3D(
                 x, y, vel_x, vel_y,
-                cor, random.uniform(2, 5),
-                random.uniform(0.3, 0.8), "sparkle"
+                cor, aleatorio_visual.uniform(2, 5),
+                aleatorio_visual.uniform(0.3, 0.8), "sparkle"
             ))
 
     def adicionar_powerup_coletado(self, x: float, y: float, tipo: str):
@@ -233,14 +234,14 @@ class SistemaParticulas3D:
         }
         cor = cores_powerup.get(tipo, (255, 255, 255))
         for _ in range(15):
-            angulo = random.uniform(0, 2 * math.pi)
-            velocidade = random.uniform(40, 180)
+            angulo = aleatorio_visual.uniform(0, 2 * math.pi)
+            velocidade = aleatorio_visual.uniform(40, 180)
             vel_x = math.cos(angulo) * velocidade
             vel_y = math.sin(angulo) * velocidade - 80
             self.particulas.append(Particula3D(
                 x, y, vel_x, vel_y,
-                cor, random.uniform(3, 7),
-                random.uniform(1.0, 2.0), "energy"
+                cor, aleatorio_visual.uniform(3, 7),
+                aleatorio_visual.uniform(1.0, 2.0), "energy"
             ))
 
     def update(self, dt: float):
@@ -256,5 +257,5 @@ class SistemaParticulas3D:
         """Remove todas as partículas"""
         self.particulas.clear()
 
-# Instância global
-sistema_particulas_3d = SistemaParticulas3D()
+# Instância global (construída no primeiro uso)
+sistema_particulas_3d = SingletonPreguicoso('sistema_particulas_3d', SistemaParticulas3D)
@@ -0,0 +1,103 @@
+"""
+Simulação em passo fixo do Brawl Stars Clone.
+Este módulo desacopla a simulação (física, projéteis e IA) da taxa de
+renderização: um acumulador converte o tempo real de cada quadro em passos de
+duração fixa, e o interpolador desenha as entidades entre os dois últimos
+estados simulados para que o movimento continue suave em qualquer FPS.
+"""
+
+from contextlib import contextmanager
+from src.config import TAXA_SIMULACAO, MAX_PASSOS_SIMULACAO, DISTANCIA_MAXIMA_INTERPOLACAO
+
+
+class AcumuladorPassoFixo:
+    """
+    Acumulador de tempo que gera passos de simulação de duração fixa.
+    Attributes:
+        passo (float): Duração de cada passo em segundos
+        max_passos (int): Máximo de passos executados por quadro
+        alpha (float): Fração do próximo passo já decorrida (0 a 1) para interpolação
+        passos_descartados (int): Passos abandonados pelo limite por quadro
+    """
+
+    def __init__(self, taxa_hz=TAXA_SIMULACAO, max_passos=MAX_PASSOS_SIMULACAO):
+        self.passo = 1.0 / taxa_hz
+        self.max_passos = max_passos
+        self.acumulado = 0.0
+        self.alpha = 0.0
+        self.passos_descartados = 0
+
+    def avancar(self, dt):
+        """
+        Acumular o tempo real do quadro e calcular quantos passos simular.
+        Args:
+            dt: Tempo real decorrido desde o último quadro em segundos
+        Returns:
+            Número de passos de duração self.passo a executar
+        """
+        self.acumulado += dt
+        passos = int(self.acumulado / self.passo)
+        if passos > self.max_passos:
+            # Quadro lento demais: descartar o atraso em vez de tentar alcançá-lo
+            self.passos_descartados += passos - self.max_passos
+            passos = self.max_passos
+            self.acumulado = 0.0
+        else:
+            self.acumulado -= passos * self.passo
+        self.alpha = self.acumulado / self.passo
+        return passos
+
+
+class InterpoladorEstados:
+    """
+    Guarda as posições do passo anterior e desenha entre elas e as atuais.
+    As entidades devem ter pos_x, pos_y e rect.
+    """
+
+    def __init__(self, distancia_maxima=DISTANCIA_MAXIMA_INTERPOLACAO):
+        self.distancia_maxima = distancia_maxima
+        self.anteriores = {}
+
+    def capturar(self, entidades):
+        """
+        Registrar as posições atuais como estado anterior (antes de um passo).
+        Args:
+            entidades: Iterável de entidades a interpolar
+        """
+        self.anteriores = {entidade: (entidade.pos_x, entidade.pos_y) for entidade in entidades}
+
+    def limpar(self):
+        """Descartar o estado anterior (ex.: ao reiniciar a partida)"""
+        self.anteriores = {}
+
+    @contextmanager
+    def interpolar(self, alpha):
+        """
+        Posicionar temporariamente as entidades no estado interpolado.
+        As posições simuladas são restauradas ao sair do bloco.
+        Args:
+            alpha: Fração entre o estado anterior (0) e o atual (1)
+        """
+        restaurar = []
+        if alpha < 1.0:
+            limite = self.distancia_maxima
+            for entidade, (anterior_x, anterior_y) in self.anteriores.items():
+                atual_x = entidade.pos_x
+                atual_y = entidade.pos_y
+                delta_x = atual_x - anterior_x
+                delta_y = atual_y - anterior_y
+                if (delta_x == 0 and delta_y == 0) or abs(delta_x) > limite or abs(delta_y) > limite:
+                    continue
+                restaurar.append((entidade, atual_x, atual_y, entidade.rect.center))
+                x = anterior_x + delta_x * alpha
+                y = anterior_y + delta_y * alpha
+                entidade.pos_x = x
+                entidade.pos_y = y
+                entidade.rect.center = (int(x), int(y))
+        try:
+            yield
+        finally:
+            for entidade, atual_x, atual_y, centro in restaurar:
+                entidade.pos_x = atual_x
+                entidade.pos_y = atual_y
+                entidade.rect.center = centro
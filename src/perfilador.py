@@ -0,0 +1,294 @@
+"""
+Perfilador de quadros do Brawl Stars Clone.
+Este módulo mede quanto tempo cada subsistema (IA, sprites, colisões, gemas,
+partículas, efeitos, ambiente, arbustos, desenho do mundo e UI) gasta em
+cada quadro. Os tempos ficam em um buffer circular, aparecem em um overlay
+com uma barra empilhada (F7) e podem ser exportados para CSV (F8), junto
+com o relatório de inicialização (src.inicializacao).
+
+Desligado, o perfilador só custa uma verificação de flag por seção:
+secao() devolve um gerenciador de contexto nulo compartilhado. No modo leve
+(ligado pelo monitor de ritmo) as seções são medidas, mas só o último quadro
+é guardado: sem buffer circular, overlay ou exportação. Durante uma
+janela de rastreamento (src.rastreamento) as mesmas seções e o quadro inteiro
+também viram eventos na linha do tempo.
+"""
+
+import csv
+import os
+import time
+from contextlib import nullcontext
+import numpy as np
+import pygame
+from src.config import FPS, CAPACIDADE_PERFIL_QUADROS, PASTA_PERFIS
+from src.pygame_constants import SRCALPHA
+from src.rastreamento import rastreador_eventos
+from src.inicializacao import relatorio_inicializacao
+
+# Etapas medidas (colunas do buffer) e suas cores no overlay
+ETAPAS_PERFIL = ('ia', 'sprites', 'colisoes', 'gemas', 'particulas',
+                 'efeitos', 'ambiente', 'arbustos', 'mundo', 'ui')
+CORES_ETAPAS = ((231, 76, 60), (52, 152, 219), (241, 196, 15), (155, 89, 182), (230, 126, 34),
+                (26, 188, 156), (46, 204, 113), (39, 174, 96), (149, 165, 166), (236, 240, 241))
+COR_OUTROS = (90, 90, 90)
+
+# Quadros usados nas médias do overlay e intervalo entre redesenhos dele
+QUADROS_MEDIA_OVERLAY = 60
+QUADROS_ATUALIZACAO_OVERLAY = 15
+
+_SECAO_NULA = nullcontext()
+
+
+class _Secao:
+    """Escopo de medição de uma etapa (tempo exclusivo: descontados os escopos internos)"""
+
+    __slots__ = ('perfilador', 'indice', 'inicio', 'filhos')
+
+    def __init__(self, perfilador, indice):
+        self.perfilador = perfilador
+        self.indice = indice
+        self.inicio = 0.0
+        self.filhos = 0.0
+
+    def __enter__(self):
+        self.perfilador.pilha.append(self)
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        duracao = time.perf_counter() - self.inicio
+        pilha = self.perfilador.pilha
+        pilha.pop()
+        self.perfilador.quadro_atual[self.indice] += duracao - self.filhos
+        if pilha:
+            pilha[-1].filhos += duracao
+        if rastreador_eventos.ativo:
+            rastreador_eventos.registrar_duracao(ETAPAS_PERFIL[self.indice], self.inicio, duracao)
+        return False
+
+
+class PerfiladorQuadro:
+    """
+    Tempos por etapa de cada quadro em um buffer circular.
+    Attributes:
+        ativo (bool): Se as seções estão sendo medidas e vão para o histórico
+        leve (bool): Se as seções são medidas só para o último quadro
+        overlay_visivel (bool): Se o overlay é desenhado
+        historico (np.ndarray): Buffer (quadros x etapas + total) em segundos
+        quadros_registrados (int): Quadros medidos desde que foi ativado
+    """
+
+    def __init__(self, capacidade=CAPACIDADE_PERFIL_QUADROS):
+        self.ativo = False
+        self.overlay_visivel = False
+        self.capacidade = capacidade
+        self.indices = {nome: indice for indice, nome in enumerate(ETAPAS_PERFIL)}
+        # Última coluna: tempo total de trabalho do quadro
+        self.historico = np.zeros((capacidade, len(ETAPAS_PERFIL) + 1), dtype=np.float64)
+        self.quadro_atual = [0.0] * len(ETAPAS_PERFIL)
+        self.pilha = []
+        self.cursor = 0
+        self.quadros_registrados = 0
+        self.inicio_quadro = None
+
+        # Modo leve: só as etapas do último quadro fechado (mesmo layout de uma linha do histórico)
+        self.leve = False
+        self.ultimo_quadro = np.zeros(len(ETAPAS_PERFIL) + 1, dtype=np.float64)
+        self.ultimo_quadro_valido = False
+
+        # Overlay em cache (redesenhado a cada poucos quadros)
+        self.fonte = None
+        self.superficie_overlay = None
+        self.quadros_desde_overlay = 0
+
+    def ativar(self, ativo=True):
+        """Ligar ou desligar a medição (o histórico é zerado ao ligar)"""
+        if ativo and not self.ativo:
+            self.historico.fill(0.0)
+            self.cursor = 0
+            self.quadros_registrados = 0
+            self.superficie_overlay = None
+        self.ativo = ativo
+        self.pilha.clear()
+        self.quadro_atual = [0.0] * len(ETAPAS_PERFIL)
+        self.inicio_quadro = None
+
+    def ativar_leve(self, leve=True):
+        """Ligar ou desligar o modo leve (medir as seções guardando só o último quadro)"""
+        self.leve = leve
+        self.ultimo_quadro_valido = False
+
+    def etapas_ultimo_quadro(self):
+        """
+        Obter as etapas do último quadro fechado, com o histórico ou no modo leve.
+        Returns:
+            Array (etapas + total) em segundos, ou None se nenhum quadro foi medido
+        """
+        return self.ultimo_quadro if self.ultimo_quadro_valido else None
+
+    def alternar_overlay(self):
+        """Mostrar/esconder o overlay (mostrar liga a medição)"""
+        self.overlay_visivel = not self.overlay_visivel
+        if self.overlay_visivel:
+            self.ativar(True)
+
+    def secao(self, nome):
+        """
+        Medir um trecho de código como parte de uma etapa.
+        Uso: with perfilador_quadro.secao('colisoes'): ...
+        Args:
+            nome: Uma das ETAPAS_PERFIL
+        Returns:
+            Gerenciador de contexto (nulo quando desligado e sem rastreamento)
+        """
+        if not self.ativo and not self.leve and not rastreador_eventos.ativo:
+            return _SECAO_NULA
+        return _Secao(self, self.indices[nome])
+
+    def iniciar_quadro(self):
+        """Marcar o início do trabalho do quadro (depois da espera do clock)"""
+        if self.ativo or self.leve or rastreador_eventos.ativo:
+            self.inicio_quadro = time.perf_counter()
+
+    def fechar_quadro(self):
+        """Gravar as etapas do quadro no buffer circular e começar um novo quadro"""
+        if self.inicio_quadro is None:
+            return
+        duracao = time.perf_counter() - self.inicio_quadro
+        if rastreador_eventos.ativo:
+            rastreador_eventos.registrar_duracao('quadro', self.inicio_quadro, duracao, 'quadro')
+        if self.ativo or self.leve:
+            self.ultimo_quadro[:-1] = self.quadro_atual
+            self.ultimo_quadro[-1] = duracao
+            self.ultimo_quadro_valido = True
+        if not self.ativo:
+            # Modo leve ou só rastreando: as etapas não entram no histórico
+            self.inicio_quadro = None
+            self.quadro_atual = [0.0] * len(ETAPAS_PERFIL)
+            return
+        linha = self.historico[self.cursor]
+        linha[:-1] = self.quadro_atual
+        linha[-1] = duracao
+        self.cursor = (self.cursor + 1) % self.capacidade
+        self.quadros_registrados += 1
+        self.quadro_atual = [0.0] * len(ETAPAS_PERFIL)
+        self.quadros_desde_overlay += 1
+
+    def quadros_recentes(self, quantidade=None):
+        """
+        Obter os quadros registrados em ordem cronológica.
+        Args:
+            quantidade: Máximo de quadros mais recentes (padrão: todo o buffer)
+        Returns:
+            Array (quadros x etapas + total) em segundos
+        """
+        disponiveis = min(self.quadros_registrados, self.capacidade)
+        if quantidade is not None:
+            disponiveis = min(disponiveis, quantidade)
+        indices = (self.cursor - disponiveis + np.arange(disponiveis)) % self.capacidade
+        return self.historico[indices]
+
+    def medias_ms(self, quantidade=QUADROS_MEDIA_OVERLAY):
+        """
+        Calcular o tempo médio por etapa nos últimos quadros.
+        Returns:
+            Dicionário etapa -> ms, com 'outros' (trabalho fora das etapas) e 'total'
+        """
+        quadros = self.quadros_recentes(quantidade)
+        if not len(quadros):
+            return {}
+        medias = quadros.mean(axis=0) * 1000.0
+        resultado = dict(zip(ETAPAS_PERFIL, medias[:-1].tolist()))
+        resultado['outros'] = max(0.0, float(medias[-1] - medias[:-1].sum()))
+        resultado['total'] = float(medias[-1])
+        return resultado
+
+    def exportar_csv(self, caminho=None):
+        """
+        Exportar o buffer para CSV (um quadro por linha, tempos em ms).
+        Args:
+            caminho: Arquivo de destino (padrão: PASTA_PERFIS/perfil_<data>.csv)
+        Returns:
+            Caminho do arquivo gravado, ou None se não há quadros
+        """
+        quadros = self.quadros_recentes()
+        if not len(quadros):
+            return None
+        if caminho is None:
+            os.makedirs(PASTA_PERFIS, exist_ok=True)
+            caminho = os.path.join(PASTA_PERFIS, f"perfil_{time.strftime('%Y%m%d_%H%M%S')}.csv")
+
+        primeiro = self.quadros_registrados - len(quadros)
+        with open(caminho, 'w', newline='', encoding='utf-8') as f:
+            escritor = csv.writer(f)
+            escritor.writerow(['quadro', *ETAPAS_PERFIL, 'outros', 'total'])
+            for deslocamento, linha in enumerate(quadros * 1000.0):
+                outros = max(0.0, linha[-1] - linha[:-1].sum())
+                escritor.writerow([primeiro + deslocamento,
+                                   *(f"{valor:.4f}" for valor in linha[:-1]),
+                                   f"{outros:.4f}", f"{linha[-1]:.4f}"])
+        return caminho
+
+    @staticmethod
+    def salvar_relatorio_inicializacao(caminho=None):
+        """
+        Gravar o relatório de inicialização (importações por módulo e construção dos singletons).
+        Args:
+            caminho: Arquivo de destino (padrão: PASTA_PERFIS/inicializacao_<data>.txt)
+        Returns:
+            Caminho do arquivo gravado
+        """
+        if caminho is None:
+            os.makedirs(PASTA_PERFIS, exist_ok=True)
+            caminho = os.path.join(PASTA_PERFIS, f"inicializacao_{time.strftime('%Y%m%d_%H%M%S')}.txt")
+        with open(caminho, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(relatorio_inicializacao()) + '\n')
+        return caminho
+
+    def desenhar(self, screen):
+        """Desenhar o overlay com a barra empilhada das médias por etapa"""
+        if not self.overlay_visivel:
+            return
+        if self.superficie_overlay is None or self.quadros_desde_overlay >= QUADROS_ATUALIZACAO_OVERLAY:
+            self.superficie_overlay = self._criar_overlay()
+            self.quadros_desde_overlay = 0
+        screen.blit(self.superficie_overlay, (10, 10))
+
+    def _criar_overlay(self):
+        """Montar a superfície do overlay a partir das médias recentes"""
+        if self.fonte is None:
+            self.fonte = pygame.font.Font(None, 18)
+        largura_barra = 300
+        alvo_ms = 1000.0 / FPS
+        medias = self.medias_ms()
+        linhas = len(ETAPAS_PERFIL) + 2
+        superficie = pygame.Surface((largura_barra + 20, 48 + linhas * 14), SRCALPHA)
+        superficie.fill((0, 0, 0, 170))
+
+        total = medias.get('total', 0.0)
+        titulo = self.fonte.render(f"Quadro: {total:.2f} ms (alvo {alvo_ms:.1f} ms) - F8 exporta CSV",
+                                   True, (255, 255, 255))
+        superficie.blit(titulo, (10, 6))
+
+        # Barra empilhada: a largura toda corresponde a duas vezes o alvo
+        escala = largura_barra / (2 * alvo_ms)
+        x = 10
+        etapas = list(zip(ETAPAS_PERFIL, CORES_ETAPAS)) + [('outros', COR_OUTROS)]
+        for nome, cor in etapas:
+            largura = int(medias.get(nome, 0.0) * escala)
+            if largura > 0:
+                pygame.draw.rect(superficie, cor, (x, 24, min(largura, 10 + largura_barra - x), 12))
+                x += largura
+        # Marca do alvo de tempo por quadro
+        pygame.draw.line(superficie, (255, 255, 255), (10 + largura_barra // 2, 20), (10 + largura_barra // 2, 40))
+
+        for linha, (nome, cor) in enumerate(etapas):
+            y = 44 + linha * 14
+            pygame.draw.rect(superficie, cor, (10, y + 3, 8, 8))
+            texto = self.fonte.render(f"{nome}: {medias.get(nome, 0.0):.2f} ms", True, (220, 220, 220))
+            superficie.blit(texto, (24, y))
+        return superficie
+
+
+# Instância global do perfilador
+perfilador_quadro = PerfiladorQuadro()
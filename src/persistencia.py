@@ -0,0 +1,164 @@
+"""
+Gravação em segundo plano dos saves do Brawl Stars Clone.
+O laço principal nunca espera o disco: quem quer salvar entrega um retrato
+dos dados (já copiado, imutável daqui em diante) ao GravadorAssincrono, que
+o grava numa thread própria:
+
+- pedidos feitos dentro de ATRASO_GRAVACAO_PROGRESSAO são juntados e só o
+  retrato mais recente é gravado (coalescência);
+- o JSON é compacto e vai para um arquivo temporário, que substitui o save
+  com os.replace depois do fsync: um travamento no meio da escrita deixa o
+  save anterior intacto;
+- na saída do processo (atexit) o pedido pendente é gravado na hora.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from src.config import ATRASO_GRAVACAO_PROGRESSAO
+from src.rastreamento import rastreador_eventos
+
+
+def gravar_json_atomico(caminho, dados):
+    """
+    Gravar um JSON compacto de forma atômica (arquivo temporário + rename).
+    O temporário tem nome único na mesma pasta do destino: duas gravações
+    simultâneas nunca escrevem no mesmo arquivo.
+    Args:
+        caminho: Arquivo de destino
+        dados: Objeto serializável
+    Returns:
+        True se gravou
+    """
+    try:
+        descritor, temporario = tempfile.mkstemp(prefix=f"{os.path.basename(caminho)}.", suffix='.tmp',
+                                                 dir=os.path.dirname(caminho) or '.')
+    except OSError as e:
+        print(f"Erro ao salvar {caminho}: {e}")
+        return False
+    try:
+        with os.fdopen(descritor, 'w', encoding='utf-8') as f:
+            json.dump(dados, f, separators=(',', ':'), ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporario, caminho)
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Erro ao salvar {caminho}: {e}")
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        return False
+    return True
+
+
+class GravadorAssincrono:
+    """
+    Escritor write-behind de um arquivo JSON.
+    Attributes:
+        caminho (str): Arquivo de destino
+        atraso (float): Janela de coalescência em segundos
+        estatisticas (dict): Pedidos, gravações feitas, pedidos coalescidos e falhas
+    """
+
+    def __init__(self, caminho, atraso=ATRASO_GRAVACAO_PROGRESSAO, nome='gravador'):
+        self.caminho = caminho
+        self.atraso = atraso
+        self.nome = nome
+        self.estatisticas = {'pedidos': 0, 'gravacoes': 0, 'coalescidos': 0, 'falhas': 0}
+        self._condicao = threading.Condition()
+        self._pendente = None
+        self._prazo = 0.0
+        self._gravando = False
+        self._encerrando = False
+        self._thread = None
+
+    def agendar(self, dados):
+        """
+        Pedir a gravação de um retrato dos dados (retorna sem tocar no disco).
+        Args:
+            dados: Objeto serializável que não será mais alterado por quem chamou
+        """
+        with self._condicao:
+            self.estatisticas['pedidos'] += 1
+            if self._pendente is not None:
+                self.estatisticas['coalescidos'] += 1
+            self._pendente = dados
+            self._prazo = time.monotonic() + self.atraso
+            if self._encerrando:
+                # Já na saída do processo: a thread não volta, grava aqui mesmo,
+                # depois da gravação que a thread ainda estiver terminando
+                self._pendente = None
+                while self._gravando:
+                    self._condicao.wait()
+                self._gravar(dados)
+                return
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._executar, name=self.nome, daemon=True)
+                self._thread.start()
+            self._condicao.notify_all()
+
+    def cancelar(self):
+        """Descartar o pedido pendente e esperar a gravação em andamento terminar"""
+        with self._condicao:
+            self._pendente = None
+            while self._gravando:
+                self._condicao.wait()
+
+    def descarregar(self, timeout=None):
+        """
+        Gravar já o pedido pendente e esperar o disco.
+        Args:
+            timeout: Espera máxima em segundos (None espera o quanto for preciso)
+        Returns:
+            True se não sobrou nada para gravar
+        """
+        with self._condicao:
+            self._prazo = 0.0
+            self._condicao.notify_all()
+            return self._condicao.wait_for(lambda: self._pendente is None and not self._gravando, timeout)
+
+    def finalizar(self):
+        """Gravar o que estiver pendente e encerrar a thread (chamado na saída)"""
+        with self._condicao:
+            self._encerrando = True
+            self._condicao.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+        elif self._pendente is not None:
+            self._gravar(self._pendente)
+            self._pendente = None
+
+    def _executar(self):
+        """Laço da thread: esperar um pedido, deixar a janela de coalescência passar e gravar"""
+        while True:
+            with self._condicao:
+                while self._pendente is None and not self._encerrando:
+                    self._condicao.wait()
+                if self._pendente is None:
+                    return
+                # Novos pedidos adiam o prazo; descarregar/finalizar o antecipam
+                while not self._encerrando and self._pendente is not None:
+                    restante = self._prazo - time.monotonic()
+                    if restante <= 0:
+                        break
+                    self._condicao.wait(restante)
+                dados, self._pendente = self._pendente, None
+                if dados is None:
+                    continue
+                self._gravando = True
+            try:
+                self._gravar(dados)
+            finally:
+                with self._condicao:
+                    self._gravando = False
+                    self._condicao.notify_all()
+
+    def _gravar(self, dados):
+        """Escrever um retrato no disco"""
+        with rastreador_eventos.span(f'gravar_{self.nome}', 'io'):
+            if gravar_json_atomico(self.caminho, dados):
+                self.estatisticas['gravacoes'] += 1
+            else:
+                self.estatisticas['falhas'] += 1
@@ -30,6 +30,7 @@ class Player(pygame.sprite.Sprite):
         if not self.personagem:
             raise ValueError(f"Não foi possível carregar o personagem: {personagem_nome}")
         self.super_system = SuperSystem(self.personagem)
+        self.super_usada = 0  # Quantidade de Supers usados na partida
 
         # Sistema de animações
         self.animacao = AnimacaoPersonagem(self.personagem)
@@ -69,7 +70,7 @@ class Player(pygame.sprite.Sprite):
 
         if event.type == MOUSEBUTTONDOWN:
             if event.button == 1:  # Botão esquerdo do mouse
-                self.atirar(pygame.mouse.get_pos(), grupo_tiros, grupo_todos, game_instance)
+                self.atirar(event.pos, grupo_tiros, grupo_todos, game_instance)
         elif event.type == KEYDOWN:
             if event.key == K_Q:  # Habilidade especial (sistema antigo)
                 self.usar_habilidade_especial()
@@ -106,8 +107,15 @@ class Player(pygame.sprite.Sprite):
             self.velocidade *= efeito.get('velocidade_bonus', 2.0)
         elif tipo == 'melodia_curativa':
             self.curar(efeito.get('cura', 60))
-    def update(self, dt, obstaculos, joystick_direcao=None):
-        """Atualizar jogador"""
+    def update(self, dt, obstaculos, joystick_direcao=None, teclas=None):
+        """
+        Atualizar jogador.
+        Args:
+            dt: Delta time em segundos
+            obstaculos: Grupo de obstáculos para colisão
+            joystick_direcao: Direção do joystick virtual (prioritária)
+            teclas: Estado das teclas indexável por código (padrão: pygame.key.get_pressed())
+        """
         # Atualizar sistema de Super
         self.super_system.update(dt)
 
@@ -127,7 +135,7 @@ class Player(pygame.sprite.Sprite):
         self.atualizar_efeitos_especiais(dt)
 
         # Input do teclado
-        keys = pygame.key.get_pressed()
+        keys = teclas if teclas is not None else pygame.key.get_pressed()
         dx = dy = 0
 
         # Priorizar joystick virtual se ativo
@@ -330,10 +338,19 @@ class Player(pygame.sprite.Sprite):
             maior_prioridade = float('-inf')
 
             if game_instance and hasattr(game_instance, 'inimigos'):
-                for inimigo in game_instance.inimigos:
-                    # Verificar se inimigo está vivo
+                inimigos = list(game_instance.inimigos)
+
+                # Linha de visão de todos os candidatos em uma única consulta em lote
+                servico_visibilidade = getattr(game_instance, 'servico_visibilidade', None)
+                if servico_visibilidade:
+                    visiveis = servico_visibilidade.linha_de_visao_lote(inimigos, self)
+                else:
+                    visiveis = [True] * len(inimigos)
+
+                for inimigo, visivel in zip(inimigos, visiveis):
+                    # Verificar se inimigo está vivo e não está atrás de uma parede
                     vida_inimigo = getattr(inimigo, 'vida', 1)
-                    if vida_inimigo <= 0:
+                    if vida_inimigo <= 0 or not visivel:
                         continue
 
                     # Predição de movimento (posição futura) - mais eficiente
@@ -553,6 +570,7 @@ class Player(pygame.sprite.Sprite):
     def usar_super(self):
         """Usa o Super se disponível"""
         if self.super_system.usar_super():
+            self.super_usada += 1
             # Tocar som de Super específico do personagem
             nome_personagem = getattr(self.personagem, 'nome', 'Shelly').lower()
             som_super = f'super_{nome_personagem}'
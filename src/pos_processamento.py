@@ -6,13 +6,15 @@ do jogo em algo próximo ao Brawl Stars original.
 """
 
 import math
-import random
 from typing import Tuple, List, Optional
 import pygame
 from src.pygame_constants import SRCALPHA
 from src.shader_system import processador_shaders, TipoShader, ParametrosShader
 from src.material_system import gerenciador_materiais
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from src.aleatoriedade import aleatorio_visual
+from src.rastreamento import rastreador_eventos
+from src.inicializacao import SingletonPreguicoso
 
 
 class EfeitosPosProcessamento:
@@ -146,8 +148,9 @@ class EfeitosPosProcessamento:
             intensidade = luz.get('intensidade', 1.0)
             cor_luz = luz.get('cor', (255, 255, 255))
             raio = luz.get('raio', 200)
-            self._aplicar_luz_pontual(superficie_iluminada, x_luz, y_luz,
-                                    intensidade, cor_luz, raio)
+            with rastreador_eventos.span('_aplicar_luz_pontual', 'pos_processamento'):
+                self._aplicar_luz_pontual(superficie_iluminada, x_luz, y_luz,
+                                        intensidade, cor_luz, raio)
         return superficie_iluminada
 
     def _aplicar_luz_pontual(self, superficie: pygame.Surface, x_luz: int, y_luz: int,
@@ -296,10 +299,10 @@ class EfeitosPosProcessamento:
         """Aplica noise sutil para quebrar bandas de gradiente"""
         w, h = superficie.get_size()
         for _ in range(w * h // 100):  # Poucos pixels aleatórios
-            x = random.randint(0, w - 1)
-            y = random.randint(0, h - 1)
+            x = aleatorio_visual.randint(0, w - 1)
+            y = aleatorio_visual.randint(0, h - 1)
             pixel = superficie.get_at((x, y))
-            noise = random.randint(-3, 3)
+            noise = aleatorio_visual.randint(-3, 3)
             novo_pixel = (
                 max(0, min(255, pixel[0] + noise)),
                 max(0, min(255, pixel[1] + noise)),
@@ -369,5 +372,5 @@ class EfeitosPosProcessamento:
         self._cache_grade_luz = None
         processador_shaders.limpar_caches()
 
-# Instância global do processador de pós-processamento
-processador_pos = ProcessadorPos()
+# Instância global do processador de pós-processamento (construída no primeiro uso)
+processador_pos = SingletonPreguicoso('processador_pos', EfeitosPosProcessamento)
@@ -7,9 +7,9 @@ aplicação temporária de melhorias ao jogador.
 """
 
 import math
-import random
 import pygame
 from src.config import TAMANHO_POWER_UP
+from src.aleatoriedade import aleatorio_jogo
 
 class PowerUp(pygame.sprite.Sprite):
     """Classe dos power-ups"""
@@ -18,7 +18,7 @@ class PowerUp(pygame.sprite.Sprite):
 
     def __init__(self, x, y):
         super().__init__()
-        self.tipo = random.choice(self.TIPOS)
+        self.tipo = aleatorio_jogo.choice(self.TIPOS)
 
         # Criar visual baseado no tipo
         self.image = pygame.Surface((TAMANHO_POWER_UP, TAMANHO_POWER_UP))
@@ -46,6 +46,9 @@ K_F3 = 1073741884
 K_F4 = 1073741885
 K_F5 = 1073741886
 K_F6 = 1073741887
+K_F7 = 1073741888
+K_F8 = 1073741889
+K_F9 = 1073741890
 K_F12 = 1073741893
 
 # Teclas numéricas
@@ -70,7 +70,10 @@ class QuadTree:
         Returns:
             Índice do quadrante (0-3) ou -1 se não couber completamente em um
         """
-        rect = sprite.rect
+        return self._get_index_rect(sprite.rect)
+
+    def _get_index_rect(self, rect: pygame.Rect) -> int:
+        """Determinar o quadrante de um retângulo (ver get_index)."""
         vertical_midpoint = self.bounds.x + (self.bounds.width // 2)
         horizontal_midpoint = self.bounds.y + (self.bounds.height // 2)
 
@@ -159,6 +162,30 @@ class QuadTree:
 
         return return_objects
 
+    def retrieve_area(self, rect: pygame.Rect) -> List:
+        """
+        Recuperar todos os objetos que podem colidir com uma área arbitrária.
+
+        Args:
+            rect: Retângulo da área consultada
+
+        Returns:
+            Lista de sprites que podem colidir
+        """
+        return_objects = []
+        index = self._get_index_rect(rect)
+
+        if self.nodes and index != -1:
+            return_objects.extend(self.nodes[index].retrieve_area(rect))
+
+        return_objects.extend(self.objects)
+
+        if self.nodes and index == -1:
+            for node in self.nodes:
+                return_objects.extend(node.retrieve_area(rect))
+
+        return return_objects
+
     def get_all_objects(self) -> List:
         """Recuperar todos os objetos na árvore."""
         all_objects = self.objects.copy()
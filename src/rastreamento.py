@@ -0,0 +1,179 @@
+"""
+Rastreamento de eventos do Brawl Stars Clone.
+Este módulo grava, durante uma janela limitada, as etapas de cada quadro
+(as mesmas seções do perfilador) e eventos pontuais do jogo (spawn de
+inimigos, explosões, quadros de shader, salvamento da progressão) no formato
+trace_event do Chrome. O arquivo gerado abre em chrome://tracing ou no
+Perfetto (ui.perfetto.dev) e mostra os picos de tempo em uma linha do tempo.
+
+A janela começa com a tecla F9 ou com a flag --rastrear[=segundos] e termina
+sozinha depois de DURACAO_RASTREAMENTO segundos (ou F9 de novo).
+Desligado, cada ponto de rastreamento só custa uma verificação de flag.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+from src.config import PASTA_PERFIS, DURACAO_RASTREAMENTO, MAX_EVENTOS_RASTREAMENTO
+
+_SPAN_NULO = nullcontext()
+
+
+class _Span:
+    """Escopo de um evento com duração (fase 'X' do trace_event)"""
+
+    __slots__ = ('rastreador', 'nome', 'categoria', 'inicio')
+
+    def __init__(self, rastreador, nome, categoria):
+        self.rastreador = rastreador
+        self.nome = nome
+        self.categoria = categoria
+        self.inicio = 0.0
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        self.rastreador.registrar_duracao(self.nome, self.inicio,
+                                          time.perf_counter() - self.inicio, self.categoria)
+        return False
+
+
+class RastreadorEventos:
+    """
+    Grava eventos trace_event durante uma janela de tempo limitada.
+    Attributes:
+        ativo (bool): Se há uma janela de rastreamento aberta
+        eventos (list): Eventos gravados na janela atual
+        ultimo_arquivo (str): Caminho do último rastro salvo
+    """
+
+    def __init__(self, max_eventos=MAX_EVENTOS_RASTREAMENTO):
+        self.ativo = False
+        self.max_eventos = max_eventos
+        self.eventos = []
+        self.inicio = 0.0
+        self.fim = 0.0
+        self.caminho = None
+        self.pid = os.getpid()
+        self.ultimo_arquivo = None
+
+    def iniciar(self, duracao=DURACAO_RASTREAMENTO, caminho=None):
+        """
+        Abrir uma janela de rastreamento (uma janela aberta é salva antes).
+        Args:
+            duracao: Segundos de rastreamento até salvar automaticamente
+            caminho: Arquivo de destino (padrão: PASTA_PERFIS/rastro_<data>.json)
+        """
+        self.finalizar()
+        self.eventos = []
+        self.caminho = caminho
+        self.pid = os.getpid()
+        self.inicio = time.perf_counter()
+        self.fim = self.inicio + duracao
+        self.ativo = True
+        print(f"Rastreamento iniciado ({duracao:.1f}s)")
+
+    def alternar(self, duracao=DURACAO_RASTREAMENTO):
+        """Abrir uma janela ou encerrar a atual antes do tempo (tecla F9)"""
+        if self.ativo:
+            self.finalizar()
+        else:
+            self.iniciar(duracao)
+
+    def span(self, nome, categoria='jogo'):
+        """
+        Medir um trecho de código como um evento com duração.
+        Uso: with rastreador_eventos.span('salvar_progressao', 'io'): ...
+        Args:
+            nome: Nome mostrado na linha do tempo
+            categoria: Categoria do evento (filtro do visualizador)
+        Returns:
+            Gerenciador de contexto (nulo quando desligado)
+        """
+        if not self.ativo:
+            return _SPAN_NULO
+        return _Span(self, nome, categoria)
+
+    def registrar_duracao(self, nome, inicio, duracao, categoria='etapa'):
+        """
+        Gravar um evento com duração já medida.
+        Args:
+            nome: Nome do evento
+            inicio: Início em time.perf_counter()
+            duracao: Duração em segundos
+            categoria: Categoria do evento
+        """
+        if self.ativo:
+            self._registrar({'name': nome, 'cat': categoria, 'ph': 'X',
+                             'ts': (inicio - self.inicio) * 1e6, 'dur': duracao * 1e6})
+
+    def instante(self, nome, categoria='jogo', args=None):
+        """
+        Gravar um evento pontual (fase 'i').
+        Args:
+            nome: Nome do evento
+            categoria: Categoria do evento
+            args: Dicionário de dados extras mostrados ao selecionar o evento
+        """
+        if not self.ativo:
+            return
+        evento = {'name': nome, 'cat': categoria, 'ph': 'i', 's': 't',
+                  'ts': (time.perf_counter() - self.inicio) * 1e6}
+        if args:
+            evento['args'] = args
+        self._registrar(evento)
+
+    def _registrar(self, evento):
+        """Completar e guardar um evento, fechando a janela quando ela acaba"""
+        agora = time.perf_counter()
+        if agora > self.fim or len(self.eventos) >= self.max_eventos:
+            self.finalizar()
+            return
+        evento['pid'] = self.pid
+        evento['tid'] = threading.get_native_id()
+        self.eventos.append(evento)
+
+    def finalizar(self):
+        """
+        Fechar a janela atual e salvar o rastro.
+        Returns:
+            Caminho do arquivo salvo, ou None se não havia janela aberta
+        """
+        if not self.ativo:
+            return None
+        self.ativo = False
+        eventos, self.eventos = self.eventos, []
+
+        caminho = self.caminho
+        if caminho is None:
+            os.makedirs(PASTA_PERFIS, exist_ok=True)
+            caminho = os.path.join(PASTA_PERFIS, f"rastro_{time.strftime('%Y%m%d_%H%M%S')}.json")
+
+        # Metadados: nomes do processo e das threads na linha do tempo
+        metadados = [{'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'tid': 0,
+                      'args': {'name': 'Brawl Stars Clone'}}]
+        nomes_threads = {thread.native_id: thread.name for thread in threading.enumerate()}
+        for tid in sorted({evento['tid'] for evento in eventos}):
+            metadados.append({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid,
+                              'args': {'name': nomes_threads.get(tid, str(tid))}})
+
+        try:
+            with open(caminho, 'w', encoding='utf-8') as f:
+                json.dump({'traceEvents': metadados + eventos, 'displayTimeUnit': 'ms'},
+                          f, separators=(',', ':'))
+        except OSError as e:
+            print(f"Erro ao salvar rastreamento: {e}")
+            return None
+        self.ultimo_arquivo = caminho
+        print(f"Rastreamento salvo em {caminho} ({len(eventos)} eventos)")
+        return caminho
+
+
+# Instância global do rastreador
+rastreador_eventos = RastreadorEventos()
+atexit.register(rastreador_eventos.finalizar)
@@ -11,6 +11,7 @@ from typing import Tuple, List
 import pygame
 from src.pygame_constants import SRCALPHA
 from src.animacao_3d import animador_global, UtilsFormasOrganicas
+from src.inicializacao import SingletonPreguicoso
 
 class Renderer3D:
     """Sistema de renderização com efeitos 3D para personagens e cenário"""
@@ -1367,9 +1368,6 @@ class Renderer3D:
         return pe_esq, pe_dir
 
 
-# Criar instância global do renderer
-renderer_3d = Renderer3D()
-
 def _criar_metodos_personagens(renderer_instance):
     """Anexa dinamicamente todos os métodos desenhar_*_3d da classe Renderer3D à instância global."""
     nomes = [
@@ -1385,5 +1383,12 @@ def _criar_metodos_personagens(renderer_instance):
         if metodo is not None:
             setattr(renderer_instance, nome, types.MethodType(metodo, renderer_instance))
 
-# Anexar métodos dinamicamente
-_criar_metodos_personagens(renderer_3d)
+
+def _criar_renderer_3d():
+    """Construir o renderer global e anexar os métodos dos personagens"""
+    renderer = Renderer3D()
+    _criar_metodos_personagens(renderer)
+    return renderer
+
+# Instância global do renderer (construída no primeiro uso)
+renderer_3d = SingletonPreguicoso('renderer_3d', _criar_renderer_3d)
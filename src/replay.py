@@ -0,0 +1,277 @@
+"""
+Gravação e reprodução de partidas do Brawl Stars Clone.
+Este módulo grava a semente da partida, os eventos recebidos por
+Game.handle_game_event e o dt de cada passo de simulação. Como toda a
+aleatoriedade do gameplay vem do serviço semeado (src.aleatoriedade), a
+reprodução de uma gravação repete a partida exatamente, o que permite medir
+a mesma luta antes e depois de uma mudança de performance.
+
+A gravação é ativada com a flag --gravar (ou a variável de ambiente
+BRAWL_GRAVAR) e cada partida é salva em PASTA_REPLAYS.
+
+Uso da reprodução (sem tela):
+    python -m src.replay replays/partida_20250101_120000_12345.json --repeticoes 5
+"""
+
+import argparse
+import atexit
+import hashlib
+import json
+import os
+import time
+import pygame
+from src.config import PASTA_REPLAYS
+from src.pygame_constants import KEYDOWN, KEYUP
+
+# Variável de ambiente que ativa a gravação das partidas
+VARIAVEL_AMBIENTE_GRAVACAO = 'BRAWL_GRAVAR'
+
+# Versão do formato do arquivo de gravação
+VERSAO_REPLAY = 1
+
+# Atributos dos eventos que influenciam o jogo (os demais não são gravados)
+ATRIBUTOS_EVENTO = ('key', 'mod', 'unicode', 'button', 'pos', 'rel', 'buttons', 'x', 'y')
+
+
+def gravacao_ativa():
+    """Verificar se as partidas devem ser gravadas (variável de ambiente)"""
+    return os.environ.get(VARIAVEL_AMBIENTE_GRAVACAO, '').strip().lower() in ('1', 'true', 'sim', 'yes')
+
+
+def ativar_gravacao():
+    """Ativar a gravação de partidas para o processo atual"""
+    os.environ[VARIAVEL_AMBIENTE_GRAVACAO] = '1'
+
+
+def serializar_evento(event):
+    """
+    Converter um evento do pygame em um dicionário JSON.
+    Args:
+        event: Evento do pygame
+    Returns:
+        Dicionário com o tipo e os atributos relevantes do evento
+    """
+    dados = {'tipo': event.type}
+    for atributo in ATRIBUTOS_EVENTO:
+        if hasattr(event, atributo):
+            valor = getattr(event, atributo)
+            dados[atributo] = list(valor) if isinstance(valor, tuple) else valor
+    return dados
+
+
+def desserializar_evento(dados):
+    """
+    Recriar um evento do pygame a partir do dicionário gravado.
+    Args:
+        dados: Dicionário produzido por serializar_evento
+    Returns:
+        pygame.event.Event equivalente ao original
+    """
+    atributos = {chave: tuple(valor) if isinstance(valor, list) else valor
+                 for chave, valor in dados.items() if chave != 'tipo'}
+    return pygame.event.Event(dados['tipo'], atributos)
+
+
+def resumo_estado(game):
+    """
+    Calcular uma impressão digital do estado de gameplay.
+    Duas execuções com o mesmo resumo chegaram ao mesmo estado (posições,
+    vidas, projéteis e placar), então serve para conferir uma reprodução.
+    Args:
+        game: Instância do jogo
+    Returns:
+        String hexadecimal do resumo
+    """
+    partes = [game.tempo_partida, game.pontuacao, game.gemas_coletadas,
+              game.dano_total_causado, game.dano_total_recebido, game.inimigos_eliminados]
+    jogador = game.jogador
+    if jogador:
+        partes.append((jogador.pos_x, jogador.pos_y, jogador.vida))
+    partes.extend((float(inimigo.pos_x), float(inimigo.pos_y), inimigo.vida) for inimigo in game.inimigos)
+    partes.extend((tiro.pos_x, tiro.pos_y) for tiro in game.tiros)
+    return hashlib.sha1(repr(partes).encode('utf-8')).hexdigest()
+
+
+class EstadoTeclas:
+    """
+    Teclas pressionadas reconstruídas a partir dos eventos KEYDOWN/KEYUP.
+    Substitui pygame.key.get_pressed() no gameplay para que o movimento
+    dependa apenas dos eventos, que são gravados e reproduzidos.
+    """
+
+    def __init__(self):
+        self.pressionadas = set()
+
+    def processar_evento(self, event):
+        """Atualizar as teclas pressionadas com um evento"""
+        if event.type == KEYDOWN:
+            self.pressionadas.add(event.key)
+        elif event.type == KEYUP:
+            self.pressionadas.discard(event.key)
+
+    def limpar(self):
+        """Soltar todas as teclas (início de partida)"""
+        self.pressionadas.clear()
+
+    def __getitem__(self, tecla):
+        return tecla in self.pressionadas
+
+
+class GravadorEntrada:
+    """
+    Grava a semente, os eventos e o dt de cada passo da partida atual.
+    A gravação anterior é salva quando uma nova partida começa e, por fim,
+    ao encerrar o processo.
+    Attributes:
+        pasta (str): Pasta onde as gravações são salvas
+        ultimo_arquivo (str): Caminho da última gravação salva
+    """
+
+    def __init__(self, pasta=PASTA_REPLAYS):
+        self.pasta = pasta
+        self.game = None
+        self.dados = None
+        self.eventos_pendentes = []
+        self.ultimo_arquivo = None
+
+    @property
+    def gravando(self):
+        """Se há uma partida sendo gravada"""
+        return self.dados is not None
+
+    def iniciar(self, game, personagem, semente):
+        """
+        Começar a gravar uma partida (salvando a anterior, se houver).
+        Args:
+            game: Instância do jogo gravada
+            personagem: Brawler do jogador
+            semente: Semente da partida (servico_aleatorio.reiniciar)
+        """
+        self.finalizar()
+        self.game = game
+        self.eventos_pendentes = []
+        self.dados = {
+            'versao': VERSAO_REPLAY,
+            'personagem': personagem,
+            'semente': semente,
+            'passos': [],
+        }
+
+    def registrar_evento(self, event):
+        """Guardar um evento para o próximo passo de simulação"""
+        if self.dados is not None:
+            self.eventos_pendentes.append(serializar_evento(event))
+
+    def registrar_passo(self, dt):
+        """Fechar um passo: os eventos pendentes são aplicados antes dele"""
+        if self.dados is not None:
+            self.dados['passos'].append([dt, self.eventos_pendentes])
+            self.eventos_pendentes = []
+
+    def finalizar(self):
+        """
+        Salvar a gravação atual (partidas sem nenhum passo são descartadas).
+        Returns:
+            Caminho do arquivo salvo, ou None
+        """
+        dados, game = self.dados, self.game
+        self.dados = None
+        self.game = None
+        if not dados or not dados['passos']:
+            return None
+
+        # Estado final para conferir reproduções
+        dados['resumo_final'] = resumo_estado(game)
+        os.makedirs(self.pasta, exist_ok=True)
+        nome = f"partida_{time.strftime('%Y%m%d_%H%M%S')}_{dados['semente']}.json"
+        caminho = os.path.join(self.pasta, nome)
+        try:
+            with open(caminho, 'w', encoding='utf-8') as f:
+                json.dump(dados, f, separators=(',', ':'))
+        except OSError as e:
+            print(f"Erro ao salvar gravação: {e}")
+            return None
+        self.ultimo_arquivo = caminho
+        print(f"Partida gravada em {caminho}")
+        return caminho
+
+
+class ReprodutorEntrada:
+    """
+    Reproduz uma gravação em uma instância de Game.
+    Attributes:
+        dados (dict): Conteúdo da gravação
+    """
+
+    def __init__(self, dados):
+        if dados.get('versao') != VERSAO_REPLAY:
+            raise ValueError(f"Versão de gravação não suportada: {dados.get('versao')}")
+        self.dados = dados
+
+    @classmethod
+    def carregar(cls, caminho):
+        """Carregar uma gravação salva por GravadorEntrada"""
+        with open(caminho, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def reproduzir(self, game):
+        """
+        Repetir a partida gravada passo a passo.
+        Args:
+            game: Instância do jogo (normalmente headless)
+        Returns:
+            Dicionário com passos, tempo real, resumo final e se ele confere com a gravação
+        """
+        # Entrada vem só dos eventos gravados: sem bot e com os controles virtuais da UI
+        game.controlador = None
+        if game.ui is None:
+            from src.ui import UI  # pylint: disable=import-outside-toplevel
+            game.ui = UI()
+        game.iniciar_partida(self.dados['personagem'], semente=self.dados['semente'])
+
+        inicio = time.perf_counter()
+        for dt, eventos in self.dados['passos']:
+            for evento in eventos:
+                game.handle_game_event(desserializar_evento(evento))
+            game.update(dt)
+        tempo_real = time.perf_counter() - inicio
+
+        resumo = resumo_estado(game)
+        return {
+            'passos': len(self.dados['passos']),
+            'tempo_real': round(tempo_real, 3),
+            'resumo': resumo,
+            'identico': resumo == self.dados.get('resumo_final'),
+        }
+
+
+# Instância global do gravador (usada pelo Game quando a gravação está ativa)
+gravador_entrada = GravadorEntrada()
+atexit.register(gravador_entrada.finalizar)
+
+
+def main(argumentos=None):
+    """Reproduzir uma gravação sem tela e medir o tempo de cada repetição"""
+    parser = argparse.ArgumentParser(description="Reprodução determinística de partidas gravadas")
+    parser.add_argument('arquivo', help="Arquivo de gravação (.json)")
+    parser.add_argument('--repeticoes', type=int, default=1, help="Quantas vezes reproduzir a partida")
+    args = parser.parse_args(argumentos)
+
+    # pylint: disable=import-outside-toplevel
+    from src.simulacao_headless import criar_jogo_headless
+
+    reprodutor = ReprodutorEntrada.carregar(args.arquivo)
+    game = criar_jogo_headless()
+    tempos = []
+    for repeticao in range(1, args.repeticoes + 1):
+        resultado = reprodutor.reproduzir(game)
+        tempos.append(resultado['tempo_real'])
+        situacao = "idêntica" if resultado['identico'] else "DIVERGENTE"
+        print(f"Reprodução {repeticao}: {resultado['passos']} passos em "
+              f"{resultado['tempo_real']:.3f}s ({situacao})")
+    if len(tempos) > 1:
+        print(f"Melhor: {min(tempos):.3f}s  Média: {sum(tempos) / len(tempos):.3f}s")
+
+
+if __name__ == '__main__':
+    main()
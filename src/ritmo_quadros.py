@@ -0,0 +1,209 @@
+"""
+Monitor de ritmo de quadros do Brawl Stars Clone.
+Este módulo acompanha o intervalo entre quadros do loop principal em
+histogramas logarítmicos (estilo HDR: erro relativo limitado em qualquer
+escala), um por estado do jogo, para obter p50/p95/p99/máximo sem guardar
+cada quadro. Quadros acima de LIMIAR_ENGASGO vezes o alvo são marcados como
+engasgos e levam a etapa mais lenta daquele quadro. Para isso o monitor liga
+o modo leve do perfilador (as seções de atualizar_jogo/renderizar_jogo são
+medidas, mas só o último quadro é guardado), não o histórico nem o overlay F7.
+
+Média de FPS esconde os engasgos que importam (a primeira explosão, uma
+troca de clima, o primeiro desenho de um Brawler); os percentis não.
+O resumo é impresso e gravado em PASTA_PERFIS ao encerrar o jogo.
+"""
+
+import atexit
+import json
+import math
+import os
+import time
+from collections import deque
+import numpy as np
+from src.config import (FPS, PASTA_PERFIS, LIMIAR_ENGASGO, PRECISAO_HISTOGRAMA_QUADROS,
+                        MAX_ENGASGOS_REGISTRADOS)
+from src.perfilador import perfilador_quadro, ETAPAS_PERFIL
+from src.rastreamento import rastreador_eventos
+
+# Percentis relatados no resumo
+PERCENTIS_RITMO = (50, 95, 99)
+
+
+class HistogramaTempos:
+    """
+    Histograma de tempos com baldes logarítmicos.
+    Cada balde cobre um intervalo (1 + precisao) vezes maior que o anterior,
+    então qualquer percentil tem erro relativo de no máximo 'precisao'.
+    Attributes:
+        contagens (np.ndarray): Quantidade de amostras por balde
+        total (int): Amostras registradas
+        maximo (float): Maior valor registrado (exato)
+    """
+
+    def __init__(self, minimo=0.0001, maximo=10.0, precisao=PRECISAO_HISTOGRAMA_QUADROS):
+        self.minimo = minimo
+        self.fator = 1.0 + precisao
+        self.escala = 1.0 / math.log(self.fator)
+        quantidade = int(math.ceil(math.log(maximo / minimo) * self.escala)) + 1
+        self.contagens = np.zeros(quantidade, dtype=np.int64)
+        self.total = 0
+        self.maximo = 0.0
+
+    def registrar(self, valor):
+        """Adicionar uma amostra (em segundos)"""
+        if valor > self.minimo:
+            balde = min(int(math.log(valor / self.minimo) * self.escala), len(self.contagens) - 1)
+        else:
+            balde = 0
+        self.contagens[balde] += 1
+        self.total += 1
+        if valor > self.maximo:
+            self.maximo = valor
+
+    def percentil(self, percentual):
+        """
+        Calcular um percentil.
+        Args:
+            percentual: Percentil entre 0 e 100
+        Returns:
+            Limite superior do balde do percentil em segundos (0.0 sem amostras)
+        """
+        if not self.total:
+            return 0.0
+        posicao = max(1, int(math.ceil(self.total * percentual / 100.0)))
+        balde = int(np.searchsorted(np.cumsum(self.contagens), posicao))
+        return min(self.minimo * self.fator ** (balde + 1), self.maximo)
+
+
+class MonitorRitmo:
+    """
+    Histograma de intervalos entre quadros por estado e registro de engasgos.
+    Attributes:
+        histogramas (dict): Estado do jogo -> HistogramaTempos
+        engasgos (deque): Engasgos mais recentes (dicionários)
+        engasgos_por_estado (dict): Estado do jogo -> quantidade de engasgos
+    """
+
+    def __init__(self, alvo=1.0 / FPS, limiar=LIMIAR_ENGASGO):
+        self.ativo = False
+        self.alvo = alvo
+        self.limite_engasgo = alvo * limiar
+        self.histogramas = {}
+        self.engasgos = deque(maxlen=MAX_ENGASGOS_REGISTRADOS)
+        self.engasgos_por_estado = {}
+        self.quadros = 0
+
+    def iniciar(self):
+        """Começar a monitorar (liga o modo leve do perfilador para saber a etapa mais lenta)"""
+        self.ativo = True
+        self.quadros = 0
+        perfilador_quadro.ativar_leve(True)
+
+    def registrar_quadro(self, dt, estado):
+        """
+        Registrar o intervalo do quadro anterior.
+        Chamado logo depois do clock.tick, antes de o novo quadro começar,
+        quando o perfilador ainda guarda as etapas do quadro medido.
+        Args:
+            dt: Intervalo entre quadros em segundos
+            estado: Estado do jogo durante o quadro (EstadoJogo)
+        """
+        if not self.ativo:
+            return
+        self.quadros += 1
+        if self.quadros == 1:
+            # O primeiro intervalo inclui a inicialização do jogo
+            return
+
+        histograma = self.histogramas.get(estado)
+        if histograma is None:
+            histograma = self.histogramas[estado] = HistogramaTempos()
+        histograma.registrar(dt)
+
+        if dt > self.limite_engasgo:
+            self._registrar_engasgo(dt, estado)
+
+    def _registrar_engasgo(self, dt, estado):
+        """Guardar um engasgo com a etapa que mais pesou no quadro (None antes do primeiro quadro medido)"""
+        etapa, tempo_etapa = None, None
+        linha = perfilador_quadro.etapas_ultimo_quadro()
+        if linha is not None:
+            indice = int(np.argmax(linha[:-1]))
+            etapa, tempo_etapa = ETAPAS_PERFIL[indice], float(linha[indice])
+            fora_das_etapas = float(linha[-1] - linha[:-1].sum())
+            if fora_das_etapas > tempo_etapa:
+                etapa, tempo_etapa = 'outros', fora_das_etapas
+
+        engasgo = {
+            'quadro': self.quadros,
+            'estado': estado,
+            'tempo_ms': round(dt * 1000.0, 2),
+            'etapa_mais_lenta': etapa,
+            'etapa_ms': round(tempo_etapa * 1000.0, 2) if tempo_etapa is not None else None,
+        }
+        self.engasgos.append(engasgo)
+        self.engasgos_por_estado[estado] = self.engasgos_por_estado.get(estado, 0) + 1
+        rastreador_eventos.instante('engasgo', 'ritmo', engasgo)
+
+    def resumo(self):
+        """
+        Montar o resumo por estado.
+        Returns:
+            Dicionário com alvo, limite de engasgo, estados (percentis em ms) e engasgos recentes
+        """
+        estados = {}
+        for estado, histograma in self.histogramas.items():
+            metricas = {'quadros': histograma.total}
+            for percentual in PERCENTIS_RITMO:
+                metricas[f'p{percentual}_ms'] = round(histograma.percentil(percentual) * 1000.0, 2)
+            metricas['max_ms'] = round(histograma.maximo * 1000.0, 2)
+            metricas['engasgos'] = self.engasgos_por_estado.get(estado, 0)
+            estados[estado] = metricas
+        return {
+            'alvo_ms': round(self.alvo * 1000.0, 2),
+            'limite_engasgo_ms': round(self.limite_engasgo * 1000.0, 2),
+            'estados': estados,
+            'engasgos': list(self.engasgos),
+        }
+
+    def formatar_resumo(self, resumo=None):
+        """Formatar o resumo como tabela de texto"""
+        resumo = resumo or self.resumo()
+        cabecalho = (f"{'Estado':<18} {'Quadros':>8} {'p50':>8} {'p95':>8} {'p99':>8} "
+                     f"{'Máx':>8} {'Engasgos':>9}")
+        linhas = [cabecalho, '-' * len(cabecalho)]
+        for estado, m in resumo['estados'].items():
+            linhas.append(f"{estado:<18} {m['quadros']:>8} {m['p50_ms']:>8.2f} {m['p95_ms']:>8.2f} "
+                          f"{m['p99_ms']:>8.2f} {m['max_ms']:>8.2f} {m['engasgos']:>9}")
+        return '\n'.join(linhas)
+
+    def salvar_resumo(self, caminho=None):
+        """
+        Imprimir e gravar o resumo (chamado ao encerrar o processo).
+        Args:
+            caminho: Arquivo JSON de destino (padrão: PASTA_PERFIS/ritmo_<data>.json)
+        Returns:
+            Caminho do arquivo gravado, ou None se nada foi medido
+        """
+        if not self.histogramas:
+            return None
+        resumo = self.resumo()
+        print(f"Ritmo de quadros (tempos em ms, alvo {resumo['alvo_ms']:.2f} ms):")
+        print(self.formatar_resumo(resumo))
+
+        if caminho is None:
+            os.makedirs(PASTA_PERFIS, exist_ok=True)
+            caminho = os.path.join(PASTA_PERFIS, f"ritmo_{time.strftime('%Y%m%d_%H%M%S')}.json")
+        try:
+            with open(caminho, 'w', encoding='utf-8') as f:
+                json.dump(resumo, f, indent=2, ensure_ascii=False)
+        except OSError as e:
+            print(f"Erro ao salvar resumo de ritmo: {e}")
+            return None
+        print(f"Resumo de ritmo salvo em {caminho}")
+        return caminho
+
+
+# Instância global do monitor
+monitor_ritmo = MonitorRitmo()
+atexit.register(monitor_ritmo.salvar_resumo)
@@ -12,6 +12,8 @@ from typing import Tuple, List, Optional, Dict, Any
 from enum import Enum
 from src.pygame_constants import SRCALPHA
 from src.material_system import gerenciador_materiais
+from src.rastreamento import rastreador_eventos
+from src.inicializacao import SingletonPreguicoso
 
 
 class TipoShader(Enum):
@@ -488,11 +490,12 @@ class ProcessadorShaders:
             TipoShader.BLOOM
         ]
 
-        for tipo_shader in ordem_shaders:
-            if self.shaders_ativos.get(tipo_shader, False):
-                shader = self._obter_shader(tipo_shader)
-                if shader and shader.ativo:
-                    resultado = shader.aplicar(resultado, **kwargs)
+        with rastreador_eventos.span('processar_frame', 'shader'):
+            for tipo_shader in ordem_shaders:
+                if self.shaders_ativos.get(tipo_shader, False):
+                    shader = self._obter_shader(tipo_shader)
+                    if shader and shader.ativo:
+                        resultado = shader.aplicar(resultado, **kwargs)
 
         return resultado
 
@@ -535,5 +538,5 @@ class ProcessadorShaders:
             shader.limpar_cache()  # Limpar cache quando parâmetros mudam
 
 
-# Instância global do processador
-processador_shaders = ProcessadorShaders()
+# Instância global do processador (construída no primeiro uso)
+processador_shaders = SingletonPreguicoso('processador_shaders', ProcessadorShaders)
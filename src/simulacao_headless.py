@@ -0,0 +1,84 @@
+"""
+Execução de partidas headless do Brawl Stars Clone.
+Este módulo roda uma partida completa sem tela, controlada por um bot ou
+roteiro, em passos fixos tão rápido quanto a CPU permitir, e devolve as
+estatísticas da partida. É a base para simulações em lote, testes de carga
+e benchmarks.
+"""
+
+import time
+import pygame
+from src.headless import ativar_modo_headless, ControladorBot
+from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, TAXA_SIMULACAO, TEMPO_MAXIMO_PARTIDA_HEADLESS
+
+
+def criar_jogo_headless(controlador=None):
+    """
+    Criar uma instância de Game sem tela.
+    Args:
+        controlador: Controlador externo (padrão: ControladorBot)
+    Returns:
+        Game pronto para iniciar uma partida
+    """
+    ativar_modo_headless()
+    pygame.init()  # pylint: disable=no-member
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    # Importado aqui para que os singletons do jogo vejam o modo headless
+    from src.game import Game  # pylint: disable=import-outside-toplevel
+    game = Game(screen)
+    game.controlador = controlador or ControladorBot()
+    return game
+
+
+def executar_partida_headless(nome_personagem, controlador=None, game=None,
+                              passo=1.0 / TAXA_SIMULACAO, tempo_maximo=TEMPO_MAXIMO_PARTIDA_HEADLESS,
+                              semente=None):
+    """
+    Simular uma partida completa sem tela.
+    Args:
+        nome_personagem: Brawler controlado pelo bot
+        controlador: Controlador externo (padrão: ControladorBot)
+        game: Instância headless a reutilizar (opcional)
+        passo: Duração de cada passo de simulação em segundos
+        tempo_maximo: Tempo simulado máximo antes de encerrar sem vitória
+        semente: Semente da partida (padrão: sorteada)
+    Returns:
+        Dicionário com o resultado e as estatísticas da partida
+    """
+    if game is None:
+        game = criar_jogo_headless(controlador)
+    elif controlador is not None:
+        game.controlador = controlador
+    game.iniciar_partida(nome_personagem, semente=semente)
+
+    inicio = time.perf_counter()
+    tempo = 0.0
+    passos = 0
+    while tempo < tempo_maximo and not game.vitoria_alcancada:
+        game.update(passo)
+        tempo += passo
+        passos += 1
+
+    # Experiência que a partida renderia (calculada sem salvar a progressão)
+    from src.sistema_progressao import sistema_progressao  # pylint: disable=import-outside-toplevel
+    exp_ganha = sistema_progressao.calcular_experiencia_partida(
+        game.vitoria_alcancada, tempo, game.dano_total_causado,
+        game.inimigos_eliminados, game.gemas_coletadas
+    )
+
+    jogador = game.jogador
+    return {
+        'personagem': nome_personagem,
+        'semente': game.semente_partida,
+        'vitoria': game.vitoria_alcancada,
+        'tempo_partida': round(tempo, 3),
+        'dano_causado': game.dano_total_causado,
+        'dano_recebido': game.dano_total_recebido,
+        'inimigos_eliminados': game.inimigos_eliminados,
+        'gemas_coletadas': game.gemas_coletadas,
+        'supers_usados': getattr(jogador, 'super_usada', 0),
+        'exp_ganha': exp_ganha,
+        'passos': passos,
+        'tempo_real': round(time.perf_counter() - inicio, 3),
+    }
@@ -0,0 +1,274 @@
+"""
+Síntese procedural dos sons do Brawl Stars Clone.
+Este módulo reúne os geradores dos efeitos sonoros (tiros, impactos,
+explosão, power-ups, habilidades, interface e ambiente) como funções puras:
+cada gerador recebe a taxa de amostragem, um gerador aleatório e seus
+parâmetros e devolve o sinal mono em float. sintetizar() converte o sinal
+para o formato do mixer (int16, contíguo em C, um ou dois canais).
+
+Como o resultado depende só do gerador, dos parâmetros, da semente e do
+formato, ele pode ser guardado em cache (src.cache_audio) pela chave
+calculada em chave_som().
+
+Os sons de combate têm variantes (tom e filtro diferentes, outro ruído)
+geradas junto com o banco; o gerenciador de áudio sorteia uma a cada toque.
+"""
+
+import hashlib
+import json
+import zlib
+import numpy as np
+from src.config import VARIANTES_POR_SOM, DESVIO_TOM_VARIANTES
+
+# Versão dos geradores: mudar o código de um gerador exige incrementar para invalidar o cache
+VERSAO_SINTESE = 2
+
+
+def _tempo(taxa, duracao):
+    """Instantes de amostragem de um som com a duração dada"""
+    return np.linspace(0, duracao, int(taxa * duracao), False)
+
+
+def _fade_final(som, taxa, duracao_fade):
+    """Aplicar um fade out linear no fim do som (no lugar)"""
+    amostras = int(taxa * duracao_fade)
+    som[-amostras:] *= np.linspace(1, 0, amostras)
+    return som
+
+
+def gerar_tiro(taxa, rng, duracao=0.08, decaimento=30.0, freq_corte=2000.0, ganho=0.6):
+    """Tiro: ruído branco com envelope exponencial e brilho em freq_corte"""
+    t = _tempo(taxa, duracao)
+    ruido = rng.normal(0, 0.3, len(t))
+    envelope = np.exp(-t * decaimento)
+    som = ruido * envelope * (1 + np.sin(2 * np.pi * freq_corte * t) * 0.2)
+    return np.clip(som * ganho, -1, 1)
+
+
+def gerar_impacto(taxa, rng, duracao=0.15, freq_grave=120.0, decaimento=15.0, ganho=0.7):
+    """Impacto: ruído com um tom baixo"""
+    t = _tempo(taxa, duracao)
+    ruido = rng.normal(0, 0.4, len(t))
+    tom_baixo = np.sin(2 * np.pi * freq_grave * t) * 0.5
+    envelope = np.exp(-t * decaimento)
+    return np.clip((ruido + tom_baixo) * envelope * ganho, -1, 1)
+
+
+def gerar_explosao(taxa, rng, duracao=0.3, freq1=80.0, freq2=150.0, decaimento=8.0, ganho=0.8):
+    """Explosão: ruído e dois tons baixos com decaimento lento"""
+    t = _tempo(taxa, duracao)
+    ruido = rng.normal(0, 0.5, len(t))
+    tom1 = np.sin(2 * np.pi * freq1 * t) * 0.6
+    tom2 = np.sin(2 * np.pi * freq2 * t) * 0.4
+    envelope = np.exp(-t * decaimento)
+    return np.clip((ruido + tom1 + tom2) * envelope * ganho, -1, 1)
+
+
+def gerar_powerup_velocidade(taxa, _rng, duracao=0.2, freq=800.0, freq_tremolo=15.0):
+    """Power-up de velocidade: tom com tremolo"""
+    t = _tempo(taxa, duracao)
+    som = 0.4 * np.sin(2 * np.pi * freq * t) * (1 + 0.5 * np.sin(2 * np.pi * freq_tremolo * t))
+    return np.clip(som, -1, 1)
+
+
+def gerar_powerup_vida(taxa, _rng, duracao=0.25, freq1=600.0, freq2=900.0):
+    """Power-up de vida: dois tons somados"""
+    t = _tempo(taxa, duracao)
+    som = 0.3 * (np.sin(2 * np.pi * freq1 * t) + np.sin(2 * np.pi * freq2 * t))
+    return np.clip(som, -1, 1)
+
+
+def gerar_super(taxa, rng, duracao=0.12, freq_grave=150.0, decaimento=20.0, ganho=0.8):
+    """Super: mais encorpado que o tiro normal (ruído e tom grave)"""
+    t = _tempo(taxa, duracao)
+    ruido = rng.normal(0, 0.4, len(t))
+    tom_grave = np.sin(2 * np.pi * freq_grave * t) * 0.6
+    envelope = np.exp(-t * decaimento)
+    return np.clip((ruido + tom_grave) * envelope * ganho, -1, 1)
+
+
+def gerar_ui_tom(taxa, _rng, duracao=0.1, freq=800.0, amplitude=0.3, fade=0.05):
+    """Seleção na interface: tom simples com fade out"""
+    t = _tempo(taxa, duracao)
+    som = _fade_final(amplitude * np.sin(2 * np.pi * freq * t), taxa, fade)
+    return np.clip(som, -1, 1)
+
+
+def gerar_ui_clique(taxa, _rng, duracao=0.08, freq=1200.0, amplitude=0.4, decaimento=20.0):
+    """Clique na interface: tom percussivo"""
+    t = _tempo(taxa, duracao)
+    som = amplitude * np.sin(2 * np.pi * freq * t) * np.exp(-t * decaimento)
+    return np.clip(som, -1, 1)
+
+
+def gerar_ui_confirmacao(taxa, _rng, duracao=0.15, freq1=600.0, freq2=800.0, amplitude=0.3, fade=0.1):
+    """Confirmação na interface: duas frequências com fade out"""
+    t = _tempo(taxa, duracao)
+    som = amplitude * (np.sin(2 * np.pi * freq1 * t) + 0.5 * np.sin(2 * np.pi * freq2 * t))
+    return np.clip(_fade_final(som, taxa, fade), -1, 1)
+
+
+def gerar_ui_voltar(taxa, _rng, duracao=0.12, freq_inicial=600.0, freq_final=400.0, amplitude=0.3, fade=0.05):
+    """Voltar na interface: tom descendente"""
+    t = _tempo(taxa, duracao)
+    freq_t = freq_inicial + (freq_final - freq_inicial) * (t / duracao)
+    som = _fade_final(amplitude * np.sin(2 * np.pi * freq_t * t), taxa, fade)
+    return np.clip(som, -1, 1)
+
+
+def gerar_ambiente_menu(taxa, _rng, duracao=0.5, freq=200.0, amplitude=0.05):
+    """Ambiente do menu: tom muito suave e baixo"""
+    t = _tempo(taxa, duracao)
+    return np.clip(amplitude * np.sin(2 * np.pi * freq * t), -1, 1)
+
+
+def gerar_ambiente_jogo(taxa, rng, duracao=1.0, intensidade=0.02):
+    """Ambiente da partida: vento suave"""
+    t = _tempo(taxa, duracao)
+    ruido_suave = rng.normal(0, intensidade, len(t))
+    filtro = np.sin(2 * np.pi * 0.5 * t) * 0.01
+    return np.clip(ruido_suave + filtro, -1, 1)
+
+
+def mudar_tom(sinal, fator):
+    """
+    Mudar o tom por reamostragem (fator > 1: mais agudo e mais curto).
+    Args:
+        sinal: Array 1D
+        fator: Razão entre a nova e a antiga frequência
+    """
+    if fator == 1.0:
+        return sinal
+    posicoes = np.arange(0.0, len(sinal) - 1, fator)
+    return np.interp(posicoes, np.arange(len(sinal)), sinal)
+
+
+def suavizar(sinal, largura):
+    """Filtro passa-baixa simples (média móvel de largura amostras)"""
+    if largura <= 1:
+        return sinal
+    return np.convolve(sinal, np.full(largura, 1.0 / largura), mode='same')
+
+
+class DefinicaoSom:
+    """
+    Receita de um som procedural.
+    Attributes:
+        nomes (tuple): Nomes em sound_effects que recebem este som
+        gerador (callable): Função gerar_* que produz o sinal mono
+        parametros (dict): Argumentos nomeados do gerador
+        variantes (int): Quantas variantes gerar (1: só o som original)
+        tom (float): Fator de tom aplicado ao sinal gerado (variantes)
+        suavizacao (int): Largura do filtro passa-baixa (1: sem filtro)
+        variante (int): Índice da variante (0 para o som original)
+    """
+
+    __slots__ = ('nomes', 'gerador', 'parametros', 'variantes', 'tom', 'suavizacao', 'variante')
+
+    def __init__(self, nomes, gerador, parametros=None, variantes=1, tom=1.0, suavizacao=1, variante=0):
+        self.nomes = tuple(nomes)
+        self.gerador = gerador
+        self.parametros = dict(parametros or {})
+        self.variantes = variantes
+        self.tom = tom
+        self.suavizacao = suavizacao
+        self.variante = variante
+
+    def gerar_variantes(self):
+        """
+        Expandir a receita nas suas variantes.
+        A variante 0 é o som original; as demais espalham o tom em
+        ±DESVIO_TOM_VARIANTES e alternam a largura do filtro, cada uma com
+        seu próprio ruído (a semente depende da variante).
+        Returns:
+            Lista de DefinicaoSom (uma por variante)
+        """
+        if self.variantes <= 1:
+            return [self]
+        resultado = [self]
+        for indice in range(1, self.variantes):
+            # Tons alternados acima e abaixo do original, cada vez mais afastados
+            passo = (indice + 1) // 2 / max(1, self.variantes // 2)
+            fator = 1.0 + DESVIO_TOM_VARIANTES * passo * (1 if indice % 2 else -1)
+            resultado.append(DefinicaoSom(self.nomes, self.gerador, self.parametros,
+                                          tom=round(fator, 4), suavizacao=1 + indice % 3, variante=indice))
+        return resultado
+
+    @property
+    def semente(self):
+        """Semente do ruído (fixa por gerador e parâmetros: mesmo som em toda execução)"""
+        return zlib.crc32(self.descricao().encode('utf-8'))
+
+    def descricao(self):
+        """Identificação textual estável do gerador, dos parâmetros e da variante"""
+        return json.dumps({'gerador': self.gerador.__name__, 'parametros': self.parametros,
+                           'tom': self.tom, 'suavizacao': self.suavizacao, 'variante': self.variante},
+                          sort_keys=True)
+
+
+# Sons procedurais do jogo (ordem: batalha, interface, ambiente)
+CATALOGO_SONS = (
+    # Cada brawler com seu tiro: escopeta aberta, revólver seco e escopeta pesada
+    DefinicaoSom(('tiro_shelly',), gerar_tiro, {'duracao': 0.1, 'decaimento': 25.0, 'freq_corte': 1500.0},
+                 variantes=VARIANTES_POR_SOM),
+    DefinicaoSom(('tiro_colt',), gerar_tiro, {'duracao': 0.06, 'decaimento': 40.0, 'freq_corte': 2600.0},
+                 variantes=VARIANTES_POR_SOM),
+    DefinicaoSom(('tiro_bull',), gerar_tiro, {'duracao': 0.12, 'decaimento': 18.0, 'freq_corte': 1100.0,
+                                              'ganho': 0.7}, variantes=VARIANTES_POR_SOM),
+    DefinicaoSom(('impacto_inimigo', 'impacto_jogador'), gerar_impacto, variantes=VARIANTES_POR_SOM),
+    DefinicaoSom(('explosao',), gerar_explosao, variantes=VARIANTES_POR_SOM),
+    DefinicaoSom(('powerup_velocidade',), gerar_powerup_velocidade),
+    DefinicaoSom(('powerup_vida',), gerar_powerup_vida),
+    DefinicaoSom(('super_shelly', 'habilidade_shelly'), gerar_super),
+    DefinicaoSom(('ui_select',), gerar_ui_tom),
+    DefinicaoSom(('ui_click',), gerar_ui_clique),
+    DefinicaoSom(('ui_confirm',), gerar_ui_confirmacao),
+    DefinicaoSom(('ui_back',), gerar_ui_voltar),
+    DefinicaoSom(('ambiente_menu',), gerar_ambiente_menu),
+    DefinicaoSom(('ambiente_jogo',), gerar_ambiente_jogo),
+)
+
+
+def chave_som(definicao, taxa, canais):
+    """
+    Calcular a chave de cache de um som.
+    Args:
+        definicao: DefinicaoSom
+        taxa: Taxa de amostragem do mixer (Hz)
+        canais: Canais do mixer (1 ou 2)
+    Returns:
+        Hash hexadecimal do gerador, parâmetros, formato e versão da síntese
+    """
+    conteudo = f"{VERSAO_SINTESE}|{definicao.descricao()}|{taxa}|{canais}|int16"
+    return hashlib.sha1(conteudo.encode('utf-8')).hexdigest()
+
+
+def para_formato_mixer(sinal, canais):
+    """
+    Converter um sinal mono em float [-1, 1] para o buffer do mixer.
+    Args:
+        sinal: Array 1D de floats
+        canais: 1 (array 1D) ou 2 (array N x 2 com os canais iguais)
+    Returns:
+        Array int16 contíguo em C (pygame.sndarray.make_sound exige)
+    """
+    amostras = (sinal * 32767).astype(np.int16)
+    if canais == 1:
+        return np.ascontiguousarray(amostras)
+    return np.ascontiguousarray(np.repeat(amostras[:, np.newaxis], canais, axis=1))
+
+
+def sintetizar(definicao, taxa, canais):
+    """
+    Sintetizar um som do catálogo no formato do mixer.
+    Args:
+        definicao: DefinicaoSom
+        taxa: Taxa de amostragem (Hz)
+        canais: Canais do mixer
+    Returns:
+        Array int16 contíguo em C
+    """
+    rng = np.random.default_rng(definicao.semente)
+    sinal = definicao.gerador(taxa, rng, **definicao.parametros)
+    sinal = suavizar(mudar_tom(sinal, definicao.tom), definicao.suavizacao)
+    return para_formato_mixer(sinal, canais)
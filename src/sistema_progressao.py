@@ -3,10 +3,25 @@ Sistema de Progressão do Brawl Stars Clone.
 Gerencia experiência, níveis, Star Powers e troféus dos Brawlers.
 """
 
+import atexit
 import math
 import json
 import os
 from typing import Dict, List, Optional, Tuple
+from src.config import ARQUIVO_PROGRESSAO
+from src.historico_partidas import HistoricoPartidas
+from src.inicializacao import SingletonPreguicoso
+from src.persistencia import GravadorAssincrono
+
+# Regras de experiência por partida (nível de módulo para permitir ajustes de balanceamento)
+EXPERIENCIA_PARTIDA = {
+    'base_vitoria': 50,
+    'base_derrota': 25,
+    'segundos_por_exp': 10,
+    'dano_por_exp': 50,
+    'por_eliminacao': 10,
+    'por_gema': 5,
+}
 
 class StarPower:
     """Representa um Star Power que pode ser desbloqueado"""
@@ -153,28 +168,69 @@ class BrawlerProgressao:
             'star_power_ativo': self.star_power_ativo.nome if self.star_power_ativo else None
         }
 
+    def serializar(self) -> Dict:
+        """Retrato do Brawler para o save (cópia: pode ir para outra thread)"""
+        return {
+            'experiencia': self.experiencia,
+            'nivel': self.nivel,
+            'trofeus': self.trofeus,
+            'melhor_trofeus': self.melhor_trofeus,
+            'partidas_jogadas': self.partidas_jogadas,
+            'vitorias': self.vitorias,
+            'derrotas': self.derrotas,
+            'star_power_ativo': self.star_power_ativo.nome if self.star_power_ativo else None,
+            'estatisticas': dict(self.estatisticas)
+        }
+
 class SistemaProgressao:
-    """Sistema principal de progressão"""
-    def __init__(self):
+    """
+    Sistema principal de progressão.
+    O save é gravado em segundo plano (src.persistencia): só os Brawlers
+    marcados como alterados são serializados de novo, os demais reaproveitam
+    o último retrato. Cada partida também entra no histórico
+    (src.historico_partidas), que responde o ranking por índice. O save
+    guarda também as conquistas desbloqueadas.
+    """
+    def __init__(self, arquivo_save: str = ARQUIVO_PROGRESSAO):
         self.brawlers: Dict[str, BrawlerProgressao] = {}
-        self.arquivo_save = 'progressao.json'
+        self.arquivo_save = arquivo_save
+        self.retratos: Dict[str, Dict] = {}  # Último retrato serializado de cada Brawler
+        self.alterados = set()
+        self.conquistas_desbloqueadas: List[str] = []
+        self.gravador = GravadorAssincrono(arquivo_save, nome='progressao')
+        self.historico = HistoricoPartidas()
+        atexit.register(self.gravador.finalizar)
+        atexit.register(self.historico.fechar)
         self.carregar_progressao()
 
     def get_brawler(self, nome: str) -> BrawlerProgressao:
         """Obtém ou cria progressão para um Brawler"""
         if nome not in self.brawlers:
             self.brawlers[nome] = BrawlerProgressao(nome)
+            self.alterados.add(nome)
+            self.historico.sincronizar_trofeus(nome, 0, 0)
         return self.brawlers[nome]
 
+    def marcar_alterado(self, nome: str):
+        """Marca um Brawler para ser serializado de novo no próximo save"""
+        self.alterados.add(nome)
+
+    def registrar_conquista(self, nome_conquista: str):
+        """Guarda uma conquista desbloqueada e agenda o save"""
+        if nome_conquista not in self.conquistas_desbloqueadas:
+            self.conquistas_desbloqueadas.append(nome_conquista)
+            self.salvar_progressao()
+
     def calcular_experiencia_partida(self, vitoria: bool, tempo_partida: float,
                                    dano_causado: int, inimigos_eliminados: int,
                                    gemas_coletadas: int) -> int:
         """Calcula experiência ganha em uma partida"""
-        exp_base = 50 if vitoria else 25
-        exp_tempo = int(tempo_partida / 10)  # 1 exp por 10 segundos
-        exp_dano = int(dano_causado / 50)    # 1 exp por 50 de dano
-        exp_kills = inimigos_eliminados * 10  # 10 exp por kill
-        exp_gemas = gemas_coletadas * 5       # 5 exp por gema
+        regras = EXPERIENCIA_PARTIDA
+        exp_base = regras['base_vitoria'] if vitoria else regras['base_derrota']
+        exp_tempo = int(tempo_partida / regras['segundos_por_exp'])  # 1 exp por 10 segundos
+        exp_dano = int(dano_causado / regras['dano_por_exp'])    # 1 exp por 50 de dano
+        exp_kills = inimigos_eliminados * regras['por_eliminacao']  # 10 exp por kill
+        exp_gemas = gemas_coletadas * regras['por_gema']       # 5 exp por gema
         return exp_base + exp_tempo + exp_dano + exp_kills + exp_gemas
 
     def calcular_trofeus_partida(self, vitoria: bool, nivel_brawler: int) -> int:
@@ -210,12 +266,18 @@ class SistemaProgressao:
         # Registrar estatísticas
         brawler.registrar_partida(vitoria, **stats)
 
-        # Salvar progresso
+        # Salvar progresso (em segundo plano: o quadro não espera o disco)
+        self.marcar_alterado(nome_brawler)
         self.salvar_progressao()
 
+        # Histórico (fica no lote em memória até encher ou até a próxima consulta)
+        trofeus_mudanca = trofeus if vitoria else -trofeus
+        self.historico.registrar(nome_brawler, vitoria, tempo_partida, exp_ganha,
+                                 trofeus_mudanca, brawler.trofeus, **stats)
+
         return {
             'exp_ganha': exp_ganha,
-            'trofeus_mudanca': trofeus if vitoria else -trofeus,
+            'trofeus_mudanca': trofeus_mudanca,
             'subiu_nivel': subiu_nivel,
             'novo_nivel': brawler.nivel,
             'novos_trofeus': brawler.trofeus
@@ -226,32 +288,36 @@ class SistemaProgressao:
         brawler = self.get_brawler(nome_brawler)
         return [sp for sp in brawler.star_powers if brawler.pode_usar_star_power(sp)]
 
-    def get_ranking_brawlers(self) -> List[Tuple[str, int]]:
-        """Retorna ranking dos Brawlers por troféus"""
-        ranking = [(nome, brawler.trofeus) for nome, brawler in self.brawlers.items()]
-        return sorted(ranking, key=lambda x: x[1], reverse=True)
+    def get_ranking_brawlers(self, limite: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Retorna ranking dos Brawlers por troféus (já ordenado pelo índice do histórico)"""
+        ranking = self.historico.ranking(limite)
+        if ranking is None:
+            # Histórico indisponível: ordenar os Brawlers em memória
+            ranking = sorted(((nome, brawler.trofeus) for nome, brawler in self.brawlers.items()),
+                             key=lambda x: (-x[1], x[0]))[:limite]
+        return ranking
+
+    def get_posicao_ranking(self, nome_brawler: str) -> Optional[int]:
+        """Retorna a posição (1 = mais troféus) de um Brawler no ranking"""
+        posicao = self.historico.posicao_ranking(nome_brawler)
+        if posicao is None and self.historico.indisponivel():
+            for indice, (nome, _trofeus) in enumerate(self.get_ranking_brawlers(), 1):
+                if nome == nome_brawler:
+                    return indice
+        return posicao
 
     def salvar_progressao(self):
-        """Salva progressão em arquivo JSON"""
-        try:
-            dados = {}
-            for nome, brawler in self.brawlers.items():
-                dados[nome] = {
-                    'experiencia': brawler.experiencia,
-                    'nivel': brawler.nivel,
-                    'trofeus': brawler.trofeus,
-                    'melhor_trofeus': brawler.melhor_trofeus,
-                    'partidas_jogadas': brawler.partidas_jogadas,
-                    'vitorias': brawler.vitorias,
-                    'derrotas': brawler.derrotas,
-                    'star_power_ativo': brawler.star_power_ativo.nome if brawler.star_power_ativo else None,
-                    'estatisticas': brawler.estatisticas
-                }
-
-            with open(self.arquivo_save, 'w', encoding='utf-8') as f:
-                json.dump(dados, f, indent=2, ensure_ascii=False)
-        except (OSError, IOError, json.JSONDecodeError) as e:
-            print(f"Erro ao salvar progressão: {e}")
+        """Agenda a gravação do save com os Brawlers alterados serializados de novo"""
+        for nome in self.alterados:
+            if nome in self.brawlers:
+                self.retratos[nome] = self.brawlers[nome].serializar()
+        self.alterados.clear()
+        self.gravador.agendar({'brawlers': dict(self.retratos),
+                               'conquistas': list(self.conquistas_desbloqueadas)})
+
+    def descarregar_progressao(self, timeout: Optional[float] = None) -> bool:
+        """Espera a gravação pendente chegar ao disco"""
+        return self.gravador.descarregar(timeout)
 
     def carregar_progressao(self):
         """Carrega progressão do arquivo JSON"""
@@ -259,6 +325,10 @@ class SistemaProgressao:
             if os.path.exists(self.arquivo_save):
                 with open(self.arquivo_save, 'r', encoding='utf-8') as f:
                     dados = json.load(f)
+                # Saves antigos eram só o dicionário de Brawlers
+                if 'brawlers' in dados:
+                    self.conquistas_desbloqueadas = list(dados.get('conquistas', []))
+                    dados = dados['brawlers']
                 for nome, info in dados.items():
                     brawler = BrawlerProgressao(nome)
                     brawler.experiencia = info.get('experiencia', 0)
@@ -279,14 +349,21 @@ class SistemaProgressao:
                                 break
 
                     self.brawlers[nome] = brawler
+                    self.retratos[nome] = brawler.serializar()
+                    self.historico.sincronizar_trofeus(nome, brawler.trofeus, brawler.melhor_trofeus)
         except (OSError, IOError, json.JSONDecodeError) as e:
             print(f"Erro ao carregar progressão: {e}")
 
     def resetar_progressao(self):
         """Reseta toda a progressão"""
+        self.gravador.cancelar()
         self.brawlers.clear()
+        self.retratos.clear()
+        self.alterados.clear()
+        self.conquistas_desbloqueadas.clear()
+        self.historico.limpar()
         if os.path.exists(self.arquivo_save):
             os.remove(self.arquivo_save)
 
-# Instância global do sistema
-sistema_progressao = SistemaProgressao()
+# Instância global do sistema (o save é lido no primeiro uso)
+sistema_progressao = SingletonPreguicoso('sistema_progressao', SistemaProgressao)
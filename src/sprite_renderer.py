@@ -7,9 +7,9 @@ para personagens, inimigos e elementos do jogo com alta qualidade visual.
 """
 
 import math
-import random
 import pygame
 from src.pygame_constants import SRCALPHA
+from src.aleatoriedade import aleatorio_visual
 
 class SpriteRenderer:
     """Sistema de renderização de sprites avançado com gráficos detalhados"""
@@ -426,7 +426,7 @@ class SpriteRenderer:
 
             # Faíscas
             for i in range(3):
-                angulo = random.randint(0, 360)
+                angulo = aleatorio_visual.randint(0, 360)
                 fx = centro + 8 * math.cos(math.radians(angulo))
                 fy = centro + 8 * math.sin(math.radians(angulo))
                 pygame.draw.circle(sprite, (255, 200, 0), (int(fx), int(fy)), 1)
@@ -23,6 +23,46 @@ def rotacionar_vetor(x, y, angulo_graus):
 
     return novo_x, novo_y
 
+# Taxas de carga do Super por Brawler (nível de módulo para permitir ajustes de balanceamento)
+TAXAS_CARGA_BRAWLERS = {
+    'Shelly': {
+        'carga_por_dano': 18,      # Por hit causado
+        'carga_por_hit': 12,       # Por hit recebido
+        'duracao_super': 0.0,      # Super instantânea
+        'cor_super': (255, 215, 0)  # Dourado
+    },
+    'Nita': {
+        'carga_por_dano': 15,
+        'carga_por_hit': 10,
+        'duracao_super': 15.0,     # Urso dura 15s
+        'cor_super': (139, 69, 19)  # Marrom
+    },
+    'Colt': {
+        'carga_por_dano': 12,
+        'carga_por_hit': 8,
+        'duracao_super': 0.0,      # Super instantânea
+        'cor_super': (0, 191, 255)  # Ciano
+    },
+    'Bull': {
+        'carga_por_dano': 20,
+        'carga_por_hit': 15,
+        'duracao_super': 0.5,      # Dash rápido
+        'cor_super': (255, 69, 0)   # Vermelho
+    },
+    'Barley': {
+        'carga_por_dano': 14,
+        'carga_por_hit': 9,
+        'duracao_super': 3.0,      # Área persiste 3s
+        'cor_super': (50, 205, 50)  # Verde
+    },
+    'Poco': {
+        'carga_por_dano': 16,
+        'carga_por_hit': 11,
+        'duracao_super': 0.0,      # Cura instantânea
+        'cor_super': (255, 20, 147) # Rosa
+    }
+}
+
 class SuperSystem:
     """Gerenciador do sistema de Super autêntico"""
     def __init__(self, personagem):
@@ -43,47 +83,8 @@ class SuperSystem:
 
     def _configurar_taxas_carga(self):
         """Configura taxas de carga específicas por Brawler"""
-        config_brawlers = {
-            'Shelly': {
-                'carga_por_dano': 18,      # Por hit causado
-                'carga_por_hit': 12,       # Por hit recebido
-                'duracao_super': 0.0,      # Super instantânea
-                'cor_super': (255, 215, 0)  # Dourado
-            },
-            'Nita': {
-                'carga_por_dano': 15,
-                'carga_por_hit': 10,
-                'duracao_super': 15.0,     # Urso dura 15s
-                'cor_super': (139, 69, 19)  # Marrom
-            },
-            'Colt': {
-                'carga_por_dano': 12,
-                'carga_por_hit': 8,
-                'duracao_super': 0.0,      # Super instantânea
-                'cor_super': (0, 191, 255)  # Ciano
-            },
-            'Bull': {
-                'carga_por_dano': 20,
-                'carga_por_hit': 15,
-                'duracao_super': 0.5,      # Dash rápido
-                'cor_super': (255, 69, 0)   # Vermelho
-            },
-            'Barley': {
-                'carga_por_dano': 14,
-                'carga_por_hit': 9,
-                'duracao_super': 3.0,      # Área persiste 3s
-                'cor_super': (50, 205, 50)  # Verde
-            },
-            'Poco': {
-                'carga_por_dano': 16,
-                'carga_por_hit': 11,
-                'duracao_super': 0.0,      # Cura instantânea
-                'cor_super': (255, 20, 147) # Rosa
-            }
-        }
-
         nome = self.personagem.nome
-        config = config_brawlers.get(nome, config_brawlers['Shelly'])
+        config = TAXAS_CARGA_BRAWLERS.get(nome, TAXAS_CARGA_BRAWLERS['Shelly'])
         self.carga_por_dano = config['carga_por_dano']
         self.carga_por_hit = config['carga_por_hit']
         self.duracao_super = config['duracao_super']
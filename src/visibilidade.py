@@ -0,0 +1,147 @@
+"""
+Serviço de linha de visão (LOS) do Brawl Stars Clone.
+Este módulo responde "A consegue ver B?" por raycasting DDA sobre a grade de
+obstáculos. Os resultados são guardados em cache por par (célula do observador,
+célula do alvo) durante o quadro, e a API em lote permite que todos os inimigos
+sejam respondidos em uma única chamada antes da atualização da IA.
+"""
+
+from src.grade_obstaculos import GradeObstaculos
+
+
+class ServicoVisibilidade:
+    """
+    Consultas de linha de visão com cache por quadro.
+    Attributes:
+        grade (GradeObstaculos): Grade de obstáculos usada nos raycasts
+        consultas (int): Consultas atendidas no quadro atual
+        acertos_cache (int): Consultas respondidas pelo cache no quadro atual
+    """
+
+    def __init__(self, grade: GradeObstaculos):
+        self.grade = grade
+        self.cache = {}
+        self.versao_cache = grade.versao
+        self.consultas = 0
+        self.acertos_cache = 0
+        self.raycasts = 0
+
+    def iniciar_quadro(self):
+        """Descartar o cache do quadro anterior e zerar as estatísticas"""
+        self.cache.clear()
+        self.versao_cache = self.grade.versao
+        self.consultas = 0
+        self.acertos_cache = 0
+        self.raycasts = 0
+
+    def tem_linha_de_visao(self, x0, y0, x1, y1):
+        """
+        Verificar se não há obstáculo entre dois pontos.
+        Args:
+            x0: Posição X do observador
+            y0: Posição Y do observador
+            x1: Posição X do alvo
+            y1: Posição Y do alvo
+        Returns:
+            True se o segmento não cruza nenhuma célula bloqueada
+        """
+        # Obstáculo destruído no meio do quadro invalida o cache
+        if self.versao_cache != self.grade.versao:
+            self.cache.clear()
+            self.versao_cache = self.grade.versao
+
+        self.consultas += 1
+        origem = self.grade.indice_da_posicao(x0, y0)
+        destino = self.grade.indice_da_posicao(x1, y1)
+        chave = origem * self.grade.total_celulas + destino
+
+        resultado = self.cache.get(chave)
+        if resultado is not None:
+            self.acertos_cache += 1
+            return resultado
+
+        resultado = self._raycast(x0, y0, x1, y1)
+        self.cache[chave] = resultado
+        return resultado
+
+    def entidade_visivel(self, observador, alvo):
+        """Verificar linha de visão entre os centros de duas entidades"""
+        return self.tem_linha_de_visao(
+            observador.rect.centerx, observador.rect.centery,
+            alvo.rect.centerx, alvo.rect.centery
+        )
+
+    def linha_de_visao_lote(self, observadores, alvo):
+        """
+        Responder a linha de visão de vários observadores para um mesmo alvo.
+        Os resultados ficam no cache do quadro, então chamadas individuais
+        posteriores (ex.: na IA de cada inimigo) não refazem o raycast.
+        Args:
+            observadores: Iterável de entidades com rect
+            alvo: Entidade observada
+        Returns:
+            Lista de bool na mesma ordem dos observadores
+        """
+        alvo_x = alvo.rect.centerx
+        alvo_y = alvo.rect.centery
+        consultar = self.tem_linha_de_visao
+        return [consultar(obs.rect.centerx, obs.rect.centery, alvo_x, alvo_y)
+                for obs in observadores]
+
+    def _raycast(self, x0, y0, x1, y1):
+        """Percorrer as células do segmento (Amanatides & Woo) procurando bloqueios"""
+        self.raycasts += 1
+        grade = self.grade
+        tamanho = grade.tamanho_celula
+        celulas = grade.celulas
+        colunas = grade.colunas
+
+        # Pontos fora do mapa (ex.: jogador morto) são trazidos para a borda
+        limite_x = grade.largura - 0.001
+        limite_y = grade.altura - 0.001
+        x0 = min(limite_x, max(0.0, x0))
+        y0 = min(limite_y, max(0.0, y0))
+        x1 = min(limite_x, max(0.0, x1))
+        y1 = min(limite_y, max(0.0, y1))
+
+        coluna, linha = grade.celula_da_posicao(x0, y0)
+        coluna_fim, linha_fim = grade.celula_da_posicao(x1, y1)
+        passos = abs(coluna_fim - coluna) + abs(linha_fim - linha)
+
+        dx = x1 - x0
+        dy = y1 - y0
+        if dx > 0:
+            passo_x = 1
+            t_delta_x = tamanho / dx
+            t_max_x = ((coluna + 1) * tamanho - x0) / dx
+        elif dx < 0:
+            passo_x = -1
+            t_delta_x = -tamanho / dx
+            t_max_x = (coluna * tamanho - x0) / dx
+        else:
+            passo_x = 0
+            t_delta_x = t_max_x = float('inf')
+
+        if dy > 0:
+            passo_y = 1
+            t_delta_y = tamanho / dy
+            t_max_y = ((linha + 1) * tamanho - y0) / dy
+        elif dy < 0:
+            passo_y = -1
+            t_delta_y = -tamanho / dy
+            t_max_y = (linha * tamanho - y0) / dy
+        else:
+            passo_y = 0
+            t_delta_y = t_max_y = float('inf')
+
+        # As células de origem e destino não bloqueiam (a entidade pode estar encostada)
+        for _ in range(passos - 1):
+            if t_max_x < t_max_y:
+                coluna += passo_x
+                t_max_x += t_delta_x
+            else:
+                linha += passo_y
+                t_max_y += t_delta_y
+            if celulas[linha * colunas + coluna]:
+                return False
+        return True